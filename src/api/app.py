@@ -5,6 +5,7 @@ Author: Peyman Khodabandehlouei
 Date: 04-01-2026
 """
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 
@@ -25,6 +26,8 @@ from api.routes import (
     rental_router,
 )
 
+from schemas.db_models import warm_document_models
+
 from core import (
     SystemClock,
     db_manager,
@@ -52,6 +55,9 @@ async def lifespan(app: FastAPI):
     logger.info("Starting CRFMS API...")
 
     try:
+        # Build deferred document validators while connections are set up
+        warm_up = asyncio.create_task(asyncio.to_thread(warm_document_models))
+
         # Connect to MongoDB
         await db_manager.connect()
         logger.info("Database connection established")
@@ -67,6 +73,9 @@ async def lifespan(app: FastAPI):
         app.state.clock = SystemClock()
         logger.info("Clock service initialized")
 
+        await warm_up
+        logger.info("Document models built")
+
         logger.info("CRFMS API started successfully")
 
     except Exception as e:
@@ -8,11 +8,20 @@ Date: 06-01-2026
 """
 
 import logging
+
+import orjson
 from fastapi import APIRouter, status, HTTPException
+from fastapi.responses import Response
+from pydantic_core import to_json
 
 from services import payment_service
-from schemas.api import SuccessResponseWithPayload, ErrorResponse
+from schemas.api import (
+    SuccessResponseWithPayload,
+    ErrorResponse,
+    encode_success_payload,
+)
 from schemas.api.requests import ProcessPaymentRequest
+from schemas.api.responses.payments import PAYMENT_MESSAGE_BYTES
 
 logger = logging.getLogger(__name__)
 
@@ -41,7 +50,7 @@ router = APIRouter(prefix="/api/v1/payments", tags=["Payments"])
 )
 async def process_payment(
     request: ProcessPaymentRequest,
-) -> SuccessResponseWithPayload:
+) -> Response:
     """
     Process payment for a reservation.
 
@@ -56,11 +65,14 @@ async def process_payment(
         # Call service layer
         payment_data = await payment_service.process_payment(request)
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=f"Payment {payment_data.status}",
-            data=payment_data.model_dump(),
+        # Return wrapped response, splicing the pre-serialized message
+        message_json = PAYMENT_MESSAGE_BYTES.get(payment_data.status) or orjson.dumps(
+            f"Payment {payment_data.status}"
+        )
+        return Response(
+            content=encode_success_payload(message_json, to_json(payment_data)),
+            status_code=status.HTTP_200_OK,
+            media_type="application/json",
         )
 
     except ValueError as e:
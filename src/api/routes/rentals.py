@@ -9,10 +9,21 @@ Date: 13-01-2026
 
 import logging
 from typing import Annotated
+import orjson
 from fastapi import APIRouter, status, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
 
 from services import rental_service
-from schemas.api import SuccessResponseWithPayload, ErrorResponse
+from schemas.api import (
+    SuccessResponseWithPayload,
+    ErrorResponse,
+    encode_success_payload,
+)
+from schemas.api.responses.rentals import (
+    PICKUP_MESSAGE_BYTES,
+    RETURN_MESSAGE_PREFIX_BYTES,
+)
 from schemas.api.requests.rentals import (
     PickupVehicleRequest,
     ReturnVehicleRequest,
@@ -47,7 +58,7 @@ router = APIRouter(prefix="/api/v1/rentals", tags=["Rentals"])
         },
     },
 )
-async def pickup_vehicle(request: PickupVehicleRequest) -> SuccessResponseWithPayload:
+async def pickup_vehicle(request: PickupVehicleRequest) -> Response:
     """
     Process vehicle pickup operation (creates rental from reservation).
 
@@ -70,11 +81,14 @@ async def pickup_vehicle(request: PickupVehicleRequest) -> SuccessResponseWithPa
         # Call service layer
         pickup_data = await rental_service.pickup_vehicle(request)
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=pickup_data.message,
-            data=pickup_data.rental.model_dump(),
+        # Return wrapped response, splicing the pre-serialized message
+        message_json = PICKUP_MESSAGE_BYTES.get(pickup_data.message) or orjson.dumps(
+            pickup_data.message
+        )
+        return Response(
+            content=encode_success_payload(message_json, to_json(pickup_data.rental)),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
         )
 
     except ValueError as e:
@@ -137,9 +151,7 @@ async def pickup_vehicle(request: PickupVehicleRequest) -> SuccessResponseWithPa
         },
     },
 )
-async def return_vehicle(
-    rental_id: str, request: ReturnVehicleRequest
-) -> SuccessResponseWithPayload:
+async def return_vehicle(rental_id: str, request: ReturnVehicleRequest) -> Response:
     """
     Process vehicle return operation with automatic charge calculation.
 
@@ -155,11 +167,16 @@ async def return_vehicle(
         # Call service layer
         return_data = await rental_service.return_vehicle(rental_id, request)
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=return_data.message,
-            data=return_data.rental.model_dump(),
+        # Return wrapped response, splicing the pre-serialized message prefix
+        message_json = (
+            RETURN_MESSAGE_PREFIX_BYTES
+            + f"{return_data.rental.charges.total:.2f}".encode()
+            + b'"'
+        )
+        return Response(
+            content=encode_success_payload(message_json, to_json(return_data.rental)),
+            status_code=status.HTTP_200_OK,
+            media_type="application/json",
         )
 
     except ValueError as e:
@@ -326,6 +343,122 @@ async def extend_rental(
         )
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream rentals as NDJSON",
+    responses={
+        200: {
+            "description": "Rentals streamed one JSON object per line",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def stream_rentals(
+    customer_id: Annotated[
+        str | None, Query(description="Filter by customer ID")
+    ] = None,
+    vehicle_id: Annotated[str | None, Query(description="Filter by vehicle ID")] = None,
+    agent_id: Annotated[str | None, Query(description="Filter by agent ID")] = None,
+    rental_status: Annotated[
+        str | None,
+        Query(alias="status", description="Filter by status (active/completed)"),
+    ] = None,
+    reservation_id: Annotated[
+        str | None, Query(description="Filter by reservation ID")
+    ] = None,
+) -> StreamingResponse:
+    """
+    Stream rentals as newline-delimited JSON.
+
+    Accepts the same filters as GET /api/v1/rentals but writes each rental
+    as soon as it is read from the database, instead of building the whole
+    list in memory first. Suited for exports and large result sets.
+    """
+    filters = RentalFilterRequest(
+        customer_id=customer_id,
+        vehicle_id=vehicle_id,
+        agent_id=agent_id,
+        status=rental_status,
+        reservation_id=reservation_id,
+    )
+
+    return StreamingResponse(
+        rental_service.stream_rentals(filters),
+        media_type="application/x-ndjson",
+    )
+
+
+@router.get(
+    "/charges/summary",
+    response_model=SuccessResponseWithPayload,
+    status_code=status.HTTP_200_OK,
+    summary="Sum charges across rentals",
+    responses={
+        200: {
+            "description": "Charges summed successfully",
+            "model": SuccessResponseWithPayload,
+        },
+    },
+)
+async def get_charges_summary(
+    customer_id: Annotated[
+        str | None, Query(description="Filter by customer ID")
+    ] = None,
+    vehicle_id: Annotated[str | None, Query(description="Filter by vehicle ID")] = None,
+    agent_id: Annotated[str | None, Query(description="Filter by agent ID")] = None,
+    rental_status: Annotated[
+        str | None,
+        Query(alias="status", description="Filter by status (active/completed)"),
+    ] = None,
+    reservation_id: Annotated[
+        str | None, Query(description="Filter by reservation ID")
+    ] = None,
+) -> SuccessResponseWithPayload:
+    """
+    Sum charges across rentals.
+
+    Accepts the same filters as GET /api/v1/rentals. The total is
+    aggregated in the database; only returned (charged) rentals count.
+    """
+    try:
+        filters = RentalFilterRequest(
+            customer_id=customer_id,
+            vehicle_id=vehicle_id,
+            agent_id=agent_id,
+            status=rental_status,
+            reservation_id=reservation_id,
+        )
+
+        # Call service layer
+        summary = await rental_service.get_charges_summary(filters)
+
+        # Return wrapped response
+        return SuccessResponseWithPayload(
+            success=True,
+            message=f"Summed charges for {summary.charged_rentals} rentals",
+            data=summary.model_dump(),
+        )
+
+    except Exception as e:
+        logger.error(f"Unexpected error during charges summary: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail={
+                "success": False,
+                "error": "Internal Server Error",
+                "details": [
+                    {
+                        "field": None,
+                        "message": "An unexpected error occurred while summing charges",
+                        "error_code": "INTERNAL_ERROR",
+                    }
+                ],
+            },
+        )
+
+
 @router.get(
     "/{rental_id}",
     response_model=SuccessResponseWithPayload,
@@ -428,11 +561,16 @@ async def list_rentals(
     reservation_id: Annotated[
         str | None, Query(description="Filter by reservation ID")
     ] = None,
-) -> SuccessResponseWithPayload:
+    skip: Annotated[int, Query(ge=0, description="Number of rentals to skip")] = 0,
+    limit: Annotated[
+        int | None, Query(ge=1, description="Maximum number of rentals to return")
+    ] = None,
+) -> Response:
     """
     List rentals with optional filters.
 
-    All query parameters are optional. If no filters provided, returns all rentals.
+    All query parameters are optional. If no filters provided, returns all
+    rentals; use skip and limit to page through large result sets.
     """
     try:
         # Build filter request
@@ -442,16 +580,20 @@ async def list_rentals(
             agent_id=agent_id,
             status=status,
             reservation_id=reservation_id,
+            skip=skip,
+            limit=limit,
         )
 
         # Call service layer
         rental_list = await rental_service.list_rentals(filters)
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=f"Retrieved {rental_list.total_count} rentals",
-            data=rental_list.model_dump(),
+        # Return wrapped response, encoded once by pydantic-core
+        return Response(
+            content=encode_success_payload(
+                orjson.dumps(f"Retrieved {rental_list.total_count} rentals"),
+                to_json(rental_list),
+            ),
+            media_type="application/json",
         )
 
     except Exception as e:
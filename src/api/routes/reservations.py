@@ -9,15 +9,22 @@ Date: 06-01-2026
 
 import logging
 from typing import Annotated
+import orjson
 from fastapi import APIRouter, status, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 
 from services import reservation_service
-from schemas.api import SuccessResponseWithPayload, ErrorResponse
+from schemas.api import (
+    SuccessResponseWithPayload,
+    ErrorResponse,
+    encode_success_payload,
+)
 from schemas.api.requests import (
     CreateReservationRequest,
     UpdateReservationRequest,
     ReservationFilterRequest,
 )
+from schemas.api.responses.reservations import RESERVATION_RETRIEVED_MESSAGE_BYTES
 from schemas.domain import ReservationStatus
 
 # Logger
@@ -146,7 +153,11 @@ async def list_reservations(
     pickup_date_to: Annotated[
         str | None, Query(description="Filter pickups to date (YYYY-MM-DD)")
     ] = None,
-) -> SuccessResponseWithPayload:
+    skip: Annotated[int, Query(ge=0, description="Number of reservations to skip")] = 0,
+    limit: Annotated[
+        int | None, Query(ge=1, description="Maximum number of reservations to return")
+    ] = None,
+) -> Response:
     """
     List all reservations with optional filters.
 
@@ -156,6 +167,7 @@ async def list_reservations(
     - `status`: Filter by reservation status (pending/approved/cancelled/completed)
     - `pickup_date_from`: Get reservations with pickup date >= this date
     - `pickup_date_to`: Get reservations with pickup date <= this date
+    - `skip` / `limit`: Page through the results (total count covers all matches)
 
     **Use Cases:**
     - Customer view: "My bookings" (filter by customer_id)
@@ -182,16 +194,21 @@ async def list_reservations(
             pickup_date_to=(
                 date_class.fromisoformat(pickup_date_to) if pickup_date_to else None
             ),
+            skip=skip,
+            limit=limit,
         )
 
-        # Call service layer
-        reservation_list = await reservation_service.list_reservations(filters)
+        # Call service layer (memoized, pre-encoded payload)
+        total_count, data_json = await reservation_service.list_reservations_json(
+            filters
+        )
 
         # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=f"Retrieved {reservation_list.total_count} reservations",
-            data=reservation_list.model_dump(),
+        return Response(
+            content=encode_success_payload(
+                orjson.dumps(f"Retrieved {total_count} reservations"), data_json
+            ),
+            media_type="application/json",
         )
 
     except ValueError as e:
@@ -230,6 +247,83 @@ async def list_reservations(
         )
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream reservations as NDJSON",
+    responses={
+        200: {
+            "description": "Reservations streamed one JSON object per line",
+            "content": {"application/x-ndjson": {}},
+        },
+        400: {
+            "description": "Invalid date format",
+            "model": ErrorResponse,
+        },
+    },
+)
+async def stream_reservations(
+    customer_id: Annotated[
+        str | None, Query(description="Filter by customer ID")
+    ] = None,
+    vehicle_id: Annotated[str | None, Query(description="Filter by vehicle ID")] = None,
+    status_filter: Annotated[
+        ReservationStatus | None,
+        Query(alias="status", description="Filter by reservation status"),
+    ] = None,
+    pickup_date_from: Annotated[
+        str | None, Query(description="Filter pickups from date (YYYY-MM-DD)")
+    ] = None,
+    pickup_date_to: Annotated[
+        str | None, Query(description="Filter pickups to date (YYYY-MM-DD)")
+    ] = None,
+) -> StreamingResponse:
+    """
+    Stream reservations as newline-delimited JSON.
+
+    Accepts the same filters as GET /api/v1/reservations but writes each
+    reservation as soon as it is read from the database, instead of building
+    the whole list in memory first. Suited for exports and reporting.
+    """
+    from datetime import date as date_class
+
+    try:
+        filters = ReservationFilterRequest(
+            customer_id=customer_id,
+            vehicle_id=vehicle_id,
+            status=status_filter,
+            pickup_date_from=(
+                date_class.fromisoformat(pickup_date_from) if pickup_date_from else None
+            ),
+            pickup_date_to=(
+                date_class.fromisoformat(pickup_date_to) if pickup_date_to else None
+            ),
+        )
+
+    except ValueError as e:
+        logger.warning(f"Invalid date format in filters: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail={
+                "success": False,
+                "error": "Invalid Date Format",
+                "details": [
+                    {
+                        "field": "pickup_date_from or pickup_date_to",
+                        "message": "Date must be in YYYY-MM-DD format",
+                        "error_code": "INVALID_DATE_FORMAT",
+                    }
+                ],
+            },
+        )
+
+    return StreamingResponse(
+        reservation_service.stream_reservations(filters),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/{reservation_id}",
     response_model=SuccessResponseWithPayload,
@@ -246,7 +340,7 @@ async def list_reservations(
         },
     },
 )
-async def get_reservation(reservation_id: str) -> SuccessResponseWithPayload:
+async def get_reservation(reservation_id: str) -> Response:
     """
     Get detailed information about a specific reservation.
 
@@ -263,12 +357,10 @@ async def get_reservation(reservation_id: str) -> SuccessResponseWithPayload:
     - Verify pricing breakdown
     """
     try:
-        # Call service layer
-        reservation_data = await reservation_service.get_reservation_by_id(
-            reservation_id
-        )
+        # Call service layer (add-ons spliced in pre-encoded)
+        data_json = await reservation_service.get_reservation_json(reservation_id)
 
-        if not reservation_data:
+        if data_json is None:
             logger.info(f"Reservation not found: {reservation_id}")
             raise HTTPException(
                 status_code=status.HTTP_404_NOT_FOUND,
@@ -286,10 +378,11 @@ async def get_reservation(reservation_id: str) -> SuccessResponseWithPayload:
             )
 
         # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message="Reservation retrieved successfully",
-            data=reservation_data.model_dump(),
+        return Response(
+            content=encode_success_payload(
+                RESERVATION_RETRIEVED_MESSAGE_BYTES, data_json
+            ),
+            media_type="application/json",
         )
 
     except HTTPException:
@@ -9,18 +9,26 @@ Date: 05-01-2026
 
 import logging
 from typing import Optional
+import orjson
 from fastapi import APIRouter, status, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from pydantic_core import to_json
 from pymongo.errors import DuplicateKeyError
 
 from services import vehicle_service
 from schemas.domain import VehicleStatus
-from schemas.api.common import SuccessResponseWithPayload, ErrorResponse
+from schemas.api.common import (
+    SuccessResponseWithPayload,
+    ErrorResponse,
+    encode_success_payload,
+)
 from schemas.api.requests import (
     CreateVehicleRequest,
     UpdateVehicleRequest,
     VehicleFilterRequest,
     VehicleClassType,
 )
+from schemas.api.responses.vehicles import VEHICLE_MESSAGE_BYTES
 
 
 # Logger
@@ -50,7 +58,7 @@ router = APIRouter(prefix="/api/v1/vehicles", tags=["Vehicles"])
         },
     },
 )
-async def create_vehicle(request: CreateVehicleRequest) -> SuccessResponseWithPayload:
+async def create_vehicle(request: CreateVehicleRequest) -> Response:
     """
     Create a new vehicle in the system.
 
@@ -64,11 +72,13 @@ async def create_vehicle(request: CreateVehicleRequest) -> SuccessResponseWithPa
         # Call service layer
         vehicle_data = await vehicle_service.create_vehicle(request)
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message="Vehicle created successfully",
-            data=vehicle_data.model_dump(),
+        # Return wrapped response, serialized once straight from the model
+        return Response(
+            content=encode_success_payload(
+                VEHICLE_MESSAGE_BYTES["created"], to_json(vehicle_data)
+            ),
+            status_code=status.HTTP_201_CREATED,
+            media_type="application/json",
         )
 
     except DuplicateKeyError:
@@ -132,7 +142,11 @@ async def list_vehicles(
     branch_id: Optional[str] = Query(None, description="Filter by branch ID"),
     min_price: Optional[float] = Query(None, ge=0, description="Minimum price per day"),
     max_price: Optional[float] = Query(None, ge=0, description="Maximum price per day"),
-) -> SuccessResponseWithPayload:
+    skip: int = Query(0, ge=0, description="Number of vehicles to skip"),
+    limit: Optional[int] = Query(
+        None, ge=1, description="Maximum number of vehicles to return"
+    ),
+) -> Response:
     """
     List all vehicles with optional filtering.
 
@@ -142,6 +156,9 @@ async def list_vehicles(
         - branch_id: Branch where vehicle is located
         - min_price: Minimum daily rental rate
         - max_price: Maximum daily rental rate
+
+    Use skip / limit to page through the results; total_count always
+    covers every matching vehicle.
     """
     try:
         # Build filter request
@@ -151,16 +168,19 @@ async def list_vehicles(
             branch_id=branch_id,
             min_price=min_price,
             max_price=max_price,
+            skip=skip,
+            limit=limit,
         )
 
-        # Call service layer
-        vehicle_list = await vehicle_service.list_vehicles(filters)
+        # Call service layer (memoized, pre-encoded payload)
+        total_count, data_json = await vehicle_service.list_vehicles_json(filters)
 
         # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message=f"Retrieved {vehicle_list.total_count} vehicles",
-            data=vehicle_list.model_dump(),
+        return Response(
+            content=encode_success_payload(
+                orjson.dumps(f"Retrieved {total_count} vehicles"), data_json
+            ),
+            media_type="application/json",
         )
 
     except Exception as e:
@@ -181,6 +201,50 @@ async def list_vehicles(
         )
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="Stream vehicles as NDJSON",
+    responses={
+        200: {
+            "description": "Vehicles streamed one JSON object per line",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def stream_vehicles(
+    vehicle_class: Optional[VehicleClassType] = Query(
+        None, description="Filter by vehicle class"
+    ),
+    status_filter: Optional[VehicleStatus] = Query(
+        None, alias="status", description="Filter by status"
+    ),
+    branch_id: Optional[str] = Query(None, description="Filter by branch ID"),
+    min_price: Optional[float] = Query(None, ge=0, description="Minimum price per day"),
+    max_price: Optional[float] = Query(None, ge=0, description="Maximum price per day"),
+) -> StreamingResponse:
+    """
+    Stream vehicles as newline-delimited JSON.
+
+    Accepts the same filters as GET /api/v1/vehicles but writes each vehicle
+    as soon as it is read from the database, instead of building the whole
+    list in memory first. Suited for exports and large fleets.
+    """
+    filters = VehicleFilterRequest(
+        vehicle_class=vehicle_class,
+        status=status_filter,
+        branch_id=branch_id,
+        min_price=min_price,
+        max_price=max_price,
+    )
+
+    return StreamingResponse(
+        vehicle_service.stream_vehicles(filters),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.get(
     "/{vehicle_id}",
     response_model=SuccessResponseWithPayload,
@@ -197,7 +261,7 @@ async def list_vehicles(
         },
     },
 )
-async def get_vehicle(vehicle_id: str) -> SuccessResponseWithPayload:
+async def get_vehicle(vehicle_id: str) -> Response:
     """
     Get detailed information about a specific vehicle.
 
@@ -228,11 +292,12 @@ async def get_vehicle(vehicle_id: str) -> SuccessResponseWithPayload:
                 },
             )
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message="Vehicle retrieved successfully",
-            data=vehicle_data.model_dump(),
+        # Return wrapped response, serialized once straight from the model
+        return Response(
+            content=encode_success_payload(
+                VEHICLE_MESSAGE_BYTES["retrieved"], to_json(vehicle_data)
+            ),
+            media_type="application/json",
         )
 
     except HTTPException:
@@ -276,9 +341,7 @@ async def get_vehicle(vehicle_id: str) -> SuccessResponseWithPayload:
         },
     },
 )
-async def update_vehicle(
-    vehicle_id: str, request: UpdateVehicleRequest
-) -> SuccessResponseWithPayload:
+async def update_vehicle(vehicle_id: str, request: UpdateVehicleRequest) -> Response:
     """
     Update vehicle information.
 
@@ -312,11 +375,12 @@ async def update_vehicle(
                 },
             )
 
-        # Return wrapped response
-        return SuccessResponseWithPayload(
-            success=True,
-            message="Vehicle updated successfully",
-            data=vehicle_data.model_dump(),
+        # Return wrapped response, serialized once straight from the model
+        return Response(
+            content=encode_success_payload(
+                VEHICLE_MESSAGE_BYTES["updated"], to_json(vehicle_data)
+            ),
+            media_type="application/json",
         )
 
     except DuplicateKeyError:
@@ -4,18 +4,30 @@ This module provides public API for custom errors in the application
 Author: Peyman Khodabandehlouei
 """
 
+from importlib import import_module
+
 # Import configs
 from core.config import config
 from core.logging_config import setup_logging
 
-# Import database manager
-from core.database_manager import db_manager
+# Import response cache
+from core.response_cache import ResponseCache
+
+# Import ID generation
+from core.id_generator import uuid7
 
-# Import rabbitmq manager
-from core.rabbitmq_manager import rabbitmq_manager
+# Import saga runner
+from core.saga import SagaStep, run_saga
 
 # Import clock service
-from core.clock_service import ClockService, SystemClock, FakeClock
+from core.clock_service import (
+    ClockService,
+    SystemClock,
+    FakeClock,
+    to_iso_string,
+    to_datetime,
+    to_date,
+)
 
 # Import custom errors
 from core.exceptions import (
@@ -28,8 +40,30 @@ from core.exceptions import (
     ApplicationStartUpError,
     ApplicationShutdownError,
     DuplicateEmailError,
+    InvalidEmployeeIdError,
 )
 
+# The database and RabbitMQ managers are imported on first access: they pull
+# in Motor and aio-pika, which domain code and tests that only need the
+# clock or the exceptions should not pay for
+_LAZY_EXPORTS = {
+    # Database
+    "db_manager": "core.database_manager",
+    # RabbitMQ
+    "rabbitmq_manager": "core.rabbitmq_manager",
+}
+
+
+def __getattr__(name: str):
+    """Import a lazily exported name on first access"""
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+
 # Public API
 __all__ = [
     # Configs
@@ -39,12 +73,23 @@ __all__ = [
     "db_manager",
     # RabbitMQ
     "rabbitmq_manager",
+    # Cache
+    "ResponseCache",
+    # IDs
+    "uuid7",
+    # Saga
+    "SagaStep",
+    "run_saga",
     # Clock
     "FakeClock",
     "SystemClock",
     "ClockService",
+    "to_iso_string",
+    "to_datetime",
+    "to_date",
     # Exceptions
     "DuplicateEmailError",
+    "InvalidEmployeeIdError",
     "ApplicationStartUpError",
     "ApplicationShutdownError",
     "ReservationNotFoundError",
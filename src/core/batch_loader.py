@@ -0,0 +1,89 @@
+"""
+This module provides per-tick coalescing of by-ID document lookups.
+
+Lookups requested during the same event loop iteration are sent as one
+find({"_id": {"$in": ids}}) query, and repeated IDs share one result.
+Nothing is cached once the batch completes, so a later lookup always
+reads fresh data.
+
+Author: Peyman Khodabandehlouei
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, Optional, Set
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+logger = logging.getLogger(__name__)
+
+
+class BatchLoader:
+    """Coalesces find-by-ID lookups on one collection into $in queries"""
+
+    def __init__(
+        self,
+        get_collection: Callable[[], AsyncIOMotorCollection],
+        max_batch_size: int = 100,
+    ):
+        """
+        Args:
+            get_collection (Callable[[], AsyncIOMotorCollection]): Returns the
+                collection to query at dispatch time.
+            max_batch_size (int): Dispatch as soon as this many distinct IDs
+                are queued.
+        """
+        self._get_collection = get_collection
+        self._max_batch_size = max_batch_size
+        self._pending: Dict[Any, asyncio.Future] = {}
+        # Strong references so in-flight queries are not garbage collected
+        self._queries: Set[asyncio.Task] = set()
+
+    async def load(self, document_id: Any) -> Optional[Dict[str, Any]]:
+        """
+        Look up one document by _id as part of the current batch.
+
+        The returned document may be shared with other callers that asked
+        for the same ID in the same tick, so treat it as read-only.
+
+        Args:
+            document_id (Any): The document's _id.
+
+        Returns:
+            Optional[Dict[str, Any]]: The document, or None if not found.
+        """
+        future = self._pending.get(document_id)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+            future = self._pending[document_id] = loop.create_future()
+            if len(self._pending) >= self._max_batch_size:
+                self._dispatch()
+
+        # Shield so one cancelled caller does not cancel the shared result
+        return await asyncio.shield(future)
+
+    def _dispatch(self) -> None:
+        """Send the queued IDs as one query"""
+        batch, self._pending = self._pending, {}
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._query(batch))
+            self._queries.add(task)
+            task.add_done_callback(self._queries.discard)
+
+    async def _query(self, batch: Dict[Any, asyncio.Future]) -> None:
+        """Run one $in query and resolve each waiting future"""
+        try:
+            cursor = self._get_collection().find({"_id": {"$in": list(batch)}})
+            documents = {document["_id"]: document async for document in cursor}
+        except Exception as e:
+            logger.error("Batched lookup of %s documents failed: %s", len(batch), e)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for document_id, future in batch.items():
+            if not future.done():
+                future.set_result(documents.get(document_id))
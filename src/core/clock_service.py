@@ -7,6 +7,11 @@ Author: Peyman Khodabandehlouei
 
 from abc import ABC, abstractmethod
 from datetime import datetime, date
+from functools import lru_cache
+from typing import Union
+
+# isoformat() suffix of UTC datetimes (pydantic writes "Z" instead)
+_UTC_OFFSET = "+00:00"
 
 
 class ClockService(ABC):
@@ -48,3 +53,40 @@ class FakeClock(ClockService):
         from datetime import timedelta
 
         self._fixed_time += timedelta(**kwargs)
+
+
+def to_iso_string(value: Union[datetime, date, str]) -> str:
+    """
+    Format a datetime or date as ISO 8601, passing through stored strings.
+
+    A UTC offset is written as "Z", the way pydantic serializes datetimes,
+    so values formatted here match the strings stored with
+    model_dump(mode="json").
+    """
+    if isinstance(value, str):
+        return value
+    iso_string = value.isoformat()
+    if iso_string.endswith(_UTC_OFFSET):
+        return iso_string[: -len(_UTC_OFFSET)] + "Z"
+    return iso_string
+
+
+# Legacy documents repeat the same few timestamps (e.g. a reservation's
+# dates), so memoize parsing; datetimes are immutable and safe to share
+_parse_iso = lru_cache(maxsize=2048)(datetime.fromisoformat)
+
+
+def to_datetime(value: Union[datetime, str]) -> datetime:
+    """Return a stored timestamp as a datetime, parsing legacy ISO strings"""
+    if isinstance(value, str):
+        return _parse_iso(value)
+    return value
+
+
+def to_date(value: Union[datetime, date, str]) -> date:
+    """Return a stored date as a date, parsing legacy ISO strings"""
+    if isinstance(value, str):
+        return _parse_iso(value).date()
+    if isinstance(value, datetime):
+        return value.date()
+    return value
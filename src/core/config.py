@@ -40,10 +40,35 @@ class DatabaseConfig(BaseModel):
     Attributes:
         uri: Database connection string
         name: Database name
+        min_pool_size: Connections kept open even when idle
+        max_pool_size: Upper bound on concurrent connections
+        max_idle_time_ms: How long an idle connection is kept before closing
+        wait_queue_timeout_ms: How long a query waits for a free connection
+        bulk_read_pool_size: Connections reserved for long list/stream reads
+            (0 runs them on the main pool)
+        insert_batch_size: Max documents per batched insert_many
+        insert_batch_delay_ms: How long a batched insert waits for others
     """
 
     uri: SecretStr = Field(..., description="Database connection URI")
     name: str = Field(default="crfsm-peyman-2104987", description="Database name")
+    min_pool_size: int = Field(default=10, ge=0, description="Warm connections")
+    max_pool_size: int = Field(default=100, ge=1, description="Max connections")
+    max_idle_time_ms: int = Field(
+        default=60000, ge=0, description="Idle connection lifetime in ms"
+    )
+    wait_queue_timeout_ms: int = Field(
+        default=2500, ge=0, description="Max wait for a pooled connection in ms"
+    )
+    bulk_read_pool_size: int = Field(
+        default=10, ge=0, description="Dedicated pool size for long reads"
+    )
+    insert_batch_size: int = Field(
+        default=50, ge=1, description="Max documents per batched insert"
+    )
+    insert_batch_delay_ms: float = Field(
+        default=2.0, ge=0, description="Batched insert collection window in ms"
+    )
 
 
 class RabbitMQConfig(BaseModel):
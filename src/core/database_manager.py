@@ -24,12 +24,18 @@ import logging
 from datetime import date, time
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, AsyncIterator, Tuple
 
+import bson
+from bson.raw_bson import RawBSONDocument
+from pymongo import ReturnDocument
 from pymongo.errors import (
     ConnectionFailure,
     ServerSelectionTimeoutError,
     DuplicateKeyError,
+    OperationFailure,
+    BulkWriteError,
+    WriteError,
 )
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
@@ -38,6 +44,8 @@ from motor.motor_asyncio import (
 )
 
 from core import config
+from core.insert_batcher import InsertBatcher, write_error_to_exception
+from core.batch_loader import BatchLoader
 from schemas.db_models import (
     CustomerDocument,
     EmployeeDocument,
@@ -53,6 +61,54 @@ from schemas.db_models import (
 # Logger
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference and clock for timestamps (skips the attribute lookups)
+_UTC = timezone.utc
+_utcnow = datetime.now
+
+# Documents per getMore round-trip when iterating large cursors
+_CURSOR_BATCH_SIZE = 500
+
+# Compound index hinted for customer-scoped reservation queries
+_RESERVATION_CUSTOMER_INDEX = [
+    ("customer_id", 1),
+    ("created_at", -1),
+    ("pickup_date", 1),
+]
+
+# Secondary indexes created on connect: (collection, keys, create_index options)
+_INDEXES = (
+    ("customers", "email", {"unique": True}),
+    ("employees", "email", {"unique": True}),
+    # Plate uniqueness is enforced here, so creates need no pre-insert lookup
+    ("vehicles", "plate_number", {"unique": True}),
+    # Vehicle list filters, ESR order: equality fields, the created_at sort,
+    # then the price range (see VehicleService.list_vehicles)
+    (
+        "vehicles",
+        [
+            ("vehicle_class", 1),
+            ("status", 1),
+            ("branch_id", 1),
+            ("created_at", -1),
+            ("price_per_day", 1),
+        ],
+        {"name": "vcls_status_branch_price"},
+    ),
+    # Customer reservation lists and counts: equality, sort, then range field
+    # (the customer_id prefix also serves the pricing-strategy count)
+    ("reservations", _RESERVATION_CUSTOMER_INDEX, {}),
+    # Invoice status lookups (e.g. invoices still awaiting payment)
+    ("reservations", "invoice.status", {}),
+    # Rentals: one rental per pickup token and per reservation, plus the list filters
+    # (each paired with the created_at sort used by stream_rentals)
+    ("rentals", "pickup_token", {"unique": True}),
+    ("rentals", "reservation_id", {"unique": True}),
+    ("rentals", [("agent_id", 1), ("created_at", -1)], {}),
+    ("rentals", [("customer_id", 1), ("created_at", -1)], {}),
+    ("rentals", [("vehicle_id", 1), ("created_at", -1)], {}),
+    ("rentals", [("status", 1), ("created_at", -1)], {}),
+)
+
 
 class DatabaseManager:
     """
@@ -76,7 +132,18 @@ class DatabaseManager:
         if not hasattr(self, "_initialized"):
             self._client: Optional[AsyncIOMotorClient] = None
             self._database: Optional[AsyncIOMotorDatabase] = None
+            self._bulk_client: Optional[AsyncIOMotorClient] = None
+            self._bulk_database: Optional[AsyncIOMotorDatabase] = None
             self._is_connected: bool = False
+            self._collection_versions: Dict[str, int] = {}
+            # Only hint _RESERVATION_CUSTOMER_INDEX once it is known to exist
+            self._customer_index_ready: bool = False
+            self._reservation_inserts = InsertBatcher(
+                lambda: self.get_collection("reservations"),
+                max_batch_size=config.database.insert_batch_size,
+                max_delay_ms=config.database.insert_batch_delay_ms,
+            )
+            self._loaders: Dict[str, BatchLoader] = {}
             self._initialized = True
             logger.info("DatabaseManager object initialized")
 
@@ -106,11 +173,14 @@ class DatabaseManager:
 
                 logger.info("Connecting to the database.")
 
+                # Keep a floor of warm connections so bursts of requests do
+                # not each pay the connect/TLS handshake
                 self._client = AsyncIOMotorClient(
                     db_uri,
-                    maxPoolSize=10,
-                    minPoolSize=2,
-                    maxIdleTimeMS=45000,
+                    minPoolSize=config.database.min_pool_size,
+                    maxPoolSize=config.database.max_pool_size,
+                    maxIdleTimeMS=config.database.max_idle_time_ms,
+                    waitQueueTimeoutMS=config.database.wait_queue_timeout_ms,
                     serverSelectionTimeoutMS=10000,
                     connectTimeoutMS=20000,
                     socketTimeoutMS=30000,
@@ -121,9 +191,28 @@ class DatabaseManager:
                 # Get database instance
                 self._database = self._client[db_name]
 
+                # Long list/stream reads get their own small pool so a burst
+                # of them cannot hold every connection creates and updates need
+                if config.database.bulk_read_pool_size:
+                    self._bulk_client = AsyncIOMotorClient(
+                        db_uri,
+                        minPoolSize=0,
+                        maxPoolSize=config.database.bulk_read_pool_size,
+                        maxIdleTimeMS=config.database.max_idle_time_ms,
+                        waitQueueTimeoutMS=config.database.wait_queue_timeout_ms,
+                        serverSelectionTimeoutMS=10000,
+                        connectTimeoutMS=20000,
+                        socketTimeoutMS=30000,
+                        retryReads=True,
+                    )
+                    self._bulk_database = self._bulk_client[db_name]
+
                 # Test connection
                 await self._client.admin.command("ping")
 
+                # Make sure the indexes that writes rely on exist
+                await self._ensure_indexes()
+
                 self._is_connected = True
                 logger.info("Successfully connected to the database.")
 
@@ -137,6 +226,25 @@ class DatabaseManager:
                 self._is_connected = False
                 raise
 
+    async def _ensure_indexes(self) -> None:
+        """
+        Create the secondary indexes that queries and writes rely on.
+
+        Email uniqueness is enforced by the database rather than a lookup
+        before insert, so concurrent registrations cannot both succeed.
+        Lookups by _id (branches, reservations, ...) use the default index.
+        create_index is idempotent, so this is safe on every connect.
+        """
+        self._customer_index_ready = False
+        for collection_name, keys, options in _INDEXES:
+            try:
+                await self._database[collection_name].create_index(keys, **options)
+                if keys is _RESERVATION_CUSTOMER_INDEX:
+                    self._customer_index_ready = True
+            except OperationFailure as e:
+                # Usually existing duplicate emails; keep serving, but make it loud
+                logger.error(f"Failed to create index {keys} on {collection_name}: {e}")
+
     async def disconnect(self) -> None:
         """Close MongoDB connection and cleanup resources."""
         # Validation
@@ -150,6 +258,10 @@ class DatabaseManager:
                 self._client.close()
                 self._client = None
                 self._database = None
+                if self._bulk_client:
+                    self._bulk_client.close()
+                    self._bulk_client = None
+                    self._bulk_database = None
                 self._is_connected = False
                 logger.info("MongoDB connection closed")
 
@@ -214,6 +326,82 @@ class DatabaseManager:
 
         return self._database[collection_name]
 
+    def get_bulk_collection(self, collection_name: str) -> AsyncIOMotorCollection:
+        """
+        Get a collection instance bound to the dedicated long-read pool.
+
+        Use this for reads that can hold a connection for a long time
+        (large lists, streams), so they queue against each other instead
+        of starving short reads and writes. Falls back to the main pool
+        when bulk_read_pool_size is 0.
+
+        Args:
+            collection_name (str): Name of the collection
+
+        Returns:
+            AsyncIOMotorCollection: Collection instance for async operations
+
+        Raises:
+            RuntimeError: If the database is not connected
+        """
+        if self._bulk_database is None:
+            return self.get_collection(collection_name)
+
+        if not self._is_connected:
+            raise RuntimeError(
+                "Database not connected. Call await db_manager.connect() first."
+            )
+
+        return self._bulk_database[collection_name]
+
+    async def load_by_id(
+        self, collection_name: str, document_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a document by ID, coalescing concurrent lookups into one query.
+
+        Lookups on the same collection issued in the same event loop tick
+        are sent as a single $in query. The result may be shared with other
+        callers, so treat it as read-only.
+
+        Args:
+            collection_name (str): Name of the collection
+            document_id (str): Document's unique identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Document or None if not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        loader = self._loaders.get(collection_name)
+        if loader is None:
+            loader = self._loaders[collection_name] = BatchLoader(
+                lambda: self.get_collection(collection_name)
+            )
+        return await loader.load(document_id)
+
+    def collection_version(self, collection_name: str) -> int:
+        """
+        Get the write version of a collection.
+
+        The version increases on every write made through this manager, so
+        callers can key caches on it. It is tracked in-process only.
+
+        Args:
+            collection_name (str): Name of the collection
+
+        Returns:
+            int: Current write version (0 if never written)
+        """
+        return self._collection_versions.get(collection_name, 0)
+
+    def _bump_collection_version(self, collection_name: str) -> None:
+        """Mark a collection as written, invalidating version-keyed caches"""
+        self._collection_versions[collection_name] = (
+            self._collection_versions.get(collection_name, 0) + 1
+        )
+
     async def create_customer(self, customer_data: CustomerDocument) -> str:
         """
         Create a new customer in the database.
@@ -340,6 +528,7 @@ class DatabaseManager:
             vehicle_dict = vehicle_data.model_dump(by_alias=True, mode="json")
 
             result = await collection.insert_one(vehicle_dict)
+            self._bump_collection_version("vehicles")
             logger.info(f"Created vehicle with ID: {result.inserted_id}")
             return str(result.inserted_id)
 
@@ -351,6 +540,59 @@ class DatabaseManager:
             logger.error(f"Failed to create vehicle: {e}")
             raise
 
+    async def create_vehicles(
+        self, vehicles_data: List[VehicleDocument]
+    ) -> Dict[int, WriteError]:
+        """
+        Insert several vehicles with one unordered insert_many.
+
+        Rows that the server rejects (e.g. duplicate plate numbers) do not
+        stop the rest of the batch from being written.
+
+        Args:
+            vehicles_data (List[VehicleDocument]): Validated vehicle models.
+
+        Returns:
+            Dict[int, WriteError]: Error per rejected row (DuplicateKeyError
+                for a taken plate number), keyed by its index in vehicles_data;
+                empty if every row was inserted
+
+        Raises:
+            RuntimeError: If the database is not connected
+        """
+        if not vehicles_data:
+            return {}
+
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("vehicles")
+        vehicle_dicts = [
+            vehicle_data.model_dump(by_alias=True, mode="json")
+            for vehicle_data in vehicles_data
+        ]
+
+        try:
+            await collection.insert_many(vehicle_dicts, ordered=False)
+            errors = {}
+        except BulkWriteError as e:
+            errors = {
+                error["index"]: write_error_to_exception(error)
+                for error in e.details["writeErrors"]
+            }
+        except Exception as e:
+            logger.error("Failed to create vehicles: %s", e)
+            raise
+
+        if len(errors) < len(vehicle_dicts):
+            self._bump_collection_version("vehicles")
+        logger.info(
+            "Created %s of %s vehicles",
+            len(vehicle_dicts) - len(errors),
+            len(vehicle_dicts),
+        )
+        return errors
+
     async def find_vehicle_by_id(self, vehicle_id: str) -> Optional[Dict[str, Any]]:
         """
         Find a vehicle by ID.
@@ -408,11 +650,12 @@ class DatabaseManager:
             collection = self.get_collection("vehicles")
 
             # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            update_data["updated_at"] = _utcnow(_UTC)
 
             result = await collection.update_one(
                 {"_id": vehicle_id}, {"$set": update_data}
             )
+            self._bump_collection_version("vehicles")
 
             if result.modified_count > 0:
                 logger.info(f"Updated vehicle: {vehicle_id}")
@@ -429,6 +672,55 @@ class DatabaseManager:
             logger.error(f"Failed to update vehicle: {e}")
             raise
 
+    async def find_and_update_vehicle(
+        self, vehicle_id: str, update_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update vehicle information and return the updated document.
+
+        Done in a single findOneAndUpdate round trip, replacing the
+        find -> update -> find sequence.
+
+        Args:
+            vehicle_id (str): Vehicle ID to update
+            update_data (Dict[str, Any]): Fields to update
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated vehicle document, or None if not found
+
+        Raises:
+            DuplicateKeyError: If updating plate_number to existing value
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        try:
+            collection = self.get_collection("vehicles")
+
+            # Add updated_at timestamp
+            update_data["updated_at"] = _utcnow(_UTC)
+
+            document = await collection.find_one_and_update(
+                {"_id": vehicle_id},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+            self._bump_collection_version("vehicles")
+
+            if document is not None:
+                logger.info(f"Updated vehicle: {vehicle_id}")
+            return document
+
+        except DuplicateKeyError:
+            logger.warning(
+                f"Duplicate plate number in update: {update_data.get('plate_number')}"
+            )
+            raise
+
+        except Exception as e:
+            logger.error(f"Failed to update vehicle: {e}")
+            raise
+
     async def delete_vehicle(self, vehicle_id: str) -> bool:
         """
         Delete a vehicle from the database.
@@ -444,35 +736,90 @@ class DatabaseManager:
 
         collection = self.get_collection("vehicles")
         result = await collection.delete_one({"_id": vehicle_id})
+        self._bump_collection_version("vehicles")
 
         if result.deleted_count > 0:
             logger.info(f"Deleted vehicle: {vehicle_id}")
             return True
         return False
 
-    async def find_vehicles(
-        self, filters: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    async def stream_vehicles(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Find vehicles with optional filters.
+        Iterate over vehicle documents straight from the cursor.
+
+        Documents are yielded one driver batch at a time instead of being
+        materialized into a list, keeping memory flat for large result sets.
+        The driver's default batch sizing is kept.
 
         Args:
             filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
 
-        Returns:
-            List[Dict[str, Any]]: List of vehicle documents
+        Yields:
+            Dict[str, Any]: Vehicle documents sorted by created_at (newest first)
         """
         if not self._is_connected:
             await self.connect()
 
-        collection = self.get_collection("vehicles")
+        collection = self.get_bulk_collection("vehicles")
 
         if filters is None:
             filters = {}
 
-        cursor = collection.find(filters).sort("created_at", -1)
-        vehicles = await cursor.to_list(length=None)
-        return vehicles
+        cursor = collection.find(filters, projection).sort("created_at", -1)
+        async for document in cursor:
+            yield document
+
+    async def find_vehicles_page(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Find one page of vehicles and the total match count in one round trip.
+
+        A $facet stage counts every match on the server while returning
+        only the requested page, so documents outside the page are never
+        transferred.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
+            skip (int): Number of documents to skip
+            limit (Optional[int]): Maximum number of documents (all if None)
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Vehicle documents sorted by
+                created_at (newest first), and the total number of matches
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_bulk_collection("vehicles")
+
+        page: List[Dict[str, Any]] = [{"$skip": skip}]
+        if limit is not None:
+            page.append({"$limit": limit})
+        if projection is not None:
+            page.append({"$project": projection})
+
+        pipeline = [
+            {"$match": filters or {}},
+            {"$sort": {"created_at": -1}},
+            {"$facet": {"data": page, "total": [{"$count": "n"}]}},
+        ]
+        results = await collection.aggregate(pipeline).to_list(length=1)
+
+        # $facet always emits one document; "total" is empty when nothing matched
+        result = results[0] if results else {"data": [], "total": []}
+        total = result["total"][0]["n"] if result["total"] else 0
+        return result["data"], total
 
     async def create_branch(self, branch_data: BranchDocument) -> str:
         """
@@ -496,7 +843,11 @@ class DatabaseManager:
             # Convert Pydantic model to dict for MongoDB
             branch_dict = branch_data.model_dump(by_alias=True, mode="json")
 
+            # Keep packed employee IDs as BSON binary rather than JSON strings
+            branch_dict["employee_ids"] = branch_data.packed_employee_ids
+
             result = await collection.insert_one(branch_dict)
+            self._bump_collection_version("branches")
             logger.info(f"Created branch with ID: {result.inserted_id}")
             return str(result.inserted_id)
 
@@ -504,12 +855,15 @@ class DatabaseManager:
             logger.error(f"Failed to create branch: {e}")
             raise
 
-    async def find_branch_by_id(self, branch_id: str) -> Optional[Dict[str, Any]]:
+    async def find_branch_by_id(
+        self, branch_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
         Find a branch by ID.
 
         Args:
             branch_id (str): Branch's unique identifier
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
 
         Returns:
             Optional[Dict[str, Any]]: Branch document or None if not found
@@ -518,16 +872,19 @@ class DatabaseManager:
             await self.connect()
 
         collection = self.get_collection("branches")
-        return await collection.find_one({"_id": branch_id})
+        return await collection.find_one({"_id": branch_id}, projection)
 
     async def find_branches(
-        self, filters: Optional[Dict[str, Any]] = None
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find branches with optional filters.
 
         Args:
             filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
 
         Returns:
             List[Dict[str, Any]]: List of branch documents
@@ -540,7 +897,7 @@ class DatabaseManager:
         if filters is None:
             filters = {}
 
-        cursor = collection.find(filters).sort("created_at", -1)
+        cursor = collection.find(filters, projection).sort("created_at", -1)
         branches = await cursor.to_list(length=None)
         return branches
 
@@ -562,11 +919,12 @@ class DatabaseManager:
             collection = self.get_collection("branches")
 
             # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            update_data["updated_at"] = _utcnow(_UTC)
 
             result = await collection.update_one(
                 {"_id": branch_id}, {"$set": update_data}
             )
+            self._bump_collection_version("branches")
 
             if result.modified_count > 0:
                 logger.info(f"Updated branch: {branch_id}")
@@ -577,6 +935,51 @@ class DatabaseManager:
             logger.error(f"Failed to update branch: {e}")
             raise
 
+    async def find_and_update_branch(
+        self,
+        branch_id: str,
+        update_data: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update branch information and return the updated document.
+
+        Done in a single findOneAndUpdate round trip, replacing the
+        find -> update -> find sequence.
+
+        Args:
+            branch_id (str): Branch ID to update
+            update_data (Dict[str, Any]): Fields to update
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated branch document or None if not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        try:
+            collection = self.get_collection("branches")
+
+            # Add updated_at timestamp
+            update_data["updated_at"] = _utcnow(_UTC)
+
+            document = await collection.find_one_and_update(
+                {"_id": branch_id},
+                {"$set": update_data},
+                projection=projection,
+                return_document=ReturnDocument.AFTER,
+            )
+            self._bump_collection_version("branches")
+
+            if document is not None:
+                logger.info(f"Updated branch: {branch_id}")
+            return document
+
+        except Exception as e:
+            logger.error(f"Failed to update branch: {e}")
+            raise
+
     async def delete_branch(self, branch_id: str) -> bool:
         """
         Delete a branch from the database.
@@ -592,6 +995,7 @@ class DatabaseManager:
 
         collection = self.get_collection("branches")
         result = await collection.delete_one({"_id": branch_id})
+        self._bump_collection_version("branches")
 
         if result.deleted_count > 0:
             logger.info(f"Deleted branch: {branch_id}")
@@ -600,30 +1004,39 @@ class DatabaseManager:
 
     async def add_employee_to_branch(self, branch_id: str, employee_id: str) -> bool:
         """
-        Add an employee ID to a branch's employee_ids list.
+        Add an employee ID to a branch's packed employee_ids.
 
         Args:
             branch_id (str): Branch ID
             employee_id (str): Employee ID to add
 
         Returns:
-            bool: True if employee was added, False if branch not found
+            bool: True if employee was added, False if branch not found or
+                employee already assigned
+
+        Raises:
+            InvalidEmployeeIdError: If employee_id is not a valid UUID
         """
         if not self._is_connected:
             await self.connect()
 
+        stored_id = BranchDocument.stored_employee_id(employee_id)
+
         try:
             collection = self.get_collection("branches")
 
+            # Legacy documents may still hold the ID as a string, so skip
+            # branches that list it in either form (prevents duplicates)
             result = await collection.update_one(
-                {"_id": branch_id},
+                {"_id": branch_id, "employee_ids": {"$nin": [stored_id, employee_id]}},
                 {
-                    "$addToSet": {"employee_ids": employee_id},  # Prevents duplicates
-                    "$set": {"updated_at": datetime.now(timezone.utc)},
+                    "$addToSet": {"employee_ids": stored_id},
+                    "$set": {"updated_at": _utcnow(_UTC)},
                 },
             )
 
             if result.modified_count > 0:
+                self._bump_collection_version("branches")
                 logger.info(f"Added employee {employee_id} to branch {branch_id}")
                 return True
             return False
@@ -636,30 +1049,37 @@ class DatabaseManager:
         self, branch_id: str, employee_id: str
     ) -> bool:
         """
-        Remove an employee ID from a branch's employee_ids list.
+        Remove an employee ID from a branch's packed employee_ids.
 
         Args:
             branch_id (str): Branch ID
             employee_id (str): Employee ID to remove
 
         Returns:
-            bool: True if employee was removed, False if branch not found
+            bool: True if employee was removed, False if branch not found or
+                employee not assigned
+
+        Raises:
+            InvalidEmployeeIdError: If employee_id is not a valid UUID
         """
         if not self._is_connected:
             await self.connect()
 
+        stored_forms = [BranchDocument.stored_employee_id(employee_id), employee_id]
+
         try:
             collection = self.get_collection("branches")
 
             result = await collection.update_one(
-                {"_id": branch_id},
+                {"_id": branch_id, "employee_ids": {"$in": stored_forms}},
                 {
-                    "$pull": {"employee_ids": employee_id},  # Remove from array
-                    "$set": {"updated_at": datetime.now(timezone.utc)},
+                    "$pull": {"employee_ids": {"$in": stored_forms}},
+                    "$set": {"updated_at": _utcnow(_UTC)},
                 },
             )
 
             if result.modified_count > 0:
+                self._bump_collection_version("branches")
                 logger.info(f"Removed employee {employee_id} from branch {branch_id}")
                 return True
             return False
@@ -691,6 +1111,7 @@ class DatabaseManager:
             add_on_dict = add_on_data.model_dump(by_alias=True, mode="json")
 
             result = await collection.insert_one(add_on_dict)
+            self._bump_collection_version("add_ons")
             logger.info(f"Created add-on with ID: {result.inserted_id}")
             return str(result.inserted_id)
 
@@ -756,11 +1177,12 @@ class DatabaseManager:
             collection = self.get_collection("add_ons")
 
             # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            update_data["updated_at"] = _utcnow(_UTC)
 
             result = await collection.update_one(
                 {"_id": add_on_id}, {"$set": update_data}
             )
+            self._bump_collection_version("add_ons")
 
             if result.modified_count > 0:
                 logger.info(f"Updated add-on: {add_on_id}")
@@ -786,6 +1208,7 @@ class DatabaseManager:
 
         collection = self.get_collection("add_ons")
         result = await collection.delete_one({"_id": add_on_id})
+        self._bump_collection_version("add_ons")
 
         if result.deleted_count > 0:
             logger.info(f"Deleted add-on: {add_on_id}")
@@ -833,6 +1256,7 @@ class DatabaseManager:
             tier_dict = tier_data.model_dump(by_alias=True, mode="json")
 
             result = await collection.insert_one(tier_dict)
+            self._bump_collection_version("insurance_tiers")
             logger.info(f"Created insurance tier with ID: {result.inserted_id}")
             return str(result.inserted_id)
 
@@ -857,13 +1281,16 @@ class DatabaseManager:
         return await collection.find_one({"_id": tier_id})
 
     async def find_insurance_tiers(
-        self, filters: Optional[Dict[str, Any]] = None
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find insurance tiers with optional filters.
 
         Args:
             filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
 
         Returns:
             List[Dict[str, Any]]: List of insurance tier documents
@@ -876,7 +1303,7 @@ class DatabaseManager:
         if filters is None:
             filters = {}
 
-        cursor = collection.find(filters).sort("created_at", -1)
+        cursor = collection.find(filters, projection).sort("created_at", -1)
         tiers = await cursor.to_list(length=None)
         return tiers
 
@@ -900,11 +1327,12 @@ class DatabaseManager:
             collection = self.get_collection("insurance_tiers")
 
             # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            update_data["updated_at"] = _utcnow(_UTC)
 
             result = await collection.update_one(
                 {"_id": tier_id}, {"$set": update_data}
             )
+            self._bump_collection_version("insurance_tiers")
 
             if result.modified_count > 0:
                 logger.info(f"Updated insurance tier: {tier_id}")
@@ -915,6 +1343,51 @@ class DatabaseManager:
             logger.error(f"Failed to update insurance tier: {e}")
             raise
 
+    async def find_and_update_insurance_tier(
+        self,
+        tier_id: str,
+        update_data: Dict[str, Any],
+        projection: Optional[Dict[str, Any]] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update insurance tier information and return the updated document.
+
+        Done in a single findOneAndUpdate round trip, replacing the
+        find -> update -> find sequence.
+
+        Args:
+            tier_id (str): Insurance tier ID to update
+            update_data (Dict[str, Any]): Fields to update
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated insurance tier document or None if not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        try:
+            collection = self.get_collection("insurance_tiers")
+
+            # Add updated_at timestamp
+            update_data["updated_at"] = _utcnow(_UTC)
+
+            document = await collection.find_one_and_update(
+                {"_id": tier_id},
+                {"$set": update_data},
+                projection=projection,
+                return_document=ReturnDocument.AFTER,
+            )
+            self._bump_collection_version("insurance_tiers")
+
+            if document is not None:
+                logger.info(f"Updated insurance tier: {tier_id}")
+            return document
+
+        except Exception as e:
+            logger.error(f"Failed to update insurance tier: {e}")
+            raise
+
     async def delete_insurance_tier(self, tier_id: str) -> bool:
         """
         Delete an insurance tier from the database.
@@ -930,6 +1403,7 @@ class DatabaseManager:
 
         collection = self.get_collection("insurance_tiers")
         result = await collection.delete_one({"_id": tier_id})
+        self._bump_collection_version("insurance_tiers")
 
         if result.deleted_count > 0:
             logger.info(f"Deleted insurance tier: {tier_id}")
@@ -953,14 +1427,20 @@ class DatabaseManager:
             await self.connect()
 
         try:
-            collection = self.get_collection("reservations")
-
             # Convert Pydantic model to dict for MongoDB
-            reservation_dict = reservation_data.model_dump(by_alias=True, mode="json")
+            # rental_days is derived from the dates, so it is not stored
+            reservation_dict = reservation_data.model_dump(
+                by_alias=True, mode="json", exclude={"rental_days"}
+            )
 
-            result = await collection.insert_one(reservation_dict)
-            logger.info(f"Created reservation with ID: {result.inserted_id}")
-            return str(result.inserted_id)
+            # Encode once up front; the driver sends raw BSON as-is. Concurrent
+            # creates are coalesced into one insert_many by the batcher
+            inserted_id = await self._reservation_inserts.insert(
+                RawBSONDocument(bson.encode(reservation_dict))
+            )
+            self._bump_collection_version("reservations")
+            logger.info(f"Created reservation with ID: {inserted_id}")
+            return str(inserted_id)
 
         except Exception as e:
             logger.error(f"Failed to create reservation: {e}")
@@ -984,14 +1464,78 @@ class DatabaseManager:
         collection = self.get_collection("reservations")
         return await collection.find_one({"_id": reservation_id})
 
+    async def find_reservation_invoice(
+        self, reservation_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find only the invoice of a reservation.
+
+        Args:
+            reservation_id (str): Reservation's unique identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Invoice sub-document or None if the
+                reservation is not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("reservations")
+        reservation_doc = await collection.find_one(
+            {"_id": reservation_id}, {"_id": 0, "invoice": 1}
+        )
+        return reservation_doc["invoice"] if reservation_doc else None
+
+    async def claim_invoice(self, reservation_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Atomically move a pending invoice to 'processing'.
+
+        Only one caller can claim a given invoice, so concurrent payment
+        requests for the same reservation cannot both charge it.
+
+        Args:
+            reservation_id (str): Reservation's unique identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Claimed invoice sub-document, or None if
+                the reservation is missing or its invoice is not pending
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("reservations")
+        reservation_doc = await collection.find_one_and_update(
+            {"_id": reservation_id, "invoice.status": "pending"},
+            {
+                "$set": {
+                    "invoice.status": "processing",
+                    "updated_at": _utcnow(_UTC),
+                }
+            },
+            projection={"_id": 0, "invoice": 1},
+            return_document=ReturnDocument.AFTER,
+        )
+        if not reservation_doc:
+            return None
+
+        self._bump_collection_version("reservations")
+        return reservation_doc["invoice"]
+
     async def find_reservations(
-        self, filters: Optional[Dict[str, Any]] = None
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
     ) -> List[Dict[str, Any]]:
         """
         Find reservations with optional filters.
 
         Args:
             filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
+            skip (int): Number of documents to skip
+            limit (Optional[int]): Maximum number of documents (all if None)
 
         Returns:
             List[Dict[str, Any]]: List of reservation documents
@@ -1004,10 +1548,68 @@ class DatabaseManager:
         if filters is None:
             filters = {}
 
-        cursor = collection.find(filters).sort("created_at", -1)
+        cursor = (
+            collection.find(filters, projection)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit or 0)
+            .batch_size(_CURSOR_BATCH_SIZE)
+        )
+        # Pin the customer index instead of letting the planner race candidates
+        if "customer_id" in filters and self._customer_index_ready:
+            cursor = cursor.hint(_RESERVATION_CUSTOMER_INDEX)
         reservations = await cursor.to_list(length=None)
         return reservations
 
+    async def count_reservations(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count reservations matching the filters without loading them.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): MongoDB query filters
+
+        Returns:
+            int: Number of matching reservation documents
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("reservations")
+
+        filters = filters or {}
+        if "customer_id" in filters and self._customer_index_ready:
+            return await collection.count_documents(
+                filters, hint=_RESERVATION_CUSTOMER_INDEX
+            )
+        return await collection.count_documents(filters)
+
+    async def stream_reservations(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Iterate over reservation documents straight from the cursor.
+
+        Unlike find_reservations, documents are yielded one batch at a time instead
+        of being materialized into a list, keeping memory flat for large
+        result sets.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): MongoDB query filters
+
+        Yields:
+            Dict[str, Any]: Reservation documents sorted by created_at (newest first)
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("reservations")
+
+        if filters is None:
+            filters = {}
+
+        async for document in collection.find(filters).sort("created_at", -1):
+            yield document
+
     async def update_reservation(
         self, reservation_id: str, update_data: Dict[str, Any]
     ) -> bool:
@@ -1025,31 +1627,14 @@ class DatabaseManager:
             await self.connect()
 
         try:
-            from datetime import time
-
             collection = self.get_collection("reservations")
 
-            # FIX: Convert date objects to datetime for MongoDB storage
-            if "pickup_date" in update_data and isinstance(
-                update_data["pickup_date"], date
-            ):
-                update_data["pickup_date"] = datetime.combine(
-                    update_data["pickup_date"], time.min
-                )
-
-            if "return_date" in update_data and isinstance(
-                update_data["return_date"], date
-            ):
-                update_data["return_date"] = datetime.combine(
-                    update_data["return_date"], time.max
-                )
-
-            # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            self._prepare_reservation_update(update_data)
 
             result = await collection.update_one(
                 {"_id": reservation_id}, {"$set": update_data}
             )
+            self._bump_collection_version("reservations")
 
             if result.modified_count > 0:
                 logger.info(f"Updated reservation: {reservation_id}")
@@ -1060,46 +1645,124 @@ class DatabaseManager:
             logger.error(f"Failed to update reservation: {e}")
             raise
 
-    async def delete_reservation(self, reservation_id: str) -> bool:
+    async def find_and_update_reservation(
+        self, reservation_id: str, update_data: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update reservation information and return the updated document.
+
+        Done in a single findOneAndUpdate round trip, replacing the
+        update -> find sequence.
+
+        Args:
+            reservation_id (str): Reservation ID to update
+            update_data (Dict[str, Any]): Fields to update
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated reservation document, or None if
+                not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        try:
+            collection = self.get_collection("reservations")
+
+            self._prepare_reservation_update(update_data)
+
+            document = await collection.find_one_and_update(
+                {"_id": reservation_id},
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+            self._bump_collection_version("reservations")
+
+            if document is not None:
+                logger.info(f"Updated reservation: {reservation_id}")
+            return document
+
+        except Exception as e:
+            logger.error(f"Failed to update reservation: {e}")
+            raise
+
+    @staticmethod
+    def _prepare_reservation_update(update_data: Dict[str, Any]) -> None:
+        """
+        Normalize a reservation $set document in place before writing.
+
+        Date objects are stored as datetimes (start of pickup day, end of
+        return day) and updated_at is stamped.
+
+        Args:
+            update_data (Dict[str, Any]): Fields to update
+        """
+        # FIX: Convert date objects to datetime for MongoDB storage
+        if "pickup_date" in update_data and isinstance(
+            update_data["pickup_date"], date
+        ):
+            update_data["pickup_date"] = datetime.combine(
+                update_data["pickup_date"], time.min
+            )
+
+        if "return_date" in update_data and isinstance(
+            update_data["return_date"], date
+        ):
+            update_data["return_date"] = datetime.combine(
+                update_data["return_date"], time.max
+            )
+
+        # Add updated_at timestamp
+        update_data["updated_at"] = _utcnow(_UTC)
+
+    async def find_and_delete_reservation(
+        self, reservation_id: str, projection: Optional[Dict[str, Any]] = None
+    ) -> Optional[Dict[str, Any]]:
         """
-        Delete a reservation from the database.
+        Delete a reservation and return the deleted document.
+
+        Done in a single findOneAndDelete round trip, so callers that need
+        fields of the deleted reservation do not have to read it first.
 
         Args:
             reservation_id (str): Reservation ID to delete
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
 
         Returns:
-            bool: True if reservation was deleted, False if not found
+            Optional[Dict[str, Any]]: Deleted reservation document, or None if
+                not found
         """
         if not self._is_connected:
             await self.connect()
 
         collection = self.get_collection("reservations")
-        result = await collection.delete_one({"_id": reservation_id})
+        document = await collection.find_one_and_delete(
+            {"_id": reservation_id}, projection
+        )
+        self._bump_collection_version("reservations")
 
-        if result.deleted_count > 0:
+        if document is not None:
             logger.info(f"Deleted reservation: {reservation_id}")
-            return True
-        return False
+        return document
 
-    async def find_reservations_by_customer(
-        self, customer_id: str
-    ) -> List[Dict[str, Any]]:
+    async def count_reservations_by_customer(self, customer_id: str) -> int:
         """
-        Find all reservations for a specific customer.
+        Count a customer's reservations without loading them.
 
         Args:
             customer_id (str): Customer ID to filter by
 
         Returns:
-            List[Dict[str, Any]]: List of reservation documents
+            int: Number of reservation documents for the customer
         """
         if not self._is_connected:
             await self.connect()
 
         collection = self.get_collection("reservations")
-        cursor = collection.find({"customer_id": customer_id}).sort("created_at", -1)
-        reservations = await cursor.to_list(length=None)
-        return reservations
+        if self._customer_index_ready:
+            return await collection.count_documents(
+                {"customer_id": customer_id}, hint=_RESERVATION_CUSTOMER_INDEX
+            )
+        return await collection.count_documents({"customer_id": customer_id})
 
     async def find_reservations_by_vehicle(
         self, vehicle_id: str
@@ -1253,7 +1916,7 @@ class DatabaseManager:
             str: The created rental ID
 
         Raises:
-            DuplicateKeyError: If pickup_token already exists (idempotency violation)
+            DuplicateKeyError: If pickup_token or reservation_id already has a rental
             RuntimeError: If the database is not connected
         """
         if not self._is_connected:
@@ -1265,12 +1928,15 @@ class DatabaseManager:
             # Convert Pydantic model to dict for MongoDB
             rental_dict = rental_data.model_dump(by_alias=True, mode="json")
 
-            result = await collection.insert_one(rental_dict)
+            # Encode once up front; the driver sends raw BSON as-is
+            result = await collection.insert_one(
+                RawBSONDocument(bson.encode(rental_dict))
+            )
             logger.info(f"Created rental with ID: {result.inserted_id}")
             return str(result.inserted_id)
 
-        except DuplicateKeyError:
-            logger.warning(f"Duplicate pickup_token: {rental_data.pickup_token}")
+        except DuplicateKeyError as e:
+            logger.warning(f"Duplicate rental key: {(e.details or {}).get('keyValue')}")
             raise
 
         except Exception as e:
@@ -1293,6 +1959,46 @@ class DatabaseManager:
         collection = self.get_collection("rentals")
         return await collection.find_one({"_id": rental_id})
 
+    async def find_rental_with_reservation(
+        self, rental_id: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Find a rental and its reservation in a single query.
+
+        The reservation is joined with $lookup and returned under the
+        "reservation" key (None if it no longer exists).
+
+        Args:
+            rental_id (str): Rental's unique identifier
+
+        Returns:
+            Optional[Dict[str, Any]]: Rental document or None if not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("rentals")
+        pipeline = [
+            {"$match": {"_id": rental_id}},
+            {"$limit": 1},
+            {
+                "$lookup": {
+                    "from": "reservations",
+                    "localField": "reservation_id",
+                    "foreignField": "_id",
+                    "as": "reservation",
+                }
+            },
+            {"$set": {"reservation": {"$arrayElemAt": ["$reservation", 0]}}},
+        ]
+        results = await collection.aggregate(pipeline).to_list(length=1)
+        if not results:
+            return None
+
+        rental_doc = results[0]
+        rental_doc.setdefault("reservation", None)
+        return rental_doc
+
     async def find_rental_by_pickup_token(
         self, pickup_token: str
     ) -> Optional[Dict[str, Any]]:
@@ -1314,11 +2020,18 @@ class DatabaseManager:
         collection = self.get_collection("rentals")
         return await collection.find_one({"pickup_token": pickup_token})
 
-    async def find_rentals(
-        self, filters: Optional[Dict[str, Any]] = None
-    ) -> List[Dict[str, Any]]:
+    async def stream_rentals(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        projection: Optional[Dict[str, Any]] = None,
+        skip: int = 0,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
         """
-        Find rentals with optional filters.
+        Iterate over rental documents straight from the cursor.
+
+        Documents are yielded one batch at a time instead of being
+        materialized into a list, keeping memory flat for large result sets.
 
         Common filters:
             - customer_id: Filter by customer
@@ -1329,9 +2042,12 @@ class DatabaseManager:
 
         Args:
             filters (Optional[Dict[str, Any]]): MongoDB query filters
+            projection (Optional[Dict[str, Any]]): Fields to return (all if None)
+            skip (int): Number of documents to skip
+            limit (Optional[int]): Maximum number of documents (all if None)
 
-        Returns:
-            List[Dict[str, Any]]: List of rental documents sorted by created_at (newest first)
+        Yields:
+            Dict[str, Any]: Rental documents sorted by created_at (newest first)
         """
         if not self._is_connected:
             await self.connect()
@@ -1341,9 +2057,109 @@ class DatabaseManager:
         if filters is None:
             filters = {}
 
-        cursor = collection.find(filters).sort("created_at", -1)
-        rentals = await cursor.to_list(length=None)
-        return rentals
+        cursor = (
+            collection.find(filters, projection)
+            .sort("created_at", -1)
+            .skip(skip)
+            .limit(limit or 0)
+            .batch_size(_CURSOR_BATCH_SIZE)
+        )
+        async for document in cursor:
+            yield document
+
+    async def count_rentals(self, filters: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Count rentals matching the filters without loading them.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): MongoDB query filters
+
+        Returns:
+            int: Number of matching rental documents
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("rentals")
+        return await collection.count_documents(filters or {})
+
+    async def sum_rental_charges(
+        self, filters: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """
+        Sum rental charges inside MongoDB with an aggregation pipeline.
+
+        Only rentals that have charges are counted. Charges written before
+        the total was stored are summed from their individual fees.
+
+        Args:
+            filters (Optional[Dict[str, Any]]): MongoDB query filters
+
+        Returns:
+            Dict[str, Any]: {"total": float, "count": int}
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("rentals")
+
+        match = dict(filters or {})
+        match["charges"] = {"$ne": None}
+
+        pipeline = [
+            {"$match": match},
+            {
+                "$group": {
+                    "_id": None,
+                    "total": {
+                        "$sum": {
+                            "$ifNull": [
+                                "$charges.total",
+                                {
+                                    "$add": [
+                                        "$charges.base_price",
+                                        "$charges.late_fee",
+                                        "$charges.mileage_overage_fee",
+                                        "$charges.fuel_refill_fee",
+                                        "$charges.damage_fee",
+                                    ]
+                                },
+                            ]
+                        }
+                    },
+                    "count": {"$sum": 1},
+                }
+            },
+        ]
+
+        results = await collection.aggregate(pipeline).to_list(length=1)
+        if not results:
+            return {"total": 0.0, "count": 0}
+
+        return {"total": float(results[0]["total"]), "count": results[0]["count"]}
+
+    async def delete_rental(self, rental_id: str) -> bool:
+        """
+        Delete a rental from the database.
+
+        Only used to compensate a pickup whose follow-up writes failed.
+
+        Args:
+            rental_id (str): Rental ID to delete
+
+        Returns:
+            bool: True if rental was deleted, False if not found
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        collection = self.get_collection("rentals")
+        result = await collection.delete_one({"_id": rental_id})
+
+        if result.deleted_count > 0:
+            logger.info(f"Deleted rental: {rental_id}")
+            return True
+        return False
 
     async def update_rental(self, rental_id: str, update_data: Dict[str, Any]) -> bool:
         """
@@ -1368,7 +2184,7 @@ class DatabaseManager:
             collection = self.get_collection("rentals")
 
             # Add updated_at timestamp
-            update_data["updated_at"] = datetime.now(timezone.utc)
+            update_data["updated_at"] = _utcnow(_UTC)
 
             result = await collection.update_one(
                 {"_id": rental_id}, {"$set": update_data}
@@ -1383,6 +2199,55 @@ class DatabaseManager:
             logger.error(f"Failed to update rental: {e}")
             raise
 
+    async def find_and_update_rental(
+        self,
+        rental_id: str,
+        update_data: Dict[str, Any],
+        expected_status: Optional[str] = None,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Update rental information and return the updated document.
+
+        Done in a single findOneAndUpdate round trip, replacing the
+        update -> find sequence.
+
+        Args:
+            rental_id (str): Rental ID to update
+            update_data (Dict[str, Any]): Fields to update
+            expected_status (Optional[str]): Only update if the rental still
+                has this status (guards against concurrent transitions)
+
+        Returns:
+            Optional[Dict[str, Any]]: Updated rental document, or None if not
+                found or no longer in expected_status
+        """
+        if not self._is_connected:
+            await self.connect()
+
+        try:
+            collection = self.get_collection("rentals")
+
+            # Add updated_at timestamp
+            update_data["updated_at"] = _utcnow(_UTC)
+
+            query: Dict[str, Any] = {"_id": rental_id}
+            if expected_status is not None:
+                query["status"] = expected_status
+
+            document = await collection.find_one_and_update(
+                query,
+                {"$set": update_data},
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if document is not None:
+                logger.info(f"Updated rental: {rental_id}")
+            return document
+
+        except Exception as e:
+            logger.error(f"Failed to update rental: {e}")
+            raise
+
     async def find_rental_by_reservation(
         self, reservation_id: str
     ) -> Optional[Dict[str, Any]]:
@@ -1471,6 +2336,70 @@ class DatabaseManager:
             logger.error(f"Failed to check rental extension conflict: {e}")
             raise
 
+    async def try_extend_reservation(
+        self,
+        reservation_id: str,
+        vehicle_id: str,
+        current_return_date: date,
+        new_return_date: date,
+    ) -> bool:
+        """
+        Move a reservation's return date out if no other booking is in the way.
+
+        MongoDB cannot check other documents inside an update filter, so the
+        conflict check runs first. The update itself is conditional on the
+        stored return date still being before new_return_date, so two
+        concurrent extensions of the same reservation cannot both apply.
+
+        Args:
+            reservation_id (str): Reservation to extend
+            vehicle_id (str): Vehicle of the reservation
+            current_return_date (date): Current planned return date
+            new_return_date (date): Requested new return date
+
+        Returns:
+            bool: True if the reservation was extended, False on a conflict
+        """
+        is_free = await self.check_rental_extension_conflict(
+            vehicle_id=vehicle_id,
+            current_return_date=current_return_date,
+            new_return_date=new_return_date,
+            exclude_reservation_id=reservation_id,
+        )
+        if not is_free:
+            return False
+
+        collection = self.get_collection("reservations")
+        result = await collection.update_one(
+            {
+                "_id": reservation_id,
+                # Dates are stored as ISO strings on create and as datetimes
+                # after an update; each branch only matches its own BSON type
+                "$or": [
+                    {"return_date": {"$lt": new_return_date.isoformat()}},
+                    {
+                        "return_date": {
+                            "$lt": datetime.combine(new_return_date, time.min)
+                        }
+                    },
+                ],
+            },
+            {
+                "$set": {
+                    "return_date": datetime.combine(new_return_date, time.max),
+                    "updated_at": _utcnow(_UTC),
+                }
+            },
+        )
+        self._bump_collection_version("reservations")
+
+        if result.modified_count > 0:
+            logger.info(f"Extended reservation {reservation_id} to {new_return_date}")
+            return True
+
+        logger.info(f"Reservation {reservation_id} was changed concurrently")
+        return False
+
     async def find_all_customers(self) -> List[Dict[str, Any]]:
         """
         Retrieve all customers from the database.
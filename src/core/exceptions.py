@@ -51,3 +51,8 @@ class DuplicateEmailError(Exception):
         super().__init__(
             f"Email {email} is already registered. Please choose another email."
         )
+
+
+class InvalidEmployeeIdError(Exception):
+    def __init__(self, employee_id: str):
+        super().__init__(f"Employee ID {employee_id!r} is not a valid UUID.")
@@ -0,0 +1,126 @@
+"""
+This module provides write batching for single-document inserts.
+
+Concurrent requests that each insert one document are collected for a
+short window and written with a single unordered insert_many, so the
+round-trip and journal cost is shared by the whole batch. Each caller
+still gets its own result or error.
+
+Author: Peyman Khodabandehlouei
+"""
+
+import asyncio
+import logging
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+from pymongo.errors import BulkWriteError, DuplicateKeyError, WriteError
+from motor.motor_asyncio import AsyncIOMotorCollection
+
+logger = logging.getLogger(__name__)
+
+# MongoDB server error code for unique index violations
+_DUPLICATE_KEY_CODE = 11000
+
+
+def write_error_to_exception(error: Dict[str, Any]) -> WriteError:
+    """
+    Convert one bulk writeErrors entry into the exception insert_one raises.
+
+    Args:
+        error (Dict[str, Any]): Entry from BulkWriteError.details["writeErrors"].
+
+    Returns:
+        WriteError: DuplicateKeyError for unique index violations, else WriteError.
+    """
+    if error["code"] == _DUPLICATE_KEY_CODE:
+        return DuplicateKeyError(error["errmsg"], error["code"], error)
+    return WriteError(error["errmsg"], error["code"], error)
+
+
+class InsertBatcher:
+    """Coalesces inserts into one collection into insert_many calls"""
+
+    def __init__(
+        self,
+        get_collection: Callable[[], AsyncIOMotorCollection],
+        max_batch_size: int = 50,
+        max_delay_ms: float = 2.0,
+    ):
+        """
+        Args:
+            get_collection (Callable[[], AsyncIOMotorCollection]): Returns the
+                target collection at flush time (one batcher per collection).
+            max_batch_size (int): Flush as soon as this many inserts are queued.
+            max_delay_ms (float): Longest time an insert waits for company.
+        """
+        self._get_collection = get_collection
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay_ms / 1000
+        self._pending: List[Tuple[Any, asyncio.Future]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        # Strong references so in-flight write tasks are not garbage collected
+        self._writes: Set[asyncio.Task] = set()
+
+    async def insert(self, document: Any) -> Any:
+        """
+        Queue a document for insertion and wait for its batch to be written.
+
+        Documents must carry their own _id (raw BSON documents cannot be
+        given one by the driver).
+
+        Args:
+            document (Any): Document to insert.
+
+        Returns:
+            Any: The inserted document's _id.
+
+        Raises:
+            DuplicateKeyError: If this document violated a unique index.
+            WriteError: If the server rejected this document.
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((document, future))
+
+        if len(self._pending) >= self._max_batch_size:
+            self._flush_now()
+        elif self._timer is None:
+            self._timer = loop.call_later(self._max_delay, self._flush_now)
+
+        return await future
+
+    def _flush_now(self) -> None:
+        """Hand the queued batch (in FIFO order) to a write task"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if batch:
+            task = asyncio.get_running_loop().create_task(self._write(batch))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+
+    async def _write(self, batch: List[Tuple[Any, asyncio.Future]]) -> None:
+        """Write one batch and resolve each caller's future"""
+        documents = [document for document, _ in batch]
+        errors = {}
+        try:
+            await self._get_collection().insert_many(documents, ordered=False)
+        except BulkWriteError as e:
+            errors = {error["index"]: error for error in e.details["writeErrors"]}
+        except Exception as e:
+            logger.error("Batched insert of %s documents failed: %s", len(batch), e)
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for index, (document, future) in enumerate(batch):
+            if future.done():
+                continue
+            error = errors.get(index)
+            if error is None:
+                future.set_result(document["_id"])
+            else:
+                future.set_exception(write_error_to_exception(error))
@@ -8,9 +8,11 @@ Author: Peyman Khodabandehlouei
 Date: 13-01-2026
 """
 
-import json
 import logging
-from typing import Optional, Callable, Dict, Any
+from types import MappingProxyType
+from typing import Optional, Callable, Dict, Any, Mapping
+
+import orjson
 from aio_pika.abc import AbstractIncomingMessage
 from aio_pika import connect_robust, Message, Connection, Channel, Exchange
 
@@ -110,8 +112,8 @@ class RabbitMQManager:
             # Build message body with metadata
             message_body = {"event_type": event_type, "data": data, "timestamp": None}
 
-            # Serialize to JSON
-            message_bytes = json.dumps(message_body).encode()
+            # Serialize to JSON (orjson encodes straight to bytes)
+            message_bytes = orjson.dumps(message_body)
 
             # Create a message with persistence
             message = Message(
@@ -133,7 +135,7 @@ class RabbitMQManager:
     async def subscribe(
         self,
         event_type: str,
-        callback: Callable[[Dict[str, Any]], None],
+        callback: Callable[[Mapping[str, Any]], None],
         queue_name: Optional[str] = None,
     ) -> None:
         """
@@ -144,7 +146,7 @@ class RabbitMQManager:
 
         Args:
             event_type (str): Event type to subscribe to (supports wildcards: *, #)
-            callback (Callable): Async function to handle event data
+            callback (Callable): Async function to handle event data (read-only mapping)
             queue_name (Optional[str]): Custom queue name (auto-generated if None)
         """
         if not self._is_connected:
@@ -167,9 +169,11 @@ class RabbitMQManager:
             async def on_message(message: AbstractIncomingMessage):
                 async with message.process():
                     try:
-                        # Deserialize message body
-                        body = json.loads(message.body.decode())
-                        event_data = body.get("data", {})
+                        # Deserialize message body (orjson reads bytes directly)
+                        body = orjson.loads(message.body)
+
+                        # Read-only view: handlers share the payload, never copy it
+                        event_data = MappingProxyType(body.get("data", {}))
 
                         logger.info(f"Received event: {event_type}")
 
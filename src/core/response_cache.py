@@ -0,0 +1,43 @@
+"""
+This module provides a small in-process LRU cache for pre-encoded response
+payloads. Callers include a data version in the key, so entries written
+before a database change are simply never hit again and age out.
+
+Author: Peyman Khodabandehlouei
+"""
+
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+
+class ResponseCache:
+    """Bounded least-recently-used cache keyed by hashable tuples"""
+
+    def __init__(self, max_size: int = 128):
+        self._max_size = max_size
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """Return the cached value for key, or None on a miss"""
+        if key not in self._entries:
+            return None
+        self._entries.move_to_end(key)
+        return self._entries[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Store value under key, evicting the least recently used entry"""
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: Hashable) -> None:
+        """Drop the entry for key, if any"""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop all cached entries"""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -0,0 +1,55 @@
+"""
+This module provides a minimal saga runner for multi-document writes.
+
+MongoDB transactions need a replica set, so workflows that touch several
+collections run as a sequence of steps instead. If a step fails, the steps
+that already succeeded are compensated in reverse order and the original
+error is re-raised.
+
+Author: Peyman Khodabandehlouei
+"""
+
+import logging
+from typing import Any, Awaitable, Callable, NamedTuple, Sequence
+
+logger = logging.getLogger(__name__)
+
+
+class SagaStep(NamedTuple):
+    """One saga step: the action and the action that undoes it."""
+
+    name: str
+    action: Callable[[], Awaitable[Any]]
+    compensation: Callable[[], Awaitable[Any]]
+
+
+async def run_saga(steps: Sequence[SagaStep]) -> None:
+    """
+    Run saga steps in order, compensating completed steps on failure.
+
+    Compensation errors are logged and do not mask the original failure.
+
+    Args:
+        steps (Sequence[SagaStep]): Steps to run in order.
+
+    Raises:
+        Exception: Whatever the failing step raised.
+    """
+    completed = []
+    for step in steps:
+        try:
+            await step.action()
+        except Exception as e:
+            logger.error("Saga step '%s' failed: %s", step.name, e)
+            for done in reversed(completed):
+                try:
+                    await done.compensation()
+                    logger.info("Compensated saga step '%s'", done.name)
+                except Exception as comp_error:
+                    logger.error(
+                        "Failed to compensate saga step '%s': %s",
+                        done.name,
+                        comp_error,
+                    )
+            raise
+        completed.append(step)
@@ -37,6 +37,15 @@ class Branch:
         TypeError: If any employee is not an instance of Employee class.
     """
 
+    __slots__ = (
+        "__id",
+        "__name",
+        "__city",
+        "__address",
+        "__phone_number",
+        "__employees",
+    )
+
     def __init__(
         self,
         name: str,
@@ -6,7 +6,8 @@ Author: Peyman Khodabandehlouei
 Date: 09-11-2025
 """
 
-from typing import List, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterator, List, TYPE_CHECKING
 from domain.notification import NotificationManagerInterface
 
 
@@ -18,19 +19,67 @@ class ConcreteNotificationManager(NotificationManagerInterface):
     """Concrete Subject. It manages subscribers"""
 
     def __init__(self):
-        self._subscribers: List["Subscriber"] = []
+        # Insertion-ordered dict keyed by subscriber: attach, detach and
+        # membership are O(1) and notify() keeps the attach order. Values are
+        # the bound update methods, resolved once at attach time
+        self._subscribers: Dict["Subscriber", Callable[..., Any]] = {}
+        self._buffer: List[Any] = []
+        self._buffer_depth = 0
+        self._notify_pending = False
 
     @property
     def subscribers(self) -> List["Subscriber"]:
-        return self._subscribers.copy()
+        return list(self._subscribers)
 
     def attach(self, subscriber: "Subscriber"):
-        self._subscribers.append(subscriber)
+        self._subscribers[subscriber] = subscriber.update
 
     def detach(self, subscriber: "Subscriber"):
-        if subscriber in self._subscribers:
-            self._subscribers.remove(subscriber)
+        self._subscribers.pop(subscriber, None)
 
     def notify(self):
-        for subscriber in self._subscribers:
-            subscriber.update(self)
+        if self._buffer_depth:
+            self._notify_pending = True
+            return
+        for update in list(self._subscribers.values()):
+            update(self)
+
+    def enqueue(self, event: Any):
+        """Buffer an event for the next flush (not part of the interface)"""
+        self._buffer.append(event)
+
+    def flush(self):
+        """Notify all subscribers once about every buffered event"""
+        # Each subscriber is called once with the whole batch instead of
+        # once per event
+        if not self._buffer:
+            return
+        events, self._buffer = tuple(self._buffer), []
+        for update in list(self._subscribers.values()):
+            update(self, events)
+
+    @contextmanager
+    def buffered(self) -> Iterator[None]:
+        """
+        Coalesce notifications sent inside the block.
+
+        Any number of notify() calls inside the block result in a single
+        notify() when the outermost block exits, followed by one flush()
+        of the events enqueued meanwhile. If the outermost block raises,
+        nothing is dispatched: the pending notification is dropped and
+        enqueued events stay buffered.
+        """
+        self._buffer_depth += 1
+        try:
+            yield
+        finally:
+            self._buffer_depth -= 1
+            pending = self._notify_pending and not self._buffer_depth
+            if not self._buffer_depth:
+                self._notify_pending = False
+
+        # Only the outermost block dispatches
+        if not self._buffer_depth:
+            if pending:
+                self.notify()
+            self.flush()
@@ -6,7 +6,7 @@ Author: Peyman Khodabandehlouei
 Date: 09-11-2025
 """
 
-from typing import TYPE_CHECKING
+from typing import Any, Optional, Tuple, TYPE_CHECKING
 
 from domain.notification import Subscriber
 
@@ -17,12 +17,26 @@ if TYPE_CHECKING:
 class CustomerSubscriber(Subscriber):
     """Concrete Subscriber. It notifies students about new assignments"""
 
-    def update(self, subject: "NotificationManagerInterface") -> str:
+    # Subscribers hold no state, so instances need no __dict__
+    __slots__ = ()
+
+    def update(
+        self,
+        subject: "NotificationManagerInterface",
+        events: Optional[Tuple[Any, ...]] = None,
+    ) -> str:
         return "Notification sent to the customer"
 
 
 class AgentSubscriber(Subscriber):
     """Concrete Subscriber. It notifies students about new assignments"""
 
-    def update(self, subject: "NotificationManagerInterface") -> str:
+    # Subscribers hold no state, so instances need no __dict__
+    __slots__ = ()
+
+    def update(
+        self,
+        subject: "NotificationManagerInterface",
+        events: Optional[Tuple[Any, ...]] = None,
+    ) -> str:
         return "Notification sent to the agent"
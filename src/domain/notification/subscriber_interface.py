@@ -8,7 +8,7 @@ Date: 09-11-2025
 """
 
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING
+from typing import Any, Optional, Tuple, TYPE_CHECKING
 
 
 if TYPE_CHECKING:
@@ -18,7 +18,14 @@ if TYPE_CHECKING:
 class Subscriber(ABC):
     """Abstract Subscriber Interface"""
 
+    # Empty slots, so stateless subscribers can also do without __dict__
+    __slots__ = ()
+
     @abstractmethod
-    def update(self, subject: "NotificationManagerInterface"):
-        """Update state and notify"""
+    def update(
+        self,
+        subject: "NotificationManagerInterface",
+        events: Optional[Tuple[Any, ...]] = None,
+    ):
+        """Update state and notify (events is the batch passed by flush)"""
         pass
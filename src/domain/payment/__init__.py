@@ -1,14 +1,14 @@
 """
 This module provides public API for Payment domain including PaymentInterface,
-PaymentFactoryInterface, CreditcardPayment, PayPalPayment, CreditCardPaymentCreator,
-and PaypalPaymentCreator.
+PaymentFactoryInterface, PaymentResult, CreditcardPayment, PayPalPayment,
+CreditCardPaymentCreator, and PaypalPaymentCreator.
 
 Author: Peyman Khodabandehlouei
 """
 
 # Import modules
 from domain.payment.product_interface import PaymentInterface
-from domain.payment.factory_interface import PaymentFactoryInterface
+from domain.payment.factory_interface import PaymentFactoryInterface, PaymentResult
 from domain.payment.concrete_products import CreditcardPayment, PayPalPayment
 from domain.payment.concrete_factories import (
     CreditCardPaymentCreator,
@@ -19,6 +19,7 @@ from domain.payment.concrete_factories import (
 __all__ = [
     "PayPalPayment",
     "PaymentInterface",
+    "PaymentResult",
     "CreditcardPayment",
     "PaypalPaymentCreator",
     "PaymentFactoryInterface",
@@ -6,13 +6,22 @@ Author: Peyman Khodabandehlouei
 Date: 08-11-2025
 """
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, NamedTuple
 from abc import ABC, abstractmethod
 
+from schemas.domain import PaymentStatus
+
 if TYPE_CHECKING:
     from domain.payment import PaymentInterface
 
 
+class PaymentResult(NamedTuple):
+    """Outcome of a payment execution: status and the receipt text"""
+
+    status: PaymentStatus
+    receipt: str
+
+
 class PaymentFactoryInterface(ABC):
     """This class is an abstract implementation of application's payment factory"""
 
@@ -21,7 +30,7 @@ class PaymentFactoryInterface(ABC):
         """Factory method to return a payment object"""
         pass
 
-    def execute_payment(self, amount: float) -> str:
+    def execute_payment(self, amount: float) -> PaymentResult:
         """Main business logic for payment execution"""
         # Create payment service
         payment_service = self.create_payment_product()
@@ -33,7 +42,11 @@ class PaymentFactoryInterface(ABC):
             # Execute payment
             payment_service.process_payment(amount)
             # Generate and return receipt
-            return payment_service.generate_receipt(amount, True)
+            return PaymentResult(
+                PaymentStatus.SUCCESS, payment_service.generate_receipt(amount, True)
+            )
         else:
             # Generate and return receipt
-            return payment_service.generate_receipt(amount, False)
+            return PaymentResult(
+                PaymentStatus.FAILED, payment_service.generate_receipt(amount, False)
+            )
@@ -36,6 +36,15 @@ class Invoice:
         ValueError: If price_per_day is negative.
     """
 
+    __slots__ = (
+        "__id",
+        "__creator",
+        "__reservation",
+        "__total_price",
+        "__date",
+        "__status",
+    )
+
     def __init__(
         self,
         creator: "Customer",
@@ -54,6 +54,23 @@ class Reservation:
         ValueError: If dates violate business constraints (pickup_date > return_date or in the past).
     """
 
+    __slots__ = (
+        "_clock",
+        "__id",
+        "__status",
+        "__creator",
+        "__vehicle",
+        "__insurance_tier",
+        "__pickup_branch",
+        "__return_branch",
+        "__pricing_strategy",
+        "__pickup_date",
+        "__return_date",
+        "__add_ons",
+        "__total_price",
+        "__invoice",
+    )
+
     def __init__(
         self,
         status: ReservationStatus,
@@ -38,6 +38,8 @@ class Agent(Employee):
         user_id (Optional[str]): ID of the employee.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         first_name: str,
@@ -35,6 +35,17 @@ class BaseUser(ABC):
         user_id: (Optional[str]) User id of the person.
     """
 
+    __slots__ = (
+        "__id",
+        "__first_name",
+        "__last_name",
+        "__gender",
+        "__birth_date",
+        "__email",
+        "__address",
+        "__phone_number",
+    )
+
     def __init__(
         self,
         first_name: str,
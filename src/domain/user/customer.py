@@ -14,7 +14,13 @@ from datetime import date
 from typing import Any, Optional, List, TYPE_CHECKING
 
 from domain.user import BaseUser
-from schemas.domain import Gender, ReservationStatus, VehicleStatus, InvoiceStatus
+from schemas.domain import (
+    Gender,
+    ReservationStatus,
+    VehicleStatus,
+    InvoiceStatus,
+    PaymentStatus,
+)
 from core import (
     VehicleNotAvailableError,
     ReservationNotFoundError,
@@ -49,6 +55,11 @@ class Customer(BaseUser):
         user_id (Optional[str]): ID of the customer.
     """
 
+    __slots__ = (
+        "__reservations",
+        "__rentals",
+    )
+
     def __init__(
         self,
         first_name: str,
@@ -465,16 +476,16 @@ class Customer(BaseUser):
         )
 
         # Execute payment
-        receipt = credit_card_payment_service.execute_payment(reservation.total_price)
+        result = credit_card_payment_service.execute_payment(reservation.total_price)
 
         # Change invoice status
-        if "successful" in receipt:
+        if result.status is PaymentStatus.SUCCESS:
             reservation.invoice.payment_completed()
 
         else:
             reservation.invoice.payment_failed()
 
-        return receipt
+        return result.receipt
 
     @staticmethod
     def make_paypal_payment(reservation: "Reservation", email: str, auth_token: str):
@@ -507,16 +518,16 @@ class Customer(BaseUser):
         )
 
         # Execute payment
-        receipt = credit_card_payment_service.execute_payment(reservation.total_price)
+        result = credit_card_payment_service.execute_payment(reservation.total_price)
 
         # Change invoice status
-        if "successful" in receipt:
+        if result.status is PaymentStatus.SUCCESS:
             reservation.invoice.payment_completed()
 
         else:
             reservation.invoice.payment_failed()
 
-        return receipt
+        return result.receipt
 
     def get_role(self) -> str:
         """Returns role of the user in the application"""
@@ -41,6 +41,14 @@ class Employee(BaseUser, ABC):
         user_id (Optional[str]): ID of the employee.
     """
 
+    __slots__ = (
+        "__branch",
+        "__is_active",
+        "__salary",
+        "__hire_date",
+        "__employment_type",
+    )
+
     def __init__(
         self,
         first_name: str,
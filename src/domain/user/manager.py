@@ -37,6 +37,8 @@ class Manager(Employee):
         user_id (Optional[str]): ID of the manager.
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         first_name: str,
@@ -49,6 +49,22 @@ class Vehicle:
             than last_service_odometer, or price_per_day is less than vehicle_class.base_daily_rate.
     """
 
+    __slots__ = (
+        "__id",
+        "__vehicle_class",
+        "__current_branch",
+        "__status",
+        "__brand",
+        "__model",
+        "__color",
+        "__licence_plate",
+        "__fuel_level",
+        "__odometer",
+        "__last_service_odometer",
+        "__price_per_day",
+        "__maintenance_records",
+    )
+
     def __init__(
         self,
         vehicle_class: "VehicleClass",
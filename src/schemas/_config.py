@@ -0,0 +1,39 @@
+"""
+Shared Pydantic model configurations.
+
+Models reuse these ConfigDict instances instead of declaring
+near-identical literals per class. Models that need extra settings
+(e.g. json_schema_extra) extend them with ConfigDict(**BASE, ...).
+
+Author: Peyman Khodabandehlouei
+"""
+
+from pydantic import ConfigDict
+
+
+# MongoDB document models: built once, written to the database, never mutated.
+# Validators are built on first use (or by warm_document_models at startup)
+DB_CONFIG = ConfigDict(
+    defer_build=True,
+    populate_by_name=True,
+    from_attributes=True,
+    frozen=True,
+    extra="ignore",
+    validate_assignment=False,
+    str_strip_whitespace=False,
+    revalidate_instances="never",
+    ser_json_bytes="base64",
+    ser_json_timedelta="iso8601",
+)
+
+# Write-once documents that services build field by field: unknown keys
+# are a bug, so reject them instead of collecting and discarding them
+DB_CLOSED_CONFIG: ConfigDict = {**DB_CONFIG, "extra": "forbid"}
+
+# API response models
+RESP_CONFIG = ConfigDict(
+    from_attributes=True,
+    extra="ignore",
+    ser_json_bytes="base64",
+    ser_json_timedelta="iso8601",
+)
@@ -9,6 +9,7 @@ from schemas.api.common import (
     ErrorResponse,
     SuccessResponse,
     SuccessResponseWithPayload,
+    encode_success_payload,
 )
 
 
@@ -18,4 +19,5 @@ __all__ = [
     "ErrorResponse",
     "SuccessResponse",
     "SuccessResponseWithPayload",
+    "encode_success_payload",
 ]
@@ -10,7 +10,8 @@ Date: 05-01-2026
 
 from datetime import timezone, datetime
 from typing import Optional, List, Any, Dict
-from pydantic import BaseModel, Field, ConfigDict
+
+from pydantic import BaseModel, Field, ConfigDict, TypeAdapter
 
 
 class ErrorDetail(BaseModel):
@@ -110,3 +111,33 @@ class SuccessResponseWithPayload(BaseModel):
             }
         }
     )
+
+
+# Serializes timestamps exactly like the timestamp field above ("...Z")
+_TIMESTAMP_ADAPTER = TypeAdapter(datetime)
+
+
+def encode_success_payload(message_json: bytes, data_json: bytes) -> bytes:
+    """
+    Assemble a SuccessResponseWithPayload JSON body from pre-serialized parts.
+
+    Produces the same shape as SuccessResponseWithPayload without building
+    the wrapper model, so routes can splice constant message bytes and an
+    already serialized payload together.
+
+    Args:
+        message_json (bytes): JSON-encoded message string.
+        data_json (bytes): JSON-encoded data object.
+
+    Returns:
+        bytes: Complete response body.
+    """
+    return (
+        b'{"success":true,"message":'
+        + message_json
+        + b',"data":'
+        + data_json
+        + b',"timestamp":'
+        + _TIMESTAMP_ADAPTER.dump_json(datetime.now(timezone.utc))
+        + b"}"
+    )
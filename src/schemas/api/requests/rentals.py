@@ -9,8 +9,8 @@ Date: 13-01-2026
 """
 
 from datetime import date, datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Annotated, Optional
+from pydantic import BaseModel, Field, StringConstraints, field_validator
 
 
 class PickupVehicleRequest(BaseModel):
@@ -45,9 +45,11 @@ class PickupVehicleRequest(BaseModel):
 
     agent_id: str = Field(..., min_length=1, description="Agent processing the pickup")
 
-    pickup_token: str = Field(
+    # Stripped before the length check, so whitespace-only tokens are rejected
+    pickup_token: Annotated[
+        str, StringConstraints(strip_whitespace=True, min_length=1)
+    ] = Field(
         ...,
-        min_length=1,
         description="Unique idempotency token (prevents duplicate pickups on retry)",
     )
 
@@ -63,30 +65,6 @@ class PickupVehicleRequest(BaseModel):
         None, description="Pickup timestamp (defaults to current time if not provided)"
     )
 
-    @field_validator("odometer_reading")
-    @classmethod
-    def validate_odometer(cls, v: float) -> float:
-        """Validate odometer reading is positive"""
-        if v <= 0:
-            raise ValueError("Odometer reading must be greater than 0")
-        return v
-
-    @field_validator("fuel_level")
-    @classmethod
-    def validate_fuel_level(cls, v: float) -> float:
-        """Validate fuel level is between 0 and 1"""
-        if not 0 <= v <= 1:
-            raise ValueError("Fuel level must be between 0.0 (empty) and 1.0 (full)")
-        return v
-
-    @field_validator("pickup_token")
-    @classmethod
-    def validate_token_not_empty(cls, v: str) -> str:
-        """Validate pickup token is not empty or whitespace"""
-        if not v.strip():
-            raise ValueError("pickup_token cannot be empty or whitespace")
-        return v.strip()
-
     class Config:
         json_schema_extra = {
             "example": {
@@ -151,30 +129,12 @@ class ReturnVehicleRequest(BaseModel):
         None, description="Return timestamp (defaults to current time if not provided)"
     )
 
-    @field_validator("odometer_reading")
-    @classmethod
-    def validate_odometer(cls, v: float) -> float:
-        """Validate odometer reading is positive"""
-        if v <= 0:
-            raise ValueError("Odometer reading must be greater than 0")
-        return v
-
-    @field_validator("fuel_level")
-    @classmethod
-    def validate_fuel_level(cls, v: float) -> float:
-        """Validate fuel level is between 0 and 1"""
-        if not 0 <= v <= 1:
-            raise ValueError("Fuel level must be between 0.0 (empty) and 1.0 (full)")
-        return v
-
     @field_validator("damage_charge")
     @classmethod
     def validate_damage_charge(cls, v: Optional[float]) -> float:
-        """Validate damage charge is non-negative"""
+        """Treat an explicit null damage charge as no charge (ge=0 is on the Field)"""
         if v is None:
             return 0.0
-        if v < 0:
-            raise ValueError("Damage charge cannot be negative")
         return v
 
     class Config:
@@ -251,6 +211,12 @@ class RentalFilterRequest(BaseModel):
         None, description="Filter by associated reservation ID"
     )
 
+    skip: int = Field(0, ge=0, description="Number of rentals to skip (list only)")
+
+    limit: Optional[int] = Field(
+        None, ge=1, description="Maximum number of rentals to return (list only)"
+    )
+
     class Config:
         json_schema_extra = {
             "example": {
@@ -142,6 +142,8 @@ class ReservationFilterRequest(BaseModel):
         status (Optional[ReservationStatus]): Filter by status.
         pickup_date_from (Optional[date]): Filter pickups after this date.
         pickup_date_to (Optional[date]): Filter pickups before this date.
+        skip (int): Number of reservations to skip.
+        limit (Optional[int]): Maximum number of reservations to return.
     """
 
     customer_id: Optional[str] = Field(None, description="Filter by customer")
@@ -149,6 +151,10 @@ class ReservationFilterRequest(BaseModel):
     status: Optional[ReservationStatus] = Field(None, description="Filter by status")
     pickup_date_from: Optional[date] = Field(None, description="Pickup date from")
     pickup_date_to: Optional[date] = Field(None, description="Pickup date to")
+    skip: int = Field(0, ge=0, description="Number of reservations to skip")
+    limit: Optional[int] = Field(
+        None, ge=1, description="Maximum number of reservations to return"
+    )
 
     model_config = {
         "json_schema_extra": {
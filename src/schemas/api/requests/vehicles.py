@@ -133,6 +133,8 @@ class VehicleFilterRequest(BaseModel):
         max_price (Optional[float]): Maximum price per day.
         available_from (Optional[date]): Check availability from date.
         available_to (Optional[date]): Check availability until date.
+        skip (int): Number of vehicles to skip.
+        limit (Optional[int]): Maximum number of vehicles to return.
     """
 
     vehicle_class: Optional[VehicleClassType] = Field(
@@ -144,6 +146,10 @@ class VehicleFilterRequest(BaseModel):
     max_price: Optional[float] = Field(None, ge=0, description="Maximum price")
     available_from: Optional[date] = Field(None, description="Available from date")
     available_to: Optional[date] = Field(None, description="Available until date")
+    skip: int = Field(0, ge=0, description="Number of vehicles to skip")
+    limit: Optional[int] = Field(
+        None, ge=1, description="Maximum number of vehicles to return"
+    )
 
     @field_validator("max_price")
     @classmethod
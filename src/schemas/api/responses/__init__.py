@@ -36,8 +36,10 @@ from schemas.api.responses.payments import PaymentData
 from schemas.api.responses.rentals import (
     RentalReadingData,
     RentalChargesData,
-    RentalData,
+    RentalSummaryData,
+    RentalDetailData,
     RentalListData,
+    RentalChargesSummaryData,
     PickupSuccessData,
     ReturnSuccessData,
 )
@@ -70,8 +72,10 @@ __all__ = [
     # rental schemas
     "RentalReadingData",
     "RentalChargesData",
-    "RentalData",
+    "RentalSummaryData",
+    "RentalDetailData",
     "RentalListData",
+    "RentalChargesSummaryData",
     "PickupSuccessData",
     "ReturnSuccessData",
 ]
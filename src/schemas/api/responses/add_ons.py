@@ -7,10 +7,11 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
-from datetime import datetime
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
 
 class AddOnData(BaseModel):
     """
@@ -27,19 +28,19 @@ class AddOnData(BaseModel):
         name (str): Add-on name.
         description (str): Add-on description.
         price_per_day (float): Daily rental price.
-        created_at (datetime): When add-on was created.
-        updated_at (datetime): Last update timestamp.
+        created_at (str): When add-on was created.
+        updated_at (str): Last update timestamp.
     """
 
     id: str = Field(..., description="Unique add-on identifier")
     name: str = Field(..., description="Add-on name")
     description: str = Field(..., description="Description")
     price_per_day: float = Field(..., description="Daily price")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "addon-uuid-123",
@@ -69,6 +70,7 @@ class AddOnListData(BaseModel):
     total_count: int = Field(..., description="Total add-ons count")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "add_ons": [
@@ -83,5 +85,5 @@ class AddOnListData(BaseModel):
                 ],
                 "total_count": 1,
             }
-        }
+        },
     )
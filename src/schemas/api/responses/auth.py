@@ -11,6 +11,8 @@ Date: 05-01-2026
 from datetime import date, datetime
 from pydantic import BaseModel, Field, EmailStr, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
 
 class CustomerData(BaseModel):
     """
@@ -45,7 +47,7 @@ class CustomerData(BaseModel):
     created_at: datetime = Field(..., description="Account creation timestamp")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "550e8400-e29b-41d4-a716-446655440000",
@@ -102,7 +104,7 @@ class EmployeeData(BaseModel):
     created_at: datetime = Field(..., description="Account creation timestamp")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "660e9500-f39c-51e5-b827-557766551111",
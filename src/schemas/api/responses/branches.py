@@ -7,10 +7,11 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
-from datetime import datetime
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
 
 class BranchData(BaseModel):
     """
@@ -29,8 +30,8 @@ class BranchData(BaseModel):
         address (str): Full street address.
         phone_number (str): Contact phone number.
         employee_count (int): Number of employees at this branch.
-        created_at (datetime): When branch was created.
-        updated_at (datetime): Last update timestamp.
+        created_at (str): When branch was created.
+        updated_at (str): Last update timestamp.
     """
 
     id: str = Field(..., description="Unique branch identifier")
@@ -39,11 +40,11 @@ class BranchData(BaseModel):
     address: str = Field(..., description="Address")
     phone_number: str = Field(..., description="Phone number")
     employee_count: int = Field(..., description="Number of employees")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "branch-uuid-123",
@@ -75,6 +76,7 @@ class BranchListData(BaseModel):
     total_count: int = Field(..., description="Total branches count")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "branches": [
@@ -91,5 +93,5 @@ class BranchListData(BaseModel):
                 ],
                 "total_count": 1,
             }
-        }
+        },
     )
@@ -7,10 +7,11 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
-from datetime import datetime
 from typing import List
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
 
 class InsuranceTierData(BaseModel):
     """
@@ -27,19 +28,19 @@ class InsuranceTierData(BaseModel):
         tier_name (str): Tier name.
         description (str): Coverage description.
         price_per_day (float): Daily insurance price.
-        created_at (datetime): When tier was created.
-        updated_at (datetime): Last update timestamp.
+        created_at (str): When tier was created.
+        updated_at (str): Last update timestamp.
     """
 
     id: str = Field(..., description="Unique tier identifier")
     tier_name: str = Field(..., description="Tier name")
     description: str = Field(..., description="Coverage description")
     price_per_day: float = Field(..., description="Daily price")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "tier-uuid-123",
@@ -69,6 +70,7 @@ class InsuranceTierListData(BaseModel):
     total_count: int = Field(..., description="Total tiers count")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "insurance_tiers": [
@@ -83,5 +85,5 @@ class InsuranceTierListData(BaseModel):
                 ],
                 "total_count": 1,
             }
-        }
+        },
     )
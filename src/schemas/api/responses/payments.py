@@ -5,20 +5,31 @@ Author: Peyman Khodabandehlouei
 Date: 06-01-2026
 """
 
+from typing import Annotated
+
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
+# Pre-serialized JSON for the "Payment <status>" messages, keyed by status
+PAYMENT_MESSAGE_BYTES = {
+    status: orjson.dumps(f"Payment {status}") for status in ("completed", "failed")
+}
+
 
 class PaymentData(BaseModel):
     """Payment processing result."""
 
     reservation_id: str = Field(..., description="Reservation ID")
     invoice_id: str = Field(..., description="Invoice ID")
-    amount: float = Field(..., description="Payment amount")
+    amount: Annotated[float, Field(strict=True, description="Payment amount")]
     payment_method: str = Field(..., description="Payment method used")
     status: str = Field(..., description="Payment status (completed/failed)")
     receipt: str = Field(..., description="Payment receipt message")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "reservation_id": "reservation-uuid-123",
@@ -28,5 +39,5 @@ class PaymentData(BaseModel):
                 "status": "completed",
                 "receipt": "Payment of $252.00 with card ending with 0366 was successful",
             }
-        }
+        },
     )
@@ -8,9 +8,26 @@ Author: Peyman Khodabandehlouei
 Date: 13-01-2026
 """
 
-from datetime import datetime
-from typing import Optional, List
-from pydantic import BaseModel, Field, computed_field
+from typing import Annotated, Optional, List
+
+import orjson
+from pydantic import BaseModel, Field, ConfigDict, computed_field
+
+from schemas._config import RESP_CONFIG
+
+# Success messages
+PICKUP_SUCCESS_MESSAGE = "Vehicle picked up successfully"
+PICKUP_IDEMPOTENT_MESSAGE = "Vehicle already picked up (idempotent operation)"
+RETURN_SUCCESS_MESSAGE = "Vehicle returned successfully"
+
+# Pre-serialized JSON for the constant messages, spliced into response bodies
+PICKUP_MESSAGE_BYTES = {
+    PICKUP_SUCCESS_MESSAGE: orjson.dumps(PICKUP_SUCCESS_MESSAGE),
+    PICKUP_IDEMPOTENT_MESSAGE: orjson.dumps(PICKUP_IDEMPOTENT_MESSAGE),
+}
+RETURN_MESSAGE_PREFIX_BYTES = (
+    b'"' + RETURN_SUCCESS_MESSAGE.encode() + b". Total charges: $"
+)
 
 
 class RentalReadingData(BaseModel):
@@ -20,18 +37,24 @@ class RentalReadingData(BaseModel):
     Represents odometer and fuel level snapshot at a specific timestamp.
     """
 
-    odometer: float = Field(..., description="Odometer reading in kilometers")
-    fuel_level: float = Field(..., description="Fuel level (0.0 to 1.0)")
-    timestamp: datetime = Field(..., description="When the reading was taken")
-
-    class Config:
-        json_schema_extra = {
+    odometer: Annotated[
+        float, Field(strict=True, description="Odometer reading in kilometers")
+    ]
+    fuel_level: Annotated[
+        float, Field(strict=True, description="Fuel level (0.0 to 1.0)")
+    ]
+    timestamp: str = Field(..., description="When the reading was taken (ISO 8601)")
+
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "odometer": 45000.5,
                 "fuel_level": 1.0,
                 "timestamp": "2026-01-13T14:30:00+03:00",
             }
-        }
+        },
+    )
 
 
 class RentalChargesData(BaseModel):
@@ -49,11 +72,17 @@ class RentalChargesData(BaseModel):
         - total: Sum of all charges
     """
 
-    base_price: float = Field(..., description="Base reservation price")
-    late_fee: float = Field(..., description="Late return fee")
-    mileage_overage_fee: float = Field(..., description="Mileage overage charge")
-    fuel_refill_fee: float = Field(..., description="Fuel refill charge")
-    damage_fee: float = Field(..., description="Damage assessment")
+    base_price: Annotated[
+        float, Field(strict=True, description="Base reservation price")
+    ]
+    late_fee: Annotated[float, Field(strict=True, description="Late return fee")]
+    mileage_overage_fee: Annotated[
+        float, Field(strict=True, description="Mileage overage charge")
+    ]
+    fuel_refill_fee: Annotated[
+        float, Field(strict=True, description="Fuel refill charge")
+    ]
+    damage_fee: Annotated[float, Field(strict=True, description="Damage assessment")]
 
     @computed_field
     @property
@@ -67,8 +96,9 @@ class RentalChargesData(BaseModel):
             + self.damage_fee
         )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "base_price": 450.0,
                 "late_fee": 30.0,
@@ -77,15 +107,16 @@ class RentalChargesData(BaseModel):
                 "damage_fee": 150.0,
                 "total": 667.5,
             }
-        }
+        },
+    )
 
 
-class RentalData(BaseModel):
+class RentalSummaryData(BaseModel):
     """
-    Response model for rental details.
+    Response model for a rental without its return-time subtrees.
 
-    Represents a complete rental record with all associated data.
-    Returned by GET /api/v1/rentals/{rental_id} and pickup/return operations.
+    Used for list results so the list schema carries no optional nested
+    models. Returned by GET /api/v1/rentals.
     """
 
     id: str = Field(..., description="Rental unique identifier")
@@ -99,6 +130,43 @@ class RentalData(BaseModel):
     pickup_readings: RentalReadingData = Field(
         ..., description="Odometer/fuel at pickup"
     )
+
+    created_at: str = Field(
+        ..., description="When rental was created (pickup time, ISO 8601)"
+    )
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
+
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
+            "example": {
+                "id": "rental-001",
+                "status": "active",
+                "reservation_id": "res-123",
+                "vehicle_id": "vehicle-456",
+                "customer_id": "customer-789",
+                "agent_id": "agent-abc",
+                "pickup_token": "pickup-001-1704892800",
+                "pickup_readings": {
+                    "odometer": 45000.5,
+                    "fuel_level": 1.0,
+                    "timestamp": "2026-01-13T14:30:00+03:00",
+                },
+                "created_at": "2026-01-13T14:30:00+03:00",
+                "updated_at": "2026-01-13T14:30:00+03:00",
+            }
+        },
+    )
+
+
+class RentalDetailData(RentalSummaryData):
+    """
+    Response model for rental details.
+
+    Represents a complete rental record with all associated data.
+    Returned by GET /api/v1/rentals/{rental_id} and pickup/return operations.
+    """
+
     return_readings: Optional[RentalReadingData] = Field(
         None, description="Odometer/fuel at return"
     )
@@ -107,13 +175,9 @@ class RentalData(BaseModel):
         None, description="Itemized charges (available after return)"
     )
 
-    created_at: datetime = Field(
-        ..., description="When rental was created (pickup time)"
-    )
-    updated_at: datetime = Field(..., description="Last update timestamp")
-
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "id": "rental-550e8400-e29b-41d4-a716-446655440000",
                 "status": "completed",
@@ -143,7 +207,8 @@ class RentalData(BaseModel):
                 "created_at": "2026-01-13T14:30:00+03:00",
                 "updated_at": "2026-01-15T16:45:00+03:00",
             }
-        }
+        },
+    )
 
 
 class RentalListData(BaseModel):
@@ -154,13 +219,14 @@ class RentalListData(BaseModel):
     Contains array of rentals and total count.
     """
 
-    rentals: List[RentalData] = Field(..., description="List of rental records")
+    rentals: List[RentalSummaryData] = Field(..., description="List of rental records")
     total_count: int = Field(
         ..., description="Total number of rentals matching filters"
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "rentals": [
                     {
@@ -176,15 +242,40 @@ class RentalListData(BaseModel):
                             "fuel_level": 1.0,
                             "timestamp": "2026-01-13T14:30:00+03:00",
                         },
-                        "return_readings": None,
-                        "charges": None,
                         "created_at": "2026-01-13T14:30:00+03:00",
                         "updated_at": "2026-01-13T14:30:00+03:00",
                     }
                 ],
                 "total_count": 1,
             }
-        }
+        },
+    )
+
+
+class RentalChargesSummaryData(BaseModel):
+    """
+    Response model for aggregated rental charges.
+
+    Returned by GET /api/v1/rentals/charges/summary with optional filters.
+    Only rentals that have been returned (and therefore charged) count.
+    """
+
+    total_charges: float = Field(
+        ..., description="Sum of charges across matching rentals"
+    )
+    charged_rentals: int = Field(
+        ..., description="Number of matching rentals with charges"
+    )
+
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
+            "example": {
+                "total_charges": 1842.5,
+                "charged_rentals": 12,
+            }
+        },
+    )
 
 
 class PickupSuccessData(BaseModel):
@@ -195,14 +286,15 @@ class PickupSuccessData(BaseModel):
     Includes rental details and confirmation message.
     """
 
-    rental: RentalData = Field(..., description="Created rental record")
+    rental: RentalDetailData = Field(..., description="Created rental record")
     message: str = Field(
-        default="Vehicle picked up successfully",
+        default=PICKUP_SUCCESS_MESSAGE,
         description="Success confirmation message",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "rental": {
                     "id": "rental-550e8400",
@@ -224,7 +316,8 @@ class PickupSuccessData(BaseModel):
                 },
                 "message": "Vehicle picked up successfully",
             }
-        }
+        },
+    )
 
 
 class ReturnSuccessData(BaseModel):
@@ -235,14 +328,17 @@ class ReturnSuccessData(BaseModel):
     Includes updated rental with calculated charges and summary.
     """
 
-    rental: RentalData = Field(..., description="Completed rental record with charges")
+    rental: RentalDetailData = Field(
+        ..., description="Completed rental record with charges"
+    )
     message: str = Field(
-        default="Vehicle returned successfully",
+        default=RETURN_SUCCESS_MESSAGE,
         description="Success confirmation message",
     )
 
-    class Config:
-        json_schema_extra = {
+    model_config = ConfigDict(
+        **RESP_CONFIG,
+        json_schema_extra={
             "example": {
                 "rental": {
                     "id": "rental-550e8400",
@@ -275,4 +371,5 @@ class ReturnSuccessData(BaseModel):
                 },
                 "message": "Vehicle returned successfully. Total charges: $667.50",
             }
-        }
+        },
+    )
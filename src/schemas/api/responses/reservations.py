@@ -7,10 +7,16 @@ Author: Peyman Khodabandehlouei
 Date: 06-01-2026
 """
 
-from datetime import datetime, date
 from typing import List
+
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
+# Pre-serialized JSON for the single-reservation success message
+RESERVATION_RETRIEVED_MESSAGE_BYTES = orjson.dumps("Reservation retrieved successfully")
+
 
 class ReservationAddOnData(BaseModel):
     """
@@ -27,7 +33,7 @@ class ReservationAddOnData(BaseModel):
     price_per_day: float = Field(..., description="Daily price")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "addon-uuid-123",
@@ -43,11 +49,11 @@ class InvoiceData(BaseModel):
 
     id: str = Field(..., description="Invoice ID")
     status: str = Field(..., description="Invoice status (pending/completed/failed)")
-    issued_date: date = Field(..., description="Invoice date")
+    issued_date: str = Field(..., description="Invoice date (ISO 8601)")
     total_price: float = Field(..., description="Invoice total price")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "invoice-uuid-abc",
@@ -77,13 +83,13 @@ class ReservationData(BaseModel):
         insurance_tier_id (str): Insurance tier ID.
         pickup_branch_id (str): Pickup branch ID.
         return_branch_id (str): Return branch ID.
-        pickup_date (date): Pickup date.
-        return_date (date): Return date.
+        pickup_date (str): Pickup date.
+        return_date (str): Return date.
         add_ons (List[ReservationAddOnData]): List of add-ons with details.
         total_price (float): Calculated total price (vehicle + insurance + add-ons).
         rental_days (int): Number of rental days.
-        created_at (datetime): When reservation was created.
-        updated_at (datetime): Last update timestamp.
+        created_at (str): When reservation was created.
+        updated_at (str): Last update timestamp.
     """
 
     id: str = Field(..., description="Reservation ID")
@@ -93,17 +99,17 @@ class ReservationData(BaseModel):
     insurance_tier_id: str = Field(..., description="Insurance tier ID")
     pickup_branch_id: str = Field(..., description="Pickup branch ID")
     return_branch_id: str = Field(..., description="Return branch ID")
-    pickup_date: date = Field(..., description="Pickup date")
-    return_date: date = Field(..., description="Return date")
+    pickup_date: str = Field(..., description="Pickup date (ISO 8601)")
+    return_date: str = Field(..., description="Return date (ISO 8601)")
     add_ons: List[ReservationAddOnData] = Field(..., description="Add-ons list")
     total_price: float = Field(..., description="Total price")
     rental_days: int = Field(..., description="Number of rental days")
     invoice: InvoiceData = Field(..., description="Invoice information")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "id": "reservation-uuid-123",
@@ -157,6 +163,7 @@ class ReservationListData(BaseModel):
     total_count: int = Field(..., description="Total reservations count")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
         json_schema_extra={
             "example": {
                 "reservations": [
@@ -179,5 +186,5 @@ class ReservationListData(BaseModel):
                 ],
                 "total_count": 1,
             }
-        }
+        },
     )
@@ -7,10 +7,19 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
-from typing import List
-from datetime import datetime
+from typing import Annotated, List
+
+import orjson
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import RESP_CONFIG
+
+# Pre-serialized JSON for the single-vehicle success messages, keyed by action
+VEHICLE_MESSAGE_BYTES = {
+    action: orjson.dumps(f"Vehicle {action} successfully")
+    for action in ("created", "retrieved", "updated")
+}
+
 
 class VehicleData(BaseModel):
     """
@@ -33,8 +42,8 @@ class VehicleData(BaseModel):
         mileage (float): Current odometer reading.
         branch_id (str): Branch location.
         status (str): Current status.
-        created_at (datetime): When vehicle was added.
-        updated_at (datetime): Last update timestamp.
+        created_at (str): When vehicle was added.
+        updated_at (str): Last update timestamp.
     """
 
     id: str = Field(..., description="Unique vehicle identifier")
@@ -43,15 +52,16 @@ class VehicleData(BaseModel):
     model: str = Field(..., description="Vehicle model")
     year: int = Field(..., description="Manufacturing year")
     vehicle_class: str = Field(..., description="Vehicle class")
-    price_per_day: float = Field(..., description="Daily rental rate")
-    mileage: float = Field(..., description="Odometer reading (km)")
+    price_per_day: Annotated[float, Field(strict=True, description="Daily rental rate")]
+    mileage: Annotated[float, Field(strict=True, description="Odometer reading (km)")]
     branch_id: str = Field(..., description="Branch ID")
     status: str = Field(..., description="Vehicle status")
-    created_at: datetime = Field(..., description="Creation timestamp")
-    updated_at: datetime = Field(..., description="Last update timestamp")
+    created_at: str = Field(..., description="Creation timestamp (ISO 8601)")
+    updated_at: str = Field(..., description="Last update timestamp (ISO 8601)")
 
     model_config = ConfigDict(
-        from_attributes=True,
+        **RESP_CONFIG,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "id": "vehicle-uuid-123",
@@ -87,6 +97,8 @@ class VehicleListData(BaseModel):
     total_count: int = Field(..., description="Total vehicles count")
 
     model_config = ConfigDict(
+        **RESP_CONFIG,
+        frozen=True,
         json_schema_extra={
             "example": {
                 "vehicles": [
@@ -107,5 +119,5 @@ class VehicleListData(BaseModel):
                 ],
                 "total_count": 1,
             }
-        }
+        },
     )
@@ -1,45 +1,113 @@
 """
 This module provides public API for db_models.
+
+Document models are imported lazily (PEP 562) so that importing one
+document does not pull in every schema module.
+
 Author: Peyman Khodabandehlouei
 """
 
-# Import auth schemas
-from schemas.db_models.auth_models import CustomerDocument, EmployeeDocument
+import importlib
+from typing import Any, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    # Import auth schemas
+    from schemas.db_models.auth_models import CustomerDocument, EmployeeDocument
+
+    # Import vehicles schemas
+    from schemas.db_models.vehicle_models import VehicleDocument, VEHICLE_DOC_ADAPTER
+
+    # Import branch schemas
+    from schemas.db_models.branch_models import BranchDocument
+
+    # Import add-on schemas
+    from schemas.db_models.add_on_models import AddOnDocument
+
+    # Import insurance tier schemas
+    from schemas.db_models.insurance_tier_models import InsuranceTierDocument
+
+    # Import reservation schemas
+    from schemas.db_models.reservation_models import (
+        ReservationAddOnDocument,
+        ReservationDocument,
+        InvoiceDocument,
+        RESERVATION_DOC_ADAPTER,
+    )
+
+    # Import rental schemas
+    from schemas.db_models.rental_models import (
+        RentalReadingDocument,
+        RentalChargesDocument,
+        RentalDocument,
+        RENTAL_DOC_ADAPTER,
+    )
+
+
+# Map of public name -> defining module
+_LAZY = {
+    # auth schemas
+    "CustomerDocument": "auth_models",
+    "EmployeeDocument": "auth_models",
+    # vehicle schemas
+    "VehicleDocument": "vehicle_models",
+    "VEHICLE_DOC_ADAPTER": "vehicle_models",
+    # branch schemas
+    "BranchDocument": "branch_models",
+    # add-on schemas
+    "AddOnDocument": "add_on_models",
+    # insurance tier schemas
+    "InsuranceTierDocument": "insurance_tier_models",
+    # reservation schemas
+    "ReservationAddOnDocument": "reservation_models",
+    "ReservationDocument": "reservation_models",
+    "InvoiceDocument": "reservation_models",
+    "RESERVATION_DOC_ADAPTER": "reservation_models",
+    # rental schemas
+    "RentalReadingDocument": "rental_models",
+    "RentalChargesDocument": "rental_models",
+    "RentalDocument": "rental_models",
+    "RENTAL_DOC_ADAPTER": "rental_models",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import a document model on first access and cache it on the package"""
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-# Import vehicles schemas
-from schemas.db_models.vehicle_models import VehicleDocument
+    module = importlib.import_module(f"{__name__}.{_LAZY[name]}")
+    value = getattr(module, name)
+    globals()[name] = value
+    return value
 
-# Import branch schemas
-from schemas.db_models.branch_models import BranchDocument
 
-# Import add-on schemas
-from schemas.db_models.add_on_models import AddOnDocument
+def __dir__() -> list:
+    return sorted(list(globals()) + list(_LAZY))
 
-# Import insurance tier schemas
-from schemas.db_models.insurance_tier_models import InsuranceTierDocument
 
-# Import reservation schemas
-from schemas.db_models.reservation_models import (
-    ReservationAddOnDocument,
-    ReservationDocument,
-    InvoiceDocument,
-)
+def warm_document_models() -> None:
+    """
+    Build validators for every document model that deferred its build.
 
-# Import rental schemas
-from schemas.db_models.rental_models import (
-    RentalReadingDocument,
-    RentalChargesDocument,
-    RentalDocument,
-)
+    Document models use defer_build, so the first request touching each
+    one would otherwise pay for schema construction. Call this during
+    application startup (it is synchronous; run it in a worker thread).
+    """
+    for name in _LAZY:
+        value = __getattr__(name)
+        if isinstance(value, type) and not value.__pydantic_complete__:
+            value.model_rebuild(force=True)
 
 
 # Public API
 __all__ = [
+    "warm_document_models",
     # auth schemas
     "CustomerDocument",
     "EmployeeDocument",
     # vehicle schemas
     "VehicleDocument",
+    "VEHICLE_DOC_ADAPTER",
     # branch schemas
     "BranchDocument",
     # add-on schemas
@@ -50,8 +118,10 @@ __all__ = [
     "ReservationAddOnDocument",
     "ReservationDocument",
     "InvoiceDocument",
+    "RESERVATION_DOC_ADAPTER",
     # rental schemas
     "RentalReadingDocument",
     "RentalChargesDocument",
     "RentalDocument",
+    "RENTAL_DOC_ADAPTER",
 ]
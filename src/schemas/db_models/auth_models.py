@@ -11,6 +11,8 @@ from typing import Optional
 from datetime import date, datetime
 from pydantic import BaseModel, Field
 
+from schemas._config import DB_CONFIG
+
 
 class CustomerDocument(BaseModel):
     """
@@ -46,6 +48,8 @@ class CustomerDocument(BaseModel):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
+    model_config = DB_CONFIG
+
 
 class EmployeeDocument(BaseModel):
     """
@@ -86,3 +90,5 @@ class EmployeeDocument(BaseModel):
     branch_id: str
     created_at: datetime
     updated_at: Optional[datetime] = None
+
+    model_config = DB_CONFIG
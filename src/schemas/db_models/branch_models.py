@@ -5,9 +5,13 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
+import uuid
 from datetime import datetime
-from typing import List
-from pydantic import BaseModel, Field
+from typing import Any, List, Union
+from pydantic import BaseModel, Field, field_validator
+
+from core.exceptions import InvalidEmployeeIdError
+from schemas._config import DB_CONFIG
 
 
 class BranchDocument(BaseModel):
@@ -16,13 +20,20 @@ class BranchDocument(BaseModel):
 
     Collection: branches
 
+    Employee IDs are stored as an array of 16-byte binary UUIDs instead of
+    32-character hex strings. Keeping one array element per employee lets
+    MongoDB add and remove IDs atomically with $addToSet and $pull, and
+    counting employees needs no decoding at all.
+
     Attributes:
         id (str): MongoDB document ID (branch ID).
         name (str): Branch name.
         city (str): City where branch is located.
         address (str): Full street address.
         phone_number (str): Contact phone number.
-        employee_ids (List[str]): List of employee IDs working at this branch.
+        packed_employee_ids (List[Union[bytes, str]]): Employee UUIDs as 16
+            raw bytes each (stored under the "employee_ids" key). IDs of
+            older employees are kept as the original strings.
         created_at (datetime): When branch was created.
         updated_at (datetime): Last modification timestamp.
     """
@@ -32,8 +43,68 @@ class BranchDocument(BaseModel):
     city: str
     address: str
     phone_number: str
-    employee_ids: List[str] = Field(
-        default_factory=list, description="Employee IDs at this branch"
+    packed_employee_ids: List[Union[bytes, str]] = Field(
+        default_factory=list,
+        alias="employee_ids",
+        description="Employee IDs at this branch, 16 bytes per UUID",
     )
     created_at: datetime
     updated_at: datetime
+
+    model_config = DB_CONFIG
+
+    @field_validator("packed_employee_ids", mode="before")
+    @classmethod
+    def validate_packed_employee_ids(cls, value: Any) -> Any:
+        """Pack hex UUID strings; other legacy values are kept as stored"""
+        if isinstance(value, (list, tuple)):
+            return [cls._stored_if_valid(employee_id) for employee_id in value]
+        return value
+
+    @classmethod
+    def _stored_if_valid(cls, employee_id: Any) -> Any:
+        """Convert one ID to its stored form, leaving invalid values as is"""
+        if not isinstance(employee_id, str):
+            return employee_id
+        try:
+            return cls.stored_employee_id(employee_id)
+        except InvalidEmployeeIdError:
+            return employee_id
+
+    @property
+    def employee_ids(self) -> List[str]:
+        """Decode the stored employee IDs into employee _id strings"""
+        return [
+            self.unpack_employee_id(employee_id)
+            for employee_id in self.packed_employee_ids
+        ]
+
+    @property
+    def employee_count(self) -> int:
+        """Number of employees at this branch"""
+        return len(self.packed_employee_ids)
+
+    @staticmethod
+    def stored_employee_id(employee_id: str) -> Union[bytes, str]:
+        """
+        Convert an employee ID to the form kept in employee_ids.
+
+        Employee _ids are uuid4().hex strings, which are packed into their
+        16 raw bytes. Older employees have dashed UUID _ids; those are kept
+        as strings so they still match the employee after decoding.
+
+        Raises:
+            InvalidEmployeeIdError: If the ID is not a valid UUID.
+        """
+        try:
+            parsed = uuid.UUID(employee_id)
+        except (TypeError, ValueError, AttributeError):
+            raise InvalidEmployeeIdError(employee_id) from None
+        return parsed.bytes if parsed.hex == employee_id else employee_id
+
+    @staticmethod
+    def unpack_employee_id(stored: Union[bytes, str]) -> str:
+        """Decode one stored ID (packed bytes decode to the hex form)"""
+        if isinstance(stored, str):
+            return stored
+        return uuid.UUID(bytes=bytes(stored)).hex
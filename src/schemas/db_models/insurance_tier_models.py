@@ -6,8 +6,11 @@ Date: 05-01-2026
 """
 
 from datetime import datetime
+from typing import Annotated
 from pydantic import BaseModel, Field, ConfigDict
 
+from schemas._config import DB_CONFIG
+
 
 class InsuranceTierDocument(BaseModel):
     """
@@ -27,12 +30,12 @@ class InsuranceTierDocument(BaseModel):
     id: str = Field(..., alias="_id", description="Tier unique identifier")
     tier_name: str
     description: str
-    price_per_day: float
+    price_per_day: Annotated[float, Field(strict=True)]
     created_at: datetime
     updated_at: datetime
 
     model_config = ConfigDict(
-        populate_by_name=True,
+        **DB_CONFIG,
         json_schema_extra={
             "indexes": [
                 {"keys": [("tier_name", 1)]},
@@ -9,8 +9,10 @@ Date: 13-01-2026
 """
 
 from datetime import datetime
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator
+from typing import Literal, Optional
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+from schemas._config import DB_CONFIG, DB_CLOSED_CONFIG
 
 
 class RentalReadingDocument(BaseModel):
@@ -26,21 +28,7 @@ class RentalReadingDocument(BaseModel):
     )
     timestamp: datetime = Field(..., description="When the reading was taken")
 
-    @field_validator("odometer")
-    @classmethod
-    def validate_odometer(cls, v: float) -> float:
-        """Validate odometer is non-negative"""
-        if v < 0:
-            raise ValueError("Odometer reading cannot be negative")
-        return v
-
-    @field_validator("fuel_level")
-    @classmethod
-    def validate_fuel_level(cls, v: float) -> float:
-        """Validate fuel level is between 0 and 1"""
-        if not 0 <= v <= 1:
-            raise ValueError("Fuel level must be between 0.0 and 1.0")
-        return v
+    model_config = DB_CLOSED_CONFIG
 
 
 class RentalChargesDocument(BaseModel):
@@ -70,26 +58,26 @@ class RentalChargesDocument(BaseModel):
     )
     damage_fee: float = Field(default=0.0, ge=0, description="Manual damage assessment")
 
-    @property
-    def total(self) -> float:
-        """Calculate total charges (sum of all fees)"""
-        return (
+    total: float = Field(
+        default=0.0, ge=0, description="Sum of all charges (set on construction)"
+    )
+
+    model_config = DB_CLOSED_CONFIG
+
+    @model_validator(mode="after")
+    def compute_total(self) -> "RentalChargesDocument":
+        """Calculate total charges (sum of all fees) once and store it"""
+        # The model is frozen, so bypass __setattr__ during construction
+        object.__setattr__(
+            self,
+            "total",
             self.base_price
             + self.late_fee
             + self.mileage_overage_fee
             + self.fuel_refill_fee
-            + self.damage_fee
+            + self.damage_fee,
         )
-
-    @field_validator(
-        "base_price", "late_fee", "mileage_overage_fee", "fuel_refill_fee", "damage_fee"
-    )
-    @classmethod
-    def validate_non_negative(cls, v: float) -> float:
-        """Ensure all charges are non-negative"""
-        if v < 0:
-            raise ValueError("Charge amount cannot be negative")
-        return v
+        return self
 
 
 class RentalDocument(BaseModel):
@@ -114,12 +102,20 @@ class RentalDocument(BaseModel):
     """
 
     id: str = Field(..., alias="_id", description="Rental unique identifier (UUID)")
-    status: str = Field(..., description="Rental status (active/completed)")
+    status: Literal["active", "completed"] = Field(
+        ..., description="Rental status (active/completed)"
+    )
     reservation_id: str = Field(..., description="Associated reservation ID")
     vehicle_id: str = Field(..., description="Assigned vehicle ID")
     customer_id: str = Field(..., description="Customer ID")
     agent_id: str = Field(..., description="Agent who processed pickup")
-    pickup_token: str = Field(..., description="Unique token for idempotent pickup")
+    # Stored as sent (it is matched verbatim on retry); blank tokens are rejected
+    pickup_token: str = Field(
+        ...,
+        min_length=1,
+        pattern=r"\S",
+        description="Unique token for idempotent pickup",
+    )
 
     pickup_readings: RentalReadingDocument = Field(
         ..., description="Odometer/fuel at pickup"
@@ -137,27 +133,8 @@ class RentalDocument(BaseModel):
     )
     updated_at: datetime = Field(..., description="Last update timestamp")
 
-    class Config:
-        """Pydantic model configuration"""
-
-        populate_by_name = True
-        json_encoders = {
-            datetime: lambda v: v.isoformat(),
-        }
-
-    @field_validator("status")
-    @classmethod
-    def validate_status(cls, v: str) -> str:
-        """Validate status is one of allowed values"""
-        allowed_statuses = ["active", "completed"]
-        if v not in allowed_statuses:
-            raise ValueError(f"Status must be one of: {allowed_statuses}")
-        return v
-
-    @field_validator("pickup_token")
-    @classmethod
-    def validate_pickup_token(cls, v: str) -> str:
-        """Validate pickup token is not empty"""
-        if not v or not v.strip():
-            raise ValueError("Pickup token cannot be empty")
-        return v
+    model_config = DB_CONFIG
+
+
+# Reusable validator for building RentalDocument instances from plain dicts
+RENTAL_DOC_ADAPTER = TypeAdapter(RentalDocument)
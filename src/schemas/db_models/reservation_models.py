@@ -7,7 +7,10 @@ Date: 06-01-2026
 
 from datetime import datetime, date
 from typing import List
-from pydantic import BaseModel, Field, ConfigDict
+from pydantic import BaseModel, Field, TypeAdapter, computed_field
+
+from schemas._config import DB_CONFIG, DB_CLOSED_CONFIG
+from schemas.domain.enums import ReservationStatus
 
 
 class ReservationAddOnDocument(BaseModel):
@@ -27,7 +30,7 @@ class ReservationAddOnDocument(BaseModel):
     name: str
     price_per_day: float
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = DB_CLOSED_CONFIG
 
 
 class InvoiceDocument(BaseModel):
@@ -38,17 +41,17 @@ class InvoiceDocument(BaseModel):
 
     Attributes:
         id (str): Invoice unique identifier.
-        status (str): Payment status (pending/completed/failed).
+        status (str): Payment status (pending/processing/completed/failed).
         issued_date (date): Invoice creation date.
         total_price (float): Invoice amount (same as reservation total).
     """
 
     id: str
-    status: str  # pending/completed/failed
+    status: str  # pending/processing/completed/failed
     issued_date: date
     total_price: float
 
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = DB_CONFIG
 
 
 class ReservationDocument(BaseModel):
@@ -62,7 +65,7 @@ class ReservationDocument(BaseModel):
 
     Attributes:
         _id (str): MongoDB document ID (reservation ID).
-        status (str): Reservation status (pending/confirmed/cancelled/completed).
+        status (ReservationStatus): Reservation status (pending/approved/picked_up/cancelled/completed).
         customer_id (str): ID of customer who made reservation (FK to customers).
         vehicle_id (str): ID of reserved vehicle (FK to vehicles).
         insurance_tier_id (str): ID of insurance tier (FK to insurance_tiers).
@@ -71,14 +74,17 @@ class ReservationDocument(BaseModel):
         pickup_date (date): Date when vehicle will be picked up.
         return_date (date): Date when vehicle will be returned.
         add_ons (List[ReservationAddOnDocument]): List of add-ons with snapshot pricing.
+        add_ons_json (str): Pre-serialized JSON of add_ons, written alongside it so
+            read paths can emit the add-ons without re-encoding them.
         total_price (float): Calculated total price (vehicle + insurance + add-ons × days).
-        rental_days (int): Number of rental days (return_date - pickup_date).
+        rental_days (int): Number of rental days (return_date - pickup_date),
+            derived from the dates and not stored.
         created_at (datetime): When reservation was created.
         updated_at (datetime): Last modification timestamp.
     """
 
     id: str = Field(..., alias="_id", description="Reservation unique identifier")
-    status: str
+    status: ReservationStatus
     customer_id: str
     vehicle_id: str
     insurance_tier_id: str
@@ -87,8 +93,20 @@ class ReservationDocument(BaseModel):
     pickup_date: date
     return_date: date
     add_ons: List[ReservationAddOnDocument] = Field(default_factory=list)
+    add_ons_json: str = "[]"
     total_price: float
-    rental_days: int
     invoice: InvoiceDocument
     created_at: datetime
     updated_at: datetime
+
+    model_config = DB_CONFIG
+
+    @computed_field
+    @property
+    def rental_days(self) -> int:
+        """Number of rental days (return_date - pickup_date)"""
+        return (self.return_date - self.pickup_date).days
+
+
+# Reusable validator for building ReservationDocument instances from plain dicts
+RESERVATION_DOC_ADAPTER = TypeAdapter(ReservationDocument)
@@ -6,7 +6,11 @@ Date: 05-01-2026
 """
 
 from datetime import datetime
-from pydantic import BaseModel, Field
+from typing import Literal
+from pydantic import BaseModel, Field, TypeAdapter
+
+from schemas._config import DB_CLOSED_CONFIG
+from schemas.domain.enums import VehicleStatus
 
 
 class VehicleDocument(BaseModel):
@@ -21,11 +25,11 @@ class VehicleDocument(BaseModel):
         brand (str): Vehicle brand.
         model (str): Vehicle model.
         year (int): Manufacturing year.
-        vehicle_class (str): Class category (economy/standard/luxury/suv).
+        vehicle_class (str): Class category (economy/compact/suv).
         price_per_day (float): Daily rental rate.
         mileage (float): Current odometer reading in kilometers.
         branch_id (str): Branch where vehicle is located (indexed).
-        status (str): Vehicle status (available/reserved/rented/maintenance).
+        status (VehicleStatus): Vehicle status (available/reserved/picked_up/out_of_service).
         created_at (datetime): When vehicle was added to the system.
         updated_at (datetime): Last modification timestamp.
     """
@@ -35,10 +39,16 @@ class VehicleDocument(BaseModel):
     brand: str
     model: str
     year: int
-    vehicle_class: str
+    vehicle_class: Literal["economy", "compact", "suv"]
     price_per_day: float
     mileage: float
     branch_id: str
-    status: str
+    status: VehicleStatus
     created_at: datetime
     updated_at: datetime
+
+    model_config = DB_CLOSED_CONFIG
+
+
+# Reusable validator for building VehicleDocument instances from plain dicts
+VEHICLE_DOC_ADAPTER = TypeAdapter(VehicleDocument)
@@ -6,7 +6,23 @@ Author: Peyman Khodabandehlouei
 
 # Import modules
 from schemas.domain.schemas import RentalCharges, RentalReading
-from schemas.domain.events import DomainEvent, EventTypes
+from schemas.domain.events import (
+    DomainEvent,
+    EventTypes,
+    RESERVATION_CONFIRMED,
+    RESERVATION_MODIFIED,
+    RESERVATION_CANCELLED,
+    RESERVATION_APPROVED,
+    PICKUP_COMPLETED,
+    RETURN_COMPLETED,
+    RENTAL_EXTENDED,
+    OVERDUE_RETURN_DETECTED,
+    INVOICE_PAID,
+    INVOICE_PAYMENT_FAILED,
+    DEPOSIT_AUTHORIZED,
+    DEPOSIT_CAPTURED,
+    NOTIFICATION_REQUIRED,
+)
 from schemas.domain.enums import (
     Gender,
     EmploymentType,
@@ -14,6 +30,7 @@ from schemas.domain.enums import (
     ReservationStatus,
     InvoiceStatus,
     RentalStatus,
+    PaymentStatus,
 )
 
 
@@ -27,6 +44,20 @@ __all__ = [
     "RentalCharges",
     "RentalReading",
     "RentalStatus",
+    "PaymentStatus",
     "DomainEvent",
     "EventTypes",
+    "RESERVATION_CONFIRMED",
+    "RESERVATION_MODIFIED",
+    "RESERVATION_CANCELLED",
+    "RESERVATION_APPROVED",
+    "PICKUP_COMPLETED",
+    "RETURN_COMPLETED",
+    "RENTAL_EXTENDED",
+    "OVERDUE_RETURN_DETECTED",
+    "INVOICE_PAID",
+    "INVOICE_PAYMENT_FAILED",
+    "DEPOSIT_AUTHORIZED",
+    "DEPOSIT_CAPTURED",
+    "NOTIFICATION_REQUIRED",
 ]
@@ -8,14 +8,14 @@ Date: 07-11-2025
 from enum import Enum
 
 
-class Gender(Enum):
+class Gender(str, Enum):
     """Gender enumeration."""
 
     MALE = "male"
     FEMALE = "female"
 
 
-class EmploymentType(Enum):
+class EmploymentType(str, Enum):
     """Employment type enumeration."""
 
     FULL_TIME = "full_time"
@@ -23,7 +23,7 @@ class EmploymentType(Enum):
     CONTRACT = "contract"
 
 
-class VehicleStatus(Enum):
+class VehicleStatus(str, Enum):
     """Employment type enumeration."""
 
     AVAILABLE = "available"
@@ -32,7 +32,7 @@ class VehicleStatus(Enum):
     OUT_OF_SERVICE = "out_of_service"
 
 
-class ReservationStatus(Enum):
+class ReservationStatus(str, Enum):
     """reservation status type enumeration."""
 
     PENDING = "pending"
@@ -42,16 +42,24 @@ class ReservationStatus(Enum):
     COMPLETED = "completed"
 
 
-class InvoiceStatus(Enum):
+class InvoiceStatus(str, Enum):
     """Invoice status type enumeration."""
 
     PENDING = "pending"
+    PROCESSING = "processing"
     COMPLETED = "completed"
     FAILED = "failed"
 
 
-class RentalStatus(Enum):
+class RentalStatus(str, Enum):
     """Rental status enumeration."""
 
     ACTIVE = "active"
     COMPLETED = "completed"
+
+
+class PaymentStatus(str, Enum):
+    """Payment outcome enumeration."""
+
+    SUCCESS = "success"
+    FAILED = "failed"
@@ -7,36 +7,61 @@ Author: Peyman Khodabandehlouei
 Date: 13-01-2026
 """
 
-from typing import Dict, Any
+import sys
+from typing import Any, Final, Mapping, NamedTuple
 
 
-class DomainEvent:
-    """Base class for domain events (optional, for type hints)."""
+class DomainEvent(NamedTuple):
+    """Domain event record (event type plus payload), tuple-backed with no __dict__."""
 
     event_type: str
-    data: Dict[str, Any]
+    data: Mapping[str, Any]
+
+
+# Event type constants (interned so dispatch-table lookups compare by identity)
+
+# Reservation events
+RESERVATION_CONFIRMED: Final[str] = sys.intern("reservation.confirmed")
+RESERVATION_MODIFIED: Final[str] = sys.intern("reservation.modified")
+RESERVATION_CANCELLED: Final[str] = sys.intern("reservation.cancelled")
+RESERVATION_APPROVED: Final[str] = sys.intern("reservation.approved")
+
+# Rental events
+PICKUP_COMPLETED: Final[str] = sys.intern("rental.pickup_completed")
+RETURN_COMPLETED: Final[str] = sys.intern("rental.return_completed")
+RENTAL_EXTENDED: Final[str] = sys.intern("rental.extended")
+OVERDUE_RETURN_DETECTED: Final[str] = sys.intern("rental.overdue_detected")
+
+# Payment events
+INVOICE_PAID: Final[str] = sys.intern("invoice.paid")
+INVOICE_PAYMENT_FAILED: Final[str] = sys.intern("invoice.payment_failed")
+DEPOSIT_AUTHORIZED: Final[str] = sys.intern("deposit.authorized")
+DEPOSIT_CAPTURED: Final[str] = sys.intern("deposit.captured")
+
+# Notification events
+NOTIFICATION_REQUIRED: Final[str] = sys.intern("notification.required")
 
 
 class EventTypes:
-    """Domain event type constants."""
+    """Domain event type constants (namespace over the module-level names)."""
 
     # Reservation events
-    RESERVATION_CONFIRMED = "reservation.confirmed"
-    RESERVATION_MODIFIED = "reservation.modified"
-    RESERVATION_CANCELLED = "reservation.cancelled"
-    RESERVATION_APPROVED = "reservation.approved"
+    RESERVATION_CONFIRMED = RESERVATION_CONFIRMED
+    RESERVATION_MODIFIED = RESERVATION_MODIFIED
+    RESERVATION_CANCELLED = RESERVATION_CANCELLED
+    RESERVATION_APPROVED = RESERVATION_APPROVED
 
     # Rental events
-    PICKUP_COMPLETED = "rental.pickup_completed"
-    RETURN_COMPLETED = "rental.return_completed"
-    RENTAL_EXTENDED = "rental.extended"
-    OVERDUE_RETURN_DETECTED = "rental.overdue_detected"
+    PICKUP_COMPLETED = PICKUP_COMPLETED
+    RETURN_COMPLETED = RETURN_COMPLETED
+    RENTAL_EXTENDED = RENTAL_EXTENDED
+    OVERDUE_RETURN_DETECTED = OVERDUE_RETURN_DETECTED
 
     # Payment events
-    INVOICE_PAID = "invoice.paid"
-    INVOICE_PAYMENT_FAILED = "invoice.payment_failed"
-    DEPOSIT_AUTHORIZED = "deposit.authorized"
-    DEPOSIT_CAPTURED = "deposit.captured"
+    INVOICE_PAID = INVOICE_PAID
+    INVOICE_PAYMENT_FAILED = INVOICE_PAYMENT_FAILED
+    DEPOSIT_AUTHORIZED = DEPOSIT_AUTHORIZED
+    DEPOSIT_CAPTURED = DEPOSIT_CAPTURED
 
     # Notification events
-    NOTIFICATION_REQUIRED = "notification.required"
+    NOTIFICATION_REQUIRED = NOTIFICATION_REQUIRED
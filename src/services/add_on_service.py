@@ -10,8 +10,11 @@ Date: 05-01-2026
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import List, Optional
 
+from pydantic import TypeAdapter
+
+from core.clock_service import to_iso_string
 from core.database_manager import db_manager
 from schemas.db_models.add_on_models import AddOnDocument
 from schemas.api.requests import (
@@ -22,6 +25,12 @@ from schemas.api.responses import AddOnData, AddOnListData
 
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference for timestamps (skips the attribute lookup)
+_UTC = timezone.utc
+
+# Validates a whole page of add-ons in one call instead of one model per row
+_ADD_ON_LIST_ADAPTER = TypeAdapter(List[AddOnData])
+
 
 class AddOnService:
     """
@@ -43,7 +52,7 @@ class AddOnService:
         """
         # Generate add-on ID
         add_on_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        current_time = datetime.now(_UTC)
 
         # Create database document
         add_on_doc = AddOnDocument(
@@ -63,14 +72,14 @@ class AddOnService:
             logger.error(f"Failed to create add-on: {e}")
             raise
 
-        # Return response data
-        return AddOnData(
+        # Return response data (values were validated by the request and document)
+        return AddOnData.model_construct(
             id=add_on_id,
             name=request.name,
             description=request.description,
             price_per_day=request.price_per_day,
-            created_at=current_time,
-            updated_at=current_time,
+            created_at=to_iso_string(current_time),
+            updated_at=to_iso_string(current_time),
         )
 
     @staticmethod
@@ -91,13 +100,14 @@ class AddOnService:
             return None
 
         # Convert MongoDB document to response model
-        return AddOnData(
+        # DB data is trusted (validated on write), so skip re-validation
+        return AddOnData.model_construct(
             id=add_on_doc["_id"],
             name=add_on_doc["name"],
             description=add_on_doc["description"],
             price_per_day=add_on_doc["price_per_day"],
-            created_at=add_on_doc["created_at"],
-            updated_at=add_on_doc["updated_at"],
+            created_at=to_iso_string(add_on_doc["created_at"]),
+            updated_at=to_iso_string(add_on_doc["updated_at"]),
         )
 
     @staticmethod
@@ -179,22 +189,24 @@ class AddOnService:
         # Query database
         add_on_docs = await db_manager.find_add_ons()
 
-        # Convert to response models
-        add_ons = [
-            AddOnData(
-                id=doc["_id"],
-                name=doc["name"],
-                description=doc["description"],
-                price_per_day=doc["price_per_day"],
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-            )
-            for doc in add_on_docs
-        ]
+        # Convert to response models in a single batch validation
+        add_ons = _ADD_ON_LIST_ADAPTER.validate_python(
+            [
+                {
+                    "id": doc["_id"],
+                    "name": doc["name"],
+                    "description": doc["description"],
+                    "price_per_day": doc["price_per_day"],
+                    "created_at": to_iso_string(doc["created_at"]),
+                    "updated_at": to_iso_string(doc["updated_at"]),
+                }
+                for doc in add_on_docs
+            ]
+        )
 
         logger.info(f"Retrieved {len(add_ons)} add-ons")
 
-        return AddOnListData(add_ons=add_ons, total_count=len(add_ons))
+        return AddOnListData.model_construct(add_ons=add_ons, total_count=len(add_ons))
 
 
 # Singleton instance
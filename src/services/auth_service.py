@@ -10,7 +10,7 @@ Date: 05-01-2026
 
 import uuid
 import logging
-from typing import List
+from typing import List, Union
 from datetime import datetime, timezone
 from pymongo.errors import DuplicateKeyError
 
@@ -27,6 +27,9 @@ from schemas.api.requests.auth import (
 
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference for timestamps (skips the attribute lookup)
+_UTC = timezone.utc
+
 
 class AuthService:
     """
@@ -49,17 +52,9 @@ class AuthService:
         Raises:
             DuplicateEmailError: If email already exists in the database.
         """
-        # Check if email already exists
-        existing_customer = await db_manager.find_customer_by_email(request.email)
-        if existing_customer:
-            logger.warning(
-                f"Registration attempt with duplicate email: {request.email}"
-            )
-            raise DuplicateEmailError(email=request.email)
-
         # Generate customer ID
-        customer_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        customer_id = uuid.uuid4().hex
+        current_time = datetime.now(_UTC)
 
         # Create database document
         customer_doc = CustomerDocument(
@@ -77,16 +72,16 @@ class AuthService:
             updated_at=current_time,
         )
 
-        # Save to the database
+        # Save to the database (the unique email index rejects duplicates)
         try:
             await db_manager.create_customer(customer_doc)
-            logger.info(f"Successfully registered customer: {customer_id}")
+            logger.info("Successfully registered customer: %s", customer_id)
         except DuplicateKeyError:
-            logger.error(f"Duplicate key error for email: {request.email}")
+            logger.error("Duplicate key error for email: %s", request.email)
             raise DuplicateEmailError(email=request.email)
 
-        # Return response data
-        return CustomerData(
+        # Return response data (values were validated by the request and document)
+        return CustomerData.model_construct(
             id=customer_id,
             first_name=request.first_name,
             last_name=request.last_name,
@@ -100,34 +95,31 @@ class AuthService:
         )
 
     @staticmethod
-    async def register_agent(request: AgentRegistrationRequest) -> EmployeeData:
+    async def _register_employee(
+        request: Union[AgentRegistrationRequest, ManagerRegistrationRequest],
+        role: str,
+    ) -> EmployeeData:
         """
-        Register a new agent.
+        Register a new employee with the given role.
 
         Args:
-            request (AgentRegistrationRequest): Validated agent registration data.
+            request (Union[AgentRegistrationRequest, ManagerRegistrationRequest]):
+                Validated employee registration data.
+            role (str): Employee role ("agent" or "manager").
 
         Returns:
-            EmployeeData: Created agent data for response.
+            EmployeeData: Created employee data for response.
 
         Raises:
-            DuplicateEmailError: If email already exists in database.
+            DuplicateEmailError: If email already exists in the database.
         """
-        # Check if email already exists
-        existing_employee = await db_manager.find_employee_by_email(request.email)
-        if existing_employee:
-            logger.warning(
-                f"Registration attempt with duplicate email: {request.email}"
-            )
-            raise DuplicateEmailError(email=request.email)
-
-        # Generate agent ID
-        agent_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        # Generate employee ID
+        employee_id = uuid.uuid4().hex
+        current_time = datetime.now(_UTC)
 
         # Create database document
         employee_doc = EmployeeDocument(
-            _id=agent_id,
+            _id=employee_id,
             first_name=request.first_name,
             last_name=request.last_name,
             gender=request.gender.value,
@@ -136,24 +128,24 @@ class AuthService:
             phone_number=request.phone_number,
             address=request.address,
             password_hash=request.password,
-            role="agent",
+            role=role,
             employment_type=request.employment_type.value,
             salary=request.salary,
             branch_id=request.branch_id,
             created_at=current_time,
         )
 
-        # Save to the database
+        # Save to the database (the unique email index rejects duplicates)
         try:
             await db_manager.create_employee(employee_doc)
-            logger.info(f"Successfully registered agent: {agent_id}")
+            logger.info("Successfully registered %s: %s", role, employee_id)
         except DuplicateKeyError:
-            logger.error(f"Duplicate key error for email: {request.email}")
+            logger.error("Duplicate key error for email: %s", request.email)
             raise DuplicateEmailError(email=request.email)
 
-        # Return response data
-        return EmployeeData(
-            id=agent_id,
+        # Return response data (values were validated by the request and document)
+        return EmployeeData.model_construct(
+            id=employee_id,
             first_name=request.first_name,
             last_name=request.last_name,
             gender=request.gender.value,
@@ -161,13 +153,29 @@ class AuthService:
             email=request.email,
             phone_number=request.phone_number,
             address=request.address,
-            role="agent",
+            role=role,
             employment_type=request.employment_type.value,
             salary=request.salary,
             branch_id=request.branch_id,
             created_at=current_time,
         )
 
+    @staticmethod
+    async def register_agent(request: AgentRegistrationRequest) -> EmployeeData:
+        """
+        Register a new agent.
+
+        Args:
+            request (AgentRegistrationRequest): Validated agent registration data.
+
+        Returns:
+            EmployeeData: Created agent data for response.
+
+        Raises:
+            DuplicateEmailError: If email already exists in database.
+        """
+        return await AuthService._register_employee(request, "agent")
+
     @staticmethod
     async def register_manager(request: ManagerRegistrationRequest) -> EmployeeData:
         """
@@ -182,60 +190,7 @@ class AuthService:
         Raises:
             DuplicateEmailError: If email already exists in the database.
         """
-        # Check if email already exists
-        existing_employee = await db_manager.find_employee_by_email(request.email)
-        if existing_employee:
-            logger.warning(
-                f"Registration attempt with duplicate email: {request.email}"
-            )
-            raise DuplicateEmailError(email=request.email)
-
-        # Generate manager ID
-        manager_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
-
-        # Create database document
-        employee_doc = EmployeeDocument(
-            _id=manager_id,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            gender=request.gender.value,
-            birth_date=request.birth_date,
-            email=request.email,
-            phone_number=request.phone_number,
-            address=request.address,
-            password_hash=request.password,
-            role="manager",
-            employment_type=request.employment_type.value,
-            salary=request.salary,
-            branch_id=request.branch_id,
-            created_at=current_time,
-        )
-
-        # Save to the database
-        try:
-            await db_manager.create_employee(employee_doc)
-            logger.info(f"Successfully registered manager: {manager_id}")
-        except DuplicateKeyError:
-            logger.error(f"Duplicate key error for email: {request.email}")
-            raise DuplicateEmailError(email=request.email)
-
-        # Return response data
-        return EmployeeData(
-            id=manager_id,
-            first_name=request.first_name,
-            last_name=request.last_name,
-            gender=request.gender.value,
-            birth_date=request.birth_date,
-            email=request.email,
-            phone_number=request.phone_number,
-            address=request.address,
-            role="manager",
-            employment_type=request.employment_type.value,
-            salary=request.salary,
-            branch_id=request.branch_id,
-            created_at=current_time,
-        )
+        return await AuthService._register_employee(request, "manager")
 
     @staticmethod
     async def get_all_customers() -> List[CustomerData]:
@@ -10,9 +10,11 @@ Date: 05-01-2026
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from core.clock_service import to_iso_string
 from core.database_manager import db_manager
+from core.response_cache import ResponseCache
 from schemas.db_models.branch_models import BranchDocument
 from schemas.api.responses.branches import BranchData, BranchListData
 from schemas.api.requests import CreateBranchRequest, UpdateBranchRequest
@@ -21,6 +23,34 @@ from schemas.api.requests import CreateBranchRequest, UpdateBranchRequest
 # Logger
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference for timestamps (skips the attribute lookup)
+_UTC = timezone.utc
+
+# Employee count computed by MongoDB, so the employee ID list never leaves
+# the server (packed binary IDs and legacy ID strings count the same)
+_EMPLOYEE_COUNT_EXPR = {"$size": {"$ifNull": ["$employee_ids", []]}}
+
+# Fields a branch update may set
+_UPDATABLE_FIELDS = ("name", "city", "address", "phone_number")
+
+# Fields read when building BranchData
+_RESPONSE_PROJECTION = {
+    "name": 1,
+    "city": 1,
+    "address": 1,
+    "phone_number": 1,
+    "employee_count": _EMPLOYEE_COUNT_EXPR,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+
+# List results keyed by the branches collection version (writes invalidate)
+_list_cache = ResponseCache(max_size=8)
+
+# Single-item results keyed by (id, collection version)
+_item_cache = ResponseCache(max_size=1024)
+
 
 class BranchService:
     """
@@ -41,8 +71,8 @@ class BranchService:
             BranchData: Created branch data for response.
         """
         # Generate branch ID
-        branch_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        branch_id = uuid.uuid4().hex
+        current_time = datetime.now(_UTC)
 
         # Create database document
         branch_doc = BranchDocument(
@@ -59,21 +89,44 @@ class BranchService:
         # Save to database
         try:
             await db_manager.create_branch(branch_doc)
-            logger.info(f"Successfully created branch: {branch_id}")
+            logger.info("Successfully created branch: %s", branch_id)
         except Exception as e:
-            logger.error(f"Failed to create branch: {e}")
+            logger.error("Failed to create branch: %s", e)
             raise
 
-        # Return response data
-        return BranchData(
+        # Return response data (values were validated by the request and document)
+        return BranchData.model_construct(
             id=branch_id,
             name=request.name,
             city=request.city,
             address=request.address,
             phone_number=request.phone_number,
             employee_count=0,  # No employees on creation
-            created_at=current_time,
-            updated_at=current_time,
+            created_at=to_iso_string(current_time),
+            updated_at=to_iso_string(current_time),
+        )
+
+    @staticmethod
+    def _convert_branch_doc(branch_doc: Dict[str, Any]) -> BranchData:
+        """
+        Convert a branch document read with _RESPONSE_PROJECTION to BranchData.
+
+        Args:
+            branch_doc (Dict[str, Any]): Branch document from the database.
+
+        Returns:
+            BranchData: Branch response model.
+        """
+        # DB data is trusted (validated on write), so skip re-validation
+        return BranchData.model_construct(
+            id=branch_doc["_id"],
+            name=branch_doc["name"],
+            city=branch_doc["city"],
+            address=branch_doc["address"],
+            phone_number=branch_doc["phone_number"],
+            employee_count=branch_doc["employee_count"],
+            created_at=to_iso_string(branch_doc["created_at"]),
+            updated_at=to_iso_string(branch_doc["updated_at"]),
         )
 
     @staticmethod
@@ -87,23 +140,24 @@ class BranchService:
         Returns:
             Optional[BranchData]: Branch data or None if not found.
         """
-        branch_doc = await db_manager.find_branch_by_id(branch_id)
+        cache_key = (branch_id, db_manager.collection_version("branches"))
+        cached = _item_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        branch_doc = await db_manager.find_branch_by_id(
+            branch_id, projection=_RESPONSE_PROJECTION
+        )
 
         if not branch_doc:
-            logger.info(f"Branch not found: {branch_id}")
+            logger.info("Branch not found: %s", branch_id)
             return None
 
         # Convert MongoDB document to response model
-        return BranchData(
-            id=branch_doc["_id"],
-            name=branch_doc["name"],
-            city=branch_doc["city"],
-            address=branch_doc["address"],
-            phone_number=branch_doc["phone_number"],
-            employee_count=len(branch_doc.get("employee_ids", [])),
-            created_at=branch_doc["created_at"],
-            updated_at=branch_doc["updated_at"],
-        )
+        result = BranchService._convert_branch_doc(branch_doc)
+        _item_cache.set(cache_key, result)
+
+        return result
 
     @staticmethod
     async def update_branch(
@@ -119,41 +173,35 @@ class BranchService:
         Returns:
             Optional[BranchData]: Updated branch data or None if not found.
         """
-        # Check if branch exists
-        existing_branch = await db_manager.find_branch_by_id(branch_id)
-        if not existing_branch:
-            logger.info(f"Branch not found for update: {branch_id}")
-            return None
-
         # Build update dict (only include non-None fields)
-        update_data = {}
-        if request.name is not None:
-            update_data["name"] = request.name
-        if request.city is not None:
-            update_data["city"] = request.city
-        if request.address is not None:
-            update_data["address"] = request.address
-        if request.phone_number is not None:
-            update_data["phone_number"] = request.phone_number
+        update_data = {
+            field: value
+            for field in _UPDATABLE_FIELDS
+            if (value := getattr(request, field)) is not None
+        }
 
         # If no fields to update, return current data
         if not update_data:
-            logger.info(f"No fields to update for branch: {branch_id}")
+            logger.info("No fields to update for branch: %s", branch_id)
             return await BranchService.get_branch_by_id(branch_id)
 
-        # Update in database
+        # Update in database and get the updated document back in one round trip
         try:
-            success = await db_manager.update_branch(branch_id, update_data)
-            if not success:
-                return None
-
-            logger.info(f"Successfully updated branch: {branch_id}")
+            branch_doc = await db_manager.find_and_update_branch(
+                branch_id, update_data, projection=_RESPONSE_PROJECTION
+            )
         except Exception as e:
-            logger.error(f"Failed to update branch: {e}")
+            logger.error("Failed to update branch: %s", e)
             raise
 
+        if not branch_doc:
+            logger.info("Branch not found for update: %s", branch_id)
+            return None
+
+        logger.info("Successfully updated branch: %s", branch_id)
+
         # Return updated branch data
-        return await BranchService.get_branch_by_id(branch_id)
+        return BranchService._convert_branch_doc(branch_doc)
 
     @staticmethod
     async def delete_branch(branch_id: str) -> bool:
@@ -169,9 +217,9 @@ class BranchService:
         success = await db_manager.delete_branch(branch_id)
 
         if success:
-            logger.info(f"Successfully deleted branch: {branch_id}")
+            logger.info("Successfully deleted branch: %s", branch_id)
         else:
-            logger.info(f"Branch not found for deletion: {branch_id}")
+            logger.info("Branch not found for deletion: %s", branch_id)
 
         return success
 
@@ -183,27 +231,25 @@ class BranchService:
         Returns:
             BranchListData: List of branches and total count.
         """
+        cache_key = db_manager.collection_version("branches")
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Query database (no filters for now)
-        branch_docs = await db_manager.find_branches()
+        branch_docs = await db_manager.find_branches(projection=_RESPONSE_PROJECTION)
 
         # Convert to response models
-        branches = [
-            BranchData(
-                id=doc["_id"],
-                name=doc["name"],
-                city=doc["city"],
-                address=doc["address"],
-                phone_number=doc["phone_number"],
-                employee_count=len(doc.get("employee_ids", [])),
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-            )
-            for doc in branch_docs
-        ]
+        branches = [BranchService._convert_branch_doc(doc) for doc in branch_docs]
 
-        logger.info(f"Retrieved {len(branches)} branches")
+        logger.info("Retrieved %s branches", len(branches))
+
+        result = BranchListData.model_construct(
+            branches=branches, total_count=len(branches)
+        )
+        _list_cache.set(cache_key, result)
 
-        return BranchListData(branches=branches, total_count=len(branches))
+        return result
 
 
 # Singleton instance
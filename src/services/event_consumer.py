@@ -7,10 +7,18 @@ Author: Peyman Khodabandehlouei
 Date: 13-01-2026
 """
 
+import asyncio
 import logging
-from typing import Dict, Any
+from typing import Any, Mapping
 from core import rabbitmq_manager
-from schemas.domain import EventTypes
+from schemas.domain import (
+    RESERVATION_CONFIRMED,
+    RESERVATION_MODIFIED,
+    PICKUP_COMPLETED,
+    RETURN_COMPLETED,
+    INVOICE_PAID,
+    INVOICE_PAYMENT_FAILED,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -23,53 +31,61 @@ class EventConsumer:
     """
 
     @staticmethod
-    async def handle_reservation_confirmed(data: Dict[str, Any]):
+    async def handle_reservation_confirmed(data: Mapping[str, Any]):
         """Handle ReservationConfirmed event."""
         logger.info(
-            f"📧 [EVENT] Reservation {data['reservation_id']} confirmed "
-            f"for customer {data['customer_id']} | Total: ${data['total_price']}"
+            "📧 [EVENT] Reservation %s confirmed for customer %s | Total: $%s",
+            data["reservation_id"],
+            data["customer_id"],
+            data["total_price"],
         )
         # TODO: Send email/SMS notification to customer
 
     @staticmethod
-    async def handle_reservation_modified(data: Dict[str, Any]):
+    async def handle_reservation_modified(data: Mapping[str, Any]):
         """Handle ReservationModified event."""
-        logger.info(f"✏️ [EVENT] Reservation {data['reservation_id']} was modified")
+        logger.info("✏️ [EVENT] Reservation %s was modified", data["reservation_id"])
         # TODO: Send modification notification
 
     @staticmethod
-    async def handle_pickup_completed(data: Dict[str, Any]):
+    async def handle_pickup_completed(data: Mapping[str, Any]):
         """Handle PickupCompleted event."""
         logger.info(
-            f"🚗 [EVENT] Vehicle picked up | Rental: {data['rental_id']} | "
-            f"Odometer: {data['odometer_reading']}km | Fuel: {data['fuel_level']}"
+            "🚗 [EVENT] Vehicle picked up | Rental: %s | Odometer: %skm | Fuel: %s",
+            data["rental_id"],
+            data["odometer_reading"],
+            data["fuel_level"],
         )
         # TODO: Send pickup confirmation to customer
 
     @staticmethod
-    async def handle_return_completed(data: Dict[str, Any]):
+    async def handle_return_completed(data: Mapping[str, Any]):
         """Handle ReturnCompleted event."""
         logger.info(
-            f"🏁 [EVENT] Vehicle returned | Rental: {data['rental_id']} | "
-            f"Total charges: ${data['total_charges']:.2f}"
+            "🏁 [EVENT] Vehicle returned | Rental: %s | Total charges: $%.2f",
+            data["rental_id"],
+            data["total_charges"],
         )
         # TODO: Send receipt to customer
 
     @staticmethod
-    async def handle_invoice_paid(data: Dict[str, Any]):
+    async def handle_invoice_paid(data: Mapping[str, Any]):
         """Handle InvoicePaid event."""
         logger.info(
-            f"✅ [EVENT] Invoice {data['invoice_id']} paid successfully | "
-            f"Amount: ${data['amount']:.2f} | Method: {data['payment_method']}"
+            "✅ [EVENT] Invoice %s paid successfully | Amount: $%.2f | Method: %s",
+            data["invoice_id"],
+            data["amount"],
+            data["payment_method"],
         )
         # TODO: Send payment confirmation
 
     @staticmethod
-    async def handle_invoice_payment_failed(data: Dict[str, Any]):
+    async def handle_invoice_payment_failed(data: Mapping[str, Any]):
         """Handle InvoicePaymentFailed event."""
         logger.error(
-            f"❌ [EVENT] Payment FAILED for invoice {data['invoice_id']} | "
-            f"Amount: ${data['amount']:.2f}"
+            "❌ [EVENT] Payment FAILED for invoice %s | Amount: $%.2f",
+            data["invoice_id"],
+            data["amount"],
         )
         # TODO: Send payment failure notification
 
@@ -82,41 +98,32 @@ class EventConsumer:
         """
         logger.info("Starting event consumer...")
 
-        # Subscribe to reservation events
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.RESERVATION_CONFIRMED,
-            callback=EventConsumer.handle_reservation_confirmed,
-        )
-
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.RESERVATION_MODIFIED,
-            callback=EventConsumer.handle_reservation_modified,
-        )
-
-        # Subscribe to rental events
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.PICKUP_COMPLETED,
-            callback=EventConsumer.handle_pickup_completed,
-        )
+        # Connect once up front so the concurrent subscribes share one channel
+        await rabbitmq_manager.connect()
 
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.RETURN_COMPLETED,
-            callback=EventConsumer.handle_return_completed,
-        )
-
-        # Subscribe to payment events
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.INVOICE_PAID,
-            callback=EventConsumer.handle_invoice_paid,
-        )
-
-        await rabbitmq_manager.subscribe(
-            event_type=EventTypes.INVOICE_PAYMENT_FAILED,
-            callback=EventConsumer.handle_invoice_payment_failed,
+        # Declare and bind all queues concurrently (one round trip each)
+        await asyncio.gather(
+            *(
+                rabbitmq_manager.subscribe(event_type=event_type, callback=callback)
+                for event_type, callback in _HANDLERS
+            )
         )
 
         logger.info("✅ Event consumer started successfully")
 
 
+# Event type -> handler subscriptions
+_HANDLERS = (
+    # Reservation events
+    (RESERVATION_CONFIRMED, EventConsumer.handle_reservation_confirmed),
+    (RESERVATION_MODIFIED, EventConsumer.handle_reservation_modified),
+    # Rental events
+    (PICKUP_COMPLETED, EventConsumer.handle_pickup_completed),
+    (RETURN_COMPLETED, EventConsumer.handle_return_completed),
+    # Payment events
+    (INVOICE_PAID, EventConsumer.handle_invoice_paid),
+    (INVOICE_PAYMENT_FAILED, EventConsumer.handle_invoice_payment_failed),
+)
+
 # Singleton instance
 event_consumer = EventConsumer()
@@ -10,9 +10,11 @@ Date: 05-01-2026
 import uuid
 import logging
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Any, Dict, Optional
 
+from core.clock_service import to_iso_string
 from core.database_manager import db_manager
+from core.response_cache import ResponseCache
 from schemas.db_models import InsuranceTierDocument
 from schemas.api.responses import InsuranceTierData, InsuranceTierListData
 from schemas.api.requests import (
@@ -22,6 +24,28 @@ from schemas.api.requests import (
 
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference for timestamps (skips the attribute lookup)
+_UTC = timezone.utc
+
+# Fields an insurance tier update may set
+_UPDATABLE_FIELDS = ("tier_name", "description", "price_per_day")
+
+# Fields read when building InsuranceTierData; anything else stays on the server
+_RESPONSE_PROJECTION = {
+    "tier_name": 1,
+    "description": 1,
+    "price_per_day": 1,
+    "created_at": 1,
+    "updated_at": 1,
+}
+
+
+# List results keyed by the insurance_tiers collection version (writes invalidate)
+_list_cache = ResponseCache(max_size=8)
+
+# Single-item results keyed by (id, collection version)
+_item_cache = ResponseCache(max_size=1024)
+
 
 class InsuranceTierService:
     """
@@ -44,8 +68,8 @@ class InsuranceTierService:
             InsuranceTierData: Created tier data for response.
         """
         # Generate tier ID
-        tier_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        tier_id = uuid.uuid4().hex
+        current_time = datetime.now(_UTC)
 
         # Create database document
         tier_doc = InsuranceTierDocument(
@@ -65,14 +89,35 @@ class InsuranceTierService:
             logger.error(f"Failed to create insurance tier: {e}")
             raise
 
-        # Return response data
-        return InsuranceTierData(
+        # Return response data (values were validated by the request and document)
+        return InsuranceTierData.model_construct(
             id=tier_id,
             tier_name=request.tier_name,
             description=request.description,
             price_per_day=request.price_per_day,
-            created_at=current_time,
-            updated_at=current_time,
+            created_at=to_iso_string(current_time),
+            updated_at=to_iso_string(current_time),
+        )
+
+    @staticmethod
+    def _convert_tier_doc(tier_doc: Dict[str, Any]) -> InsuranceTierData:
+        """
+        Convert an insurance tier document to InsuranceTierData.
+
+        Args:
+            tier_doc (Dict[str, Any]): Insurance tier document from the database.
+
+        Returns:
+            InsuranceTierData: Insurance tier response model.
+        """
+        # DB data is trusted (validated on write), so skip re-validation
+        return InsuranceTierData.model_construct(
+            id=tier_doc["_id"],
+            tier_name=tier_doc["tier_name"],
+            description=tier_doc["description"],
+            price_per_day=tier_doc["price_per_day"],
+            created_at=to_iso_string(tier_doc["created_at"]),
+            updated_at=to_iso_string(tier_doc["updated_at"]),
         )
 
     @staticmethod
@@ -86,6 +131,11 @@ class InsuranceTierService:
         Returns:
             Optional[InsuranceTierData]: Tier data or None if not found.
         """
+        cache_key = (tier_id, db_manager.collection_version("insurance_tiers"))
+        cached = _item_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         tier_doc = await db_manager.find_insurance_tier_by_id(tier_id)
 
         if not tier_doc:
@@ -93,14 +143,10 @@ class InsuranceTierService:
             return None
 
         # Convert MongoDB document to response model
-        return InsuranceTierData(
-            id=tier_doc["_id"],
-            tier_name=tier_doc["tier_name"],
-            description=tier_doc["description"],
-            price_per_day=tier_doc["price_per_day"],
-            created_at=tier_doc["created_at"],
-            updated_at=tier_doc["updated_at"],
-        )
+        result = InsuranceTierService._convert_tier_doc(tier_doc)
+        _item_cache.set(cache_key, result)
+
+        return result
 
     @staticmethod
     async def update_insurance_tier(
@@ -116,39 +162,35 @@ class InsuranceTierService:
         Returns:
             Optional[InsuranceTierData]: Updated tier data or None if not found.
         """
-        # Check if tier exists
-        existing_tier = await db_manager.find_insurance_tier_by_id(tier_id)
-        if not existing_tier:
-            logger.info(f"Insurance tier not found for update: {tier_id}")
-            return None
-
         # Build update dict (only include non-None fields)
-        update_data = {}
-        if request.tier_name is not None:
-            update_data["tier_name"] = request.tier_name
-        if request.description is not None:
-            update_data["description"] = request.description
-        if request.price_per_day is not None:
-            update_data["price_per_day"] = request.price_per_day
+        update_data = {
+            field: value
+            for field in _UPDATABLE_FIELDS
+            if (value := getattr(request, field)) is not None
+        }
 
         # If no fields to update, return current data
         if not update_data:
             logger.info(f"No fields to update for insurance tier: {tier_id}")
             return await InsuranceTierService.get_insurance_tier_by_id(tier_id)
 
-        # Update in database
+        # Update in database and get the updated document back in one round trip
         try:
-            success = await db_manager.update_insurance_tier(tier_id, update_data)
-            if not success:
-                return None
-
-            logger.info(f"Successfully updated insurance tier: {tier_id}")
+            tier_doc = await db_manager.find_and_update_insurance_tier(
+                tier_id, update_data, projection=_RESPONSE_PROJECTION
+            )
         except Exception as e:
             logger.error(f"Failed to update insurance tier: {e}")
             raise
 
+        if not tier_doc:
+            logger.info(f"Insurance tier not found for update: {tier_id}")
+            return None
+
+        logger.info(f"Successfully updated insurance tier: {tier_id}")
+
         # Return updated tier data
-        return await InsuranceTierService.get_insurance_tier_by_id(tier_id)
+        return InsuranceTierService._convert_tier_doc(tier_doc)
 
     @staticmethod
     async def delete_insurance_tier(tier_id: str) -> bool:
@@ -178,25 +220,27 @@ class InsuranceTierService:
         Returns:
             InsuranceTierListData: List of tiers and total count.
         """
+        cache_key = db_manager.collection_version("insurance_tiers")
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         # Query database
-        tier_docs = await db_manager.find_insurance_tiers()
+        tier_docs = await db_manager.find_insurance_tiers(
+            projection=_RESPONSE_PROJECTION
+        )
 
         # Convert to response models
-        tiers = [
-            InsuranceTierData(
-                id=doc["_id"],
-                tier_name=doc["tier_name"],
-                description=doc["description"],
-                price_per_day=doc["price_per_day"],
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-            )
-            for doc in tier_docs
-        ]
+        tiers = [InsuranceTierService._convert_tier_doc(doc) for doc in tier_docs]
 
         logger.info(f"Retrieved {len(tiers)} insurance tiers")
 
-        return InsuranceTierListData(insurance_tiers=tiers, total_count=len(tiers))
+        result = InsuranceTierListData.model_construct(
+            insurance_tiers=tiers, total_count=len(tiers)
+        )
+        _list_cache.set(cache_key, result)
+
+        return result
 
 
 # Singleton instance
@@ -9,7 +9,7 @@ Date: 06-01-2026
 
 import logging
 
-from schemas.domain import EventTypes
+from schemas.domain import INVOICE_PAID, INVOICE_PAYMENT_FAILED, PaymentStatus
 from core import db_manager, rabbitmq_manager
 from schemas.api.responses import PaymentData
 from domain.payment import CreditCardPaymentCreator, PaypalPaymentCreator
@@ -30,7 +30,8 @@ class PaymentService:
 
         Business Rules:
         1. Reservation must exist
-        2. Invoice must be in 'pending' status
+        2. Invoice must be in 'pending' status; it is claimed as
+           'processing' atomically so it cannot be paid twice
         3. Payment method is validated and processed
         4. Invoice status updated to 'completed' or 'failed'
 
@@ -43,18 +44,18 @@ class PaymentService:
         Raises:
             ValueError: If reservation not found or invoice already paid
         """
-        # Validate reservation exists
-        reservation_doc = await db_manager.find_reservation_by_id(
-            request.reservation_id
-        )
-        if not reservation_doc:
-            raise ValueError(
-                f"Reservation with ID '{request.reservation_id}' not found"
-            )
+        # Resolve the payment method before touching the invoice
+        payment_factory = PaymentService._create_payment_factory(request)
 
-        # Check invoice status
-        invoice = reservation_doc["invoice"]
-        if invoice["status"] != "pending":
+        # Claim the pending invoice (atomic, so it cannot be paid twice)
+        invoice = await db_manager.claim_invoice(request.reservation_id)
+        if not invoice:
+            # Only read the invoice to explain why the claim failed
+            invoice = await db_manager.find_reservation_invoice(request.reservation_id)
+            if not invoice:
+                raise ValueError(
+                    f"Reservation with ID '{request.reservation_id}' not found"
+                )
             raise ValueError(
                 f"Invoice already processed with status: {invoice['status']}"
             )
@@ -62,14 +63,19 @@ class PaymentService:
         # Get payment amount from invoice
         amount = invoice["total_price"]
 
-        # Create payment factory based on method
-
-        payment_factory = PaymentService._create_payment_factory(request)
         # Execute payment using factory pattern
-        receipt = payment_factory.execute_payment(amount)
+        try:
+            result = payment_factory.execute_payment(amount)
+        except Exception:
+            # Release the claim so the invoice does not stay 'processing'
+            await db_manager.update_reservation(
+                request.reservation_id, {"invoice.status": "failed"}
+            )
+            raise
+        receipt = result.receipt
 
-        # Determine payment success (check if receipt contains "successful")
-        payment_success = "successful" in receipt.lower()
+        # Determine payment success from the reported status
+        payment_success = result.status is PaymentStatus.SUCCESS
         new_invoice_status = "completed" if payment_success else "failed"
 
         # Update invoice status in database
@@ -78,17 +84,16 @@ class PaymentService:
         )
 
         logger.info(
-            f"Payment {new_invoice_status} for reservation {request.reservation_id}: "
-            f"${amount} via {request.payment_method}"
+            "Payment %s for reservation %s: $%s via %s",
+            new_invoice_status,
+            request.reservation_id,
+            amount,
+            request.payment_method,
         )
 
         # Publish payment event
         try:
-            event_type = (
-                EventTypes.INVOICE_PAID
-                if payment_success
-                else EventTypes.INVOICE_PAYMENT_FAILED
-            )
+            event_type = INVOICE_PAID if payment_success else INVOICE_PAYMENT_FAILED
 
             await rabbitmq_manager.publish_event(
                 event_type=event_type,
@@ -101,10 +106,12 @@ class PaymentService:
                 },
             )
             logger.info(
-                f"Published {event_type} event for reservation {request.reservation_id}"
+                "Published %s event for reservation %s",
+                event_type,
+                request.reservation_id,
             )
         except Exception as e:
-            logger.error(f"Failed to publish payment event: {e}")
+            logger.error("Failed to publish payment event: %s", e)
 
         # Return payment result
         return PaymentData(
@@ -8,14 +8,19 @@ Author: Peyman Khodabandehlouei
 Date: 13-01-2026
 """
 
-import uuid
+import asyncio
 import logging
-from datetime import datetime
-from typing import Optional, Dict, Any
+from datetime import datetime, date, timedelta
+from typing import Optional, Dict, Any, AsyncIterator, List
 
-from core import db_manager, rabbitmq_manager
-from core.clock_service import SystemClock
+import orjson
+from pydantic import TypeAdapter
+from pymongo.errors import DuplicateKeyError
+
+from core import db_manager, rabbitmq_manager, SagaStep, run_saga, uuid7
+from core.clock_service import SystemClock, to_iso_string, to_datetime, to_date
 from schemas.db_models import (
+    RENTAL_DOC_ADAPTER,
     RentalDocument,
     RentalReadingDocument,
     RentalChargesDocument,
@@ -27,14 +32,26 @@ from schemas.api.requests import (
     RentalFilterRequest,
 )
 from schemas.api.responses import (
-    RentalData,
+    RentalSummaryData,
+    RentalDetailData,
     RentalListData,
+    RentalChargesSummaryData,
     RentalReadingData,
     RentalChargesData,
     PickupSuccessData,
     ReturnSuccessData,
 )
-from schemas.domain import RentalStatus, ReservationStatus, EventTypes
+from schemas.api.responses.rentals import (
+    PICKUP_SUCCESS_MESSAGE,
+    PICKUP_IDEMPOTENT_MESSAGE,
+    RETURN_SUCCESS_MESSAGE,
+)
+from schemas.domain import (
+    RentalStatus,
+    ReservationStatus,
+    PICKUP_COMPLETED,
+    RETURN_COMPLETED,
+)
 
 # Business rule constants
 LATE_FEE_PER_HOUR = 10.0
@@ -42,6 +59,17 @@ DAILY_KM_ALLOWANCE = 200.0
 OVERAGE_PER_KM = 0.5
 FUEL_REFILL_RATE = 50.0
 GRACE_PERIOD_HOURS = 1
+_GRACE_PERIOD = timedelta(hours=GRACE_PERIOD_HOURS)
+_ONE_HOUR = timedelta(hours=1)
+
+# Filter attributes that map one-to-one onto rental document fields
+_FILTER_FIELDS = ("customer_id", "vehicle_id", "agent_id", "status", "reservation_id")
+
+# List responses are summaries, so leave the return-time subdocuments on the server
+_SUMMARY_PROJECTION = {"return_readings": 0, "charges": 0}
+
+# Validates a whole page of rental summaries in one call instead of one model per row
+_RENTAL_LIST_ADAPTER = TypeAdapter(List[RentalSummaryData])
 
 # Logger
 logger = logging.getLogger(__name__)
@@ -92,20 +120,21 @@ class RentalService:
 
         if existing_rental:
             logger.info(
-                f"Idempotent pickup detected: pickup_token '{request.pickup_token}' "
-                f"already used for rental {existing_rental['_id']}"
+                "Idempotent pickup detected: pickup_token '%s' already used for rental %s",
+                request.pickup_token,
+                existing_rental["_id"],
             )
             # Return existing rental (idempotent response)
-            rental_data = await self._convert_rental_doc_to_response(existing_rental)
-            return PickupSuccessData(
-                rental=rental_data,
-                message="Vehicle already picked up (idempotent operation)",
-            )
+            return self._idempotent_pickup_response(existing_rental)
 
-        # Validate reservation exists and get details
-        reservation_doc = await db_manager.find_reservation_by_id(
-            request.reservation_id
+        # Reservation and agent lookups are independent, so fetch them concurrently.
+        # A second rental for the reservation is rejected by its unique index on insert
+        reservation_doc, agent_doc = await asyncio.gather(
+            db_manager.find_reservation_by_id(request.reservation_id),
+            db_manager.find_employee_by_id(request.agent_id),
         )
+
+        # Validate reservation exists
         if not reservation_doc:
             raise ValueError(
                 f"Reservation with ID '{request.reservation_id}' not found"
@@ -118,18 +147,7 @@ class RentalService:
                 f"Current status: '{reservation_doc['status']}'"
             )
 
-        # Check if reservation already has a rental
-        existing_rental_for_reservation = await db_manager.find_rental_by_reservation(
-            request.reservation_id
-        )
-        if existing_rental_for_reservation:
-            raise ValueError(
-                f"Reservation '{request.reservation_id}' has already been picked up. "
-                f"Rental ID: {existing_rental_for_reservation['_id']}"
-            )
-
         # Validate agent exists
-        agent_doc = await db_manager.find_employee_by_id(request.agent_id)
         if not agent_doc:
             raise ValueError(f"Agent with ID '{request.agent_id}' not found")
 
@@ -145,8 +163,11 @@ class RentalService:
                 f"Vehicle '{vehicle_id}' is due for maintenance and cannot be picked up"
             )
 
+        # Read the clock once for the whole pickup
+        now = self._clock.now()
+
         # Determine pickup timestamp
-        pickup_timestamp = request.pickup_timestamp or self._clock.now()
+        pickup_timestamp = request.pickup_timestamp or now
 
         # Create rental readings document
         pickup_readings_doc = RentalReadingDocument(
@@ -155,62 +176,88 @@ class RentalService:
             timestamp=pickup_timestamp,
         )
 
-        # Generate rental ID
-        rental_id = str(uuid.uuid4())
-        current_time = self._clock.now()
+        # Generate a time-ordered rental ID so inserts append to the _id index
+        rental_id = str(uuid7())
 
         # Create rental document
-        rental_doc = RentalDocument(
-            _id=rental_id,
-            status=RentalStatus.ACTIVE.value,
-            reservation_id=request.reservation_id,
-            vehicle_id=vehicle_id,
-            customer_id=reservation_doc["customer_id"],
-            agent_id=request.agent_id,
-            pickup_token=request.pickup_token,
-            pickup_readings=pickup_readings_doc,
-            return_readings=None,
-            charges=None,
-            created_at=current_time,
-            updated_at=current_time,
+        rental_doc = RENTAL_DOC_ADAPTER.validate_python(
+            {
+                "_id": rental_id,
+                "status": RentalStatus.ACTIVE.value,
+                "reservation_id": request.reservation_id,
+                "vehicle_id": vehicle_id,
+                "customer_id": reservation_doc["customer_id"],
+                "agent_id": request.agent_id,
+                "pickup_token": request.pickup_token,
+                "pickup_readings": pickup_readings_doc,
+                "return_readings": None,
+                "charges": None,
+                "created_at": now,
+                "updated_at": now,
+            }
         )
 
-        # Save rental to the database
-        try:
-            await db_manager.create_rental(rental_doc)
-            logger.info(f"Successfully created rental: {rental_id}")
-        except Exception as e:
-            logger.error(f"Failed to create rental: {e}")
-            raise
+        # Persist the pickup as a saga: create the rental, mark the reservation
+        # 'completed' (pickup happened), then the vehicle 'picked_up'. A failed
+        # step undoes the ones before it, so no partial pickup is left behind
+        previous_vehicle_status = vehicle_doc.get("status", "available")
+        pickup_steps = [
+            SagaStep(
+                name="create rental",
+                action=lambda: db_manager.create_rental(rental_doc),
+                compensation=lambda: db_manager.delete_rental(rental_id),
+            ),
+            SagaStep(
+                name="complete reservation",
+                action=lambda: db_manager.update_reservation(
+                    request.reservation_id,
+                    {"status": ReservationStatus.COMPLETED.value},
+                ),
+                compensation=lambda: db_manager.update_reservation(
+                    request.reservation_id,
+                    {"status": ReservationStatus.APPROVED.value},
+                ),
+            ),
+            SagaStep(
+                name="mark vehicle picked up",
+                action=lambda: db_manager.update_vehicle(
+                    vehicle_id, {"status": "picked_up"}
+                ),
+                compensation=lambda: db_manager.update_vehicle(
+                    vehicle_id, {"status": previous_vehicle_status}
+                ),
+            ),
+        ]
 
-        # Update reservation status to 'completed' (pickup happened)
         try:
-            await db_manager.update_reservation(
-                request.reservation_id, {"status": ReservationStatus.COMPLETED.value}
-            )
-            logger.info(
-                f"Updated reservation {request.reservation_id} status to 'completed'"
+            await run_saga(pickup_steps)
+            logger.info("Successfully created rental: %s", rental_id)
+        except DuplicateKeyError as e:
+            # Lost a race on the pickup token, or the reservation has a rental
+            key_pattern = (e.details or {}).get("keyPattern", {})
+            if "pickup_token" in key_pattern:
+                existing_rental = await db_manager.find_rental_by_pickup_token(
+                    request.pickup_token
+                )
+                if existing_rental:
+                    return self._idempotent_pickup_response(existing_rental)
+
+            existing_rental_for_reservation = (
+                await db_manager.find_rental_by_reservation(request.reservation_id)
             )
-        except Exception as e:
-            logger.error(f"Failed to update reservation status: {e}")
-            # Note: Rental is created but reservation status update failed
-            # In production, you might want to use a transaction or saga pattern
-
-        # Update vehicle status to 'picked_up'
-        try:
-            await db_manager.update_vehicle(request.vehicle_id, {"status": "picked_up"})
-            logger.info(f"Updated vehicle {request.vehicle_id} status to 'picked_up'")
-        except Exception as e:
-            logger.error(f"Failed to update vehicle status: {e}")
+            if existing_rental_for_reservation:
+                raise ValueError(
+                    f"Reservation '{request.reservation_id}' has already been picked up. "
+                    f"Rental ID: {existing_rental_for_reservation['_id']}"
+                )
+            raise
 
         # Convert to response model
-        rental_data = await self._convert_rental_doc_to_response(
-            rental_doc.model_dump(by_alias=True)
-        )
+        rental_data = self._rental_doc_model_to_response(rental_doc)
 
         try:
             await rabbitmq_manager.publish_event(
-                event_type=EventTypes.PICKUP_COMPLETED,
+                event_type=PICKUP_COMPLETED,
                 data={
                     "rental_id": rental_id,
                     "reservation_id": request.reservation_id,
@@ -222,12 +269,22 @@ class RentalService:
                     "pickup_timestamp": pickup_timestamp.isoformat(),
                 },
             )
-            logger.info(f"Published PickupCompleted event for {rental_id}")
+            logger.info("Published PickupCompleted event for %s", rental_id)
         except Exception as e:
-            logger.error(f"Failed to publish pickup event: {e}")
+            logger.error("Failed to publish pickup event: %s", e)
+
+        # Wrappers hold already-built response models, so skip re-validation
+        return PickupSuccessData.model_construct(
+            rental=rental_data, message=PICKUP_SUCCESS_MESSAGE
+        )
 
-        return PickupSuccessData(
-            rental=rental_data, message="Vehicle picked up successfully"
+    def _idempotent_pickup_response(
+        self, existing_rental: Dict[str, Any]
+    ) -> PickupSuccessData:
+        """Build the response for a pickup token that was already used"""
+        return PickupSuccessData.model_construct(
+            rental=self._convert_rental_doc_to_response(existing_rental),
+            message=PICKUP_IDEMPOTENT_MESSAGE,
         )
 
     async def return_vehicle(
@@ -257,8 +314,13 @@ class RentalService:
         Raises:
             ValueError: If validation fails or rental already returned
         """
+        # Fetch the rental (joined with its reservation) and the agent concurrently
+        rental_doc, agent_doc = await asyncio.gather(
+            db_manager.find_rental_with_reservation(rental_id),
+            db_manager.find_employee_by_id(request.agent_id),
+        )
+
         # Validate rental exists
-        rental_doc = await db_manager.find_rental_by_id(rental_id)
         if not rental_doc:
             raise ValueError(f"Rental with ID '{rental_id}' not found")
 
@@ -270,14 +332,11 @@ class RentalService:
             )
 
         # Validate agent exists
-        agent_doc = await db_manager.find_employee_by_id(request.agent_id)
         if not agent_doc:
             raise ValueError(f"Agent with ID '{request.agent_id}' not found")
 
         # Get associated reservation for due date calculation
-        reservation_doc = await db_manager.find_reservation_by_id(
-            rental_doc["reservation_id"]
-        )
+        reservation_doc = rental_doc.pop("reservation")
         if not reservation_doc:
             raise ValueError(
                 f"Associated reservation '{rental_doc['reservation_id']}' not found"
@@ -291,13 +350,23 @@ class RentalService:
                 f"pickup odometer ({pickup_odometer} km)"
             )
 
+        # Read the clock once for the whole return
+        now = self._clock.now()
+
         # Determine return timestamp
-        return_timestamp = request.return_timestamp or self._clock.now()
+        return_timestamp = request.return_timestamp or now
+
+        # Parse the reservation dates once; stored values may be strings
+        # or datetimes depending on which write path last touched them
+        pickup_date = to_date(reservation_doc["pickup_date"])
+        return_date = to_date(reservation_doc["return_date"])
 
         # Calculate charges using business rules
         charges = self._calculate_rental_charges(
             rental_doc=rental_doc,
-            reservation_doc=reservation_doc,
+            pickup_date=pickup_date,
+            return_date=return_date,
+            base_price=reservation_doc["total_price"],
             return_odometer=request.odometer_reading,
             return_fuel_level=request.fuel_level,
             return_timestamp=return_timestamp,
@@ -316,20 +385,28 @@ class RentalService:
             "status": RentalStatus.COMPLETED.value,
             "return_readings": return_readings_doc.model_dump(),
             "charges": charges.model_dump(),
-            "updated_at": self._clock.now(),
+            "updated_at": now,
         }
 
+        # Complete the rental and get the updated document back in one round
+        # trip; only an 'active' rental can be completed, so a concurrent
+        # return of the same rental cannot apply twice
         try:
-            success = await db_manager.update_rental(rental_id, update_data)
-            if not success:
-                raise ValueError(f"Failed to update rental {rental_id}")
+            updated_rental_doc = await db_manager.find_and_update_rental(
+                rental_id, update_data, expected_status=RentalStatus.ACTIVE.value
+            )
+            if not updated_rental_doc:
+                raise ValueError(
+                    f"Rental '{rental_id}' was returned by a concurrent request"
+                )
 
             logger.info(
-                f"Successfully completed rental {rental_id}. "
-                f"Total charges: ${charges.total:.2f}"
+                "Successfully completed rental %s. Total charges: $%.2f",
+                rental_id,
+                charges.total,
             )
         except Exception as e:
-            logger.error(f"Failed to update rental: {e}")
+            logger.error("Failed to update rental: %s", e)
             raise
 
         # Update vehicle status to 'available'
@@ -338,19 +415,17 @@ class RentalService:
                 rental_doc["vehicle_id"], {"status": "available"}
             )
             logger.info(
-                f"Updated vehicle {rental_doc['vehicle_id']} status to 'available'"
+                "Updated vehicle %s status to 'available'", rental_doc["vehicle_id"]
             )
         except Exception as e:
-            logger.error(f"Failed to update vehicle status: {e}")
+            logger.error("Failed to update vehicle status: %s", e)
 
-        # Get updated rental
-        updated_rental_doc = await db_manager.find_rental_by_id(rental_id)
-        rental_data = await self._convert_rental_doc_to_response(updated_rental_doc)
+        rental_data = self._convert_rental_doc_to_response(updated_rental_doc)
 
         # Publish ReturnCompleted event
         try:
             await rabbitmq_manager.publish_event(
-                event_type=EventTypes.RETURN_COMPLETED,
+                event_type=RETURN_COMPLETED,
                 data={
                     "rental_id": rental_id,
                     "reservation_id": rental_doc["reservation_id"],
@@ -363,18 +438,18 @@ class RentalService:
                     "damage_fee": charges.damage_fee,
                 },
             )
-            logger.info(f"Published ReturnCompleted event for {rental_id}")
+            logger.info("Published ReturnCompleted event for %s", rental_id)
         except Exception as e:
-            logger.error(f"Failed to publish return event: {e}")
+            logger.error("Failed to publish return event: %s", e)
 
-        return ReturnSuccessData(
+        return ReturnSuccessData.model_construct(
             rental=rental_data,
-            message=f"Vehicle returned successfully. Total charges: ${charges.total:.2f}",
+            message=f"{RETURN_SUCCESS_MESSAGE}. Total charges: ${charges.total:.2f}",
         )
 
     async def extend_rental(
         self, rental_id: str, request: ExtendRentalRequest
-    ) -> RentalData:
+    ) -> RentalDetailData:
         """
         Extend an active rental to a new return date.
 
@@ -393,13 +468,13 @@ class RentalService:
             request (ExtendRentalRequest): New return date
 
         Returns:
-            RentalData: Updated rental information
+            RentalDetailData: Updated rental information
 
         Raises:
             ValueError: If validation fails or conflicts exist
         """
-        # Step 1: Validate rental exists and is active
-        rental_doc = await db_manager.find_rental_by_id(rental_id)
+        # Step 1: Validate rental exists and is active (joined with its reservation)
+        rental_doc = await db_manager.find_rental_with_reservation(rental_id)
         if not rental_doc:
             raise ValueError(f"Rental with ID '{rental_id}' not found")
 
@@ -409,23 +484,15 @@ class RentalService:
             )
 
         # Step 2: Get associated reservation
-        reservation_doc = await db_manager.find_reservation_by_id(
-            rental_doc["reservation_id"]
-        )
+        reservation_doc = rental_doc.pop("reservation")
         if not reservation_doc:
             raise ValueError(
                 f"Associated reservation '{rental_doc['reservation_id']}' not found"
             )
 
         # FIX: Convert MongoDB date to date object for comparison
-        from datetime import datetime as dt, date
-
-        current_return_date = reservation_doc["return_date"]
-        if isinstance(current_return_date, str):
-            current_return_date = dt.fromisoformat(current_return_date).date()
-        elif isinstance(current_return_date, dt):
-            current_return_date = current_return_date.date()
-        elif not isinstance(current_return_date, date):
+        current_return_date = to_date(reservation_doc["return_date"])
+        if not isinstance(current_return_date, date):
             raise ValueError(f"Invalid return_date type: {type(current_return_date)}")
 
         # Step 3: Validate new return date is after current
@@ -435,39 +502,36 @@ class RentalService:
                 f"current return date ({current_return_date})"
             )
 
-        # Step 4: Check for conflicts with other reservations
+        # Step 4: Check for conflicts and move the return date (conditional update)
         vehicle_id = rental_doc["vehicle_id"]
-        has_conflict = not await db_manager.check_rental_extension_conflict(
-            vehicle_id=vehicle_id,
-            current_return_date=current_return_date,
-            new_return_date=request.new_return_date,
-            exclude_reservation_id=rental_doc["reservation_id"],
-        )
+        try:
+            extended = await db_manager.try_extend_reservation(
+                reservation_id=rental_doc["reservation_id"],
+                vehicle_id=vehicle_id,
+                current_return_date=current_return_date,
+                new_return_date=request.new_return_date,
+            )
+        except Exception as e:
+            logger.error("Failed to extend rental: %s", e)
+            raise
 
-        if has_conflict:
+        if not extended:
             raise ValueError(
                 f"Cannot extend rental: Vehicle '{vehicle_id}' has conflicting "
                 f"reservation between {current_return_date} and {request.new_return_date}"
             )
 
-        # Step 5: Update reservation return date
-        try:
-            await db_manager.update_reservation(
-                rental_doc["reservation_id"], {"return_date": request.new_return_date}
-            )
-            logger.info(
-                f"Extended rental {rental_id}: "
-                f"{current_return_date} -> {request.new_return_date}"
-            )
-        except Exception as e:
-            logger.error(f"Failed to extend rental: {e}")
-            raise
+        logger.info(
+            "Extended rental %s: %s -> %s",
+            rental_id,
+            current_return_date,
+            request.new_return_date,
+        )
 
-        # Step 6: Get updated rental
-        updated_rental_doc = await db_manager.find_rental_by_id(rental_id)
-        return await self._convert_rental_doc_to_response(updated_rental_doc)
+        # Step 5: Return the rental (extending only changes the reservation)
+        return self._convert_rental_doc_to_response(rental_doc)
 
-    async def get_rental_by_id(self, rental_id: str) -> Optional[RentalData]:
+    async def get_rental_by_id(self, rental_id: str) -> Optional[RentalDetailData]:
         """
         Get rental by ID.
 
@@ -475,15 +539,32 @@ class RentalService:
             rental_id (str): Rental's unique identifier
 
         Returns:
-            Optional[RentalData]: Rental data or None if not found
+            Optional[RentalDetailData]: Rental data or None if not found
         """
         rental_doc = await db_manager.find_rental_by_id(rental_id)
 
         if not rental_doc:
-            logger.info(f"Rental not found: {rental_id}")
+            logger.info("Rental not found: %s", rental_id)
             return None
 
-        return await self._convert_rental_doc_to_response(rental_doc)
+        return self._convert_rental_doc_to_response(rental_doc)
+
+    @staticmethod
+    def _build_query_filters(filters: RentalFilterRequest) -> Dict[str, Any]:
+        """
+        Translate rental filter criteria into a MongoDB query.
+
+        Args:
+            filters (RentalFilterRequest): Filter criteria
+
+        Returns:
+            Dict[str, Any]: MongoDB query filters
+        """
+        return {
+            field: value
+            for field in _FILTER_FIELDS
+            if (value := getattr(filters, field)) is not None
+        }
 
     async def list_rentals(self, filters: RentalFilterRequest) -> RentalListData:
         """
@@ -496,39 +577,97 @@ class RentalService:
             RentalListData: List of rentals and total count
         """
         # Build MongoDB query filters
-        query_filters: Dict[str, Any] = {}
+        query_filters = self._build_query_filters(filters)
+
+        async def summary_rows() -> List[Dict[str, Any]]:
+            # Map rows as the cursor delivers them, so raw documents are never
+            # held as a full list (summaries never read return readings or charges)
+            return [
+                self._rental_summary_fields(doc)
+                async for doc in db_manager.stream_rentals(
+                    query_filters,
+                    projection=_SUMMARY_PROJECTION,
+                    skip=filters.skip,
+                    limit=filters.limit,
+                )
+            ]
+
+        # When paging, count all matches alongside the page
+        if filters.skip or filters.limit is not None:
+            rows, total_count = await asyncio.gather(
+                summary_rows(), db_manager.count_rentals(query_filters)
+            )
+        else:
+            rows = await summary_rows()
+            total_count = len(rows)
 
-        if filters.customer_id is not None:
-            query_filters["customer_id"] = filters.customer_id
+        # Convert to response models in a single batch validation
+        rentals = _RENTAL_LIST_ADAPTER.validate_python(rows)
 
-        if filters.vehicle_id is not None:
-            query_filters["vehicle_id"] = filters.vehicle_id
+        logger.info(
+            "Retrieved %s rentals with filters: %s", len(rentals), query_filters
+        )
 
-        if filters.agent_id is not None:
-            query_filters["agent_id"] = filters.agent_id
+        return RentalListData.model_construct(rentals=rentals, total_count=total_count)
 
-        if filters.status is not None:
-            query_filters["status"] = filters.status
+    async def get_charges_summary(
+        self, filters: RentalFilterRequest
+    ) -> RentalChargesSummaryData:
+        """
+        Sum charges across rentals matching the filters.
 
-        if filters.reservation_id is not None:
-            query_filters["reservation_id"] = filters.reservation_id
+        The sum is computed by the database, so no rental documents are
+        loaded into the service.
 
-        # Query database
-        rental_docs = await db_manager.find_rentals(query_filters)
+        Args:
+            filters (RentalFilterRequest): Filter criteria
 
-        # Convert to response models
-        rentals = [
-            await self._convert_rental_doc_to_response(doc) for doc in rental_docs
-        ]
+        Returns:
+            RentalChargesSummaryData: Total charges and number of charged rentals
+        """
+        query_filters = self._build_query_filters(filters)
+
+        result = await db_manager.sum_rental_charges(query_filters)
+
+        logger.info(
+            "Summed charges for %s rentals with filters: %s",
+            result["count"],
+            query_filters,
+        )
 
-        logger.info(f"Retrieved {len(rentals)} rentals with filters: {query_filters}")
+        return RentalChargesSummaryData(
+            total_charges=round(result["total"], 2),
+            charged_rentals=result["count"],
+        )
+
+    async def stream_rentals(
+        self, filters: RentalFilterRequest
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream rentals as newline-delimited JSON.
+
+        Documents are serialized straight from the database cursor without
+        building rental response models, so memory stays constant regardless of
+        the result size.
 
-        return RentalListData(rentals=rentals, total_count=len(rentals))
+        Args:
+            filters (RentalFilterRequest): Filter criteria
+
+        Yields:
+            bytes: One JSON-encoded rental per line
+        """
+        query_filters = self._build_query_filters(filters)
+
+        async for doc in db_manager.stream_rentals(query_filters):
+            doc["id"] = doc.pop("_id")
+            yield orjson.dumps(doc, default=str) + b"\n"
 
     def _calculate_rental_charges(
         self,
         rental_doc: Dict[str, Any],
-        reservation_doc: Dict[str, Any],
+        pickup_date: date,
+        return_date: date,
+        base_price: float,
         return_odometer: float,
         return_fuel_level: float,
         return_timestamp: datetime,
@@ -547,7 +686,9 @@ class RentalService:
 
         Args:
             rental_doc: Rental document from database
-            reservation_doc: Associated reservation document
+            pickup_date: Reserved pickup date (already parsed)
+            return_date: Reserved return date (already parsed)
+            base_price: Reservation total price
             return_odometer: Odometer reading at return
             return_fuel_level: Fuel level at return
             return_timestamp: When vehicle was returned
@@ -556,32 +697,11 @@ class RentalService:
         Returns:
             RentalChargesDocument: Itemized charges with total
         """
-        import math
-        from datetime import timedelta, datetime as dt
-
         # Get pickup data
         pickup_readings = rental_doc["pickup_readings"]
         pickup_odometer = pickup_readings["odometer"]
         pickup_fuel_level = pickup_readings["fuel_level"]
-        pickup_timestamp = pickup_readings["timestamp"]
-
-        if isinstance(pickup_timestamp, str):
-            pickup_timestamp = dt.fromisoformat(pickup_timestamp)
-
-        # Get reservation dates for due time calculation
-        pickup_date = reservation_doc["pickup_date"]
-        return_date = reservation_doc["return_date"]
-
-        # Convert to date objects if they're strings
-        if isinstance(pickup_date, str):
-            pickup_date = dt.fromisoformat(pickup_date).date()
-        elif isinstance(pickup_date, dt):
-            pickup_date = pickup_date.date()
-
-        if isinstance(return_date, str):
-            return_date = dt.fromisoformat(return_date).date()
-        elif isinstance(return_date, dt):
-            return_date = return_date.date()
+        pickup_timestamp = to_datetime(pickup_readings["timestamp"])
 
         # Calculate rental days
         rental_days = (return_date - pickup_date).days
@@ -592,14 +712,14 @@ class RentalService:
         due_datetime = pickup_timestamp + timedelta(days=rental_days)
 
         # Calculate grace period end (1 hour after due time)
-        grace_end_datetime = due_datetime + timedelta(hours=GRACE_PERIOD_HOURS)
+        grace_end_datetime = due_datetime + _GRACE_PERIOD
 
         # === Late Fee Calculation ===
-        late_fee = 0.0
-        if return_timestamp > grace_end_datetime:
-            late_seconds = (return_timestamp - grace_end_datetime).total_seconds()
-            late_hours = math.ceil(late_seconds / 3600)  # Round up to next hour
-            late_fee = late_hours * LATE_FEE_PER_HOUR
+        # Whole hours late, rounded up, clamped at zero: ceil(a / b) == -(-a // b),
+        # and timedelta floor division is exact integer math (no float, no branch)
+        late_hours = max(0, -((grace_end_datetime - return_timestamp) // _ONE_HOUR))
+        late_fee = late_hours * LATE_FEE_PER_HOUR
+        if late_hours and logger.isEnabledFor(logging.INFO):
             logger.info(
                 f"Late return detected: {late_hours} hours late, "
                 f"fee: ${late_fee:.2f}"
@@ -611,26 +731,25 @@ class RentalService:
         overage_km = max(0, actual_km - allowed_km)
         mileage_overage_fee = overage_km * OVERAGE_PER_KM
 
-        logger.info(
-            f"Mileage: {actual_km:.1f} km driven, "
-            f"{allowed_km:.1f} km allowed, "
-            f"{overage_km:.1f} km overage, "
-            f"fee: ${mileage_overage_fee:.2f}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Mileage: {actual_km:.1f} km driven, "
+                f"{allowed_km:.1f} km allowed, "
+                f"{overage_km:.1f} km overage, "
+                f"fee: ${mileage_overage_fee:.2f}"
+            )
 
         # === Fuel Refill Calculation ===
         fuel_difference = pickup_fuel_level - return_fuel_level
         fuel_refill_fee = max(0, fuel_difference * FUEL_REFILL_RATE)
 
-        logger.info(
-            f"Fuel: {pickup_fuel_level:.2f} at pickup, "
-            f"{return_fuel_level:.2f} at return, "
-            f"difference: {fuel_difference:.2f}, "
-            f"fee: ${fuel_refill_fee:.2f}"
-        )
-
-        # === Base Price ===
-        base_price = reservation_doc["total_price"]
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"Fuel: {pickup_fuel_level:.2f} at pickup, "
+                f"{return_fuel_level:.2f} at return, "
+                f"difference: {fuel_difference:.2f}, "
+                f"fee: ${fuel_refill_fee:.2f}"
+            )
 
         # Create charges document
         return RentalChargesDocument(
@@ -641,9 +760,9 @@ class RentalService:
             damage_fee=manual_damage_charge,
         )
 
-    async def _convert_rental_doc_to_response(
+    def _convert_rental_doc_to_response(
         self, rental_doc: Dict[str, Any]
-    ) -> RentalData:
+    ) -> RentalDetailData:
         """
         Convert MongoDB rental document to API response model.
 
@@ -651,50 +770,126 @@ class RentalService:
             rental_doc: Rental document from database
 
         Returns:
-            RentalData: Response model for API
+            RentalDetailData: Response model for API
         """
-        # Convert pickup readings
-        pickup_readings = RentalReadingData(
-            odometer=rental_doc["pickup_readings"]["odometer"],
-            fuel_level=rental_doc["pickup_readings"]["fuel_level"],
-            timestamp=rental_doc["pickup_readings"]["timestamp"],
-        )
-
         # Convert return readings (if exists)
-        return_readings = None
-        if rental_doc.get("return_readings"):
-            return_readings = RentalReadingData(
-                odometer=rental_doc["return_readings"]["odometer"],
-                fuel_level=rental_doc["return_readings"]["fuel_level"],
-                timestamp=rental_doc["return_readings"]["timestamp"],
-            )
+        return_readings = rental_doc.get("return_readings")
+        if return_readings:
+            return_readings = self._reading_doc_to_response(return_readings)
 
         # Convert charges (if exists)
-        charges = None
-        if rental_doc.get("charges"):
-            charges = RentalChargesData(
-                base_price=rental_doc["charges"]["base_price"],
-                late_fee=rental_doc["charges"]["late_fee"],
-                mileage_overage_fee=rental_doc["charges"]["mileage_overage_fee"],
-                fuel_refill_fee=rental_doc["charges"]["fuel_refill_fee"],
-                damage_fee=rental_doc["charges"]["damage_fee"],
+        charges = rental_doc.get("charges")
+        if charges:
+            charges = RentalChargesData.model_construct(
+                base_price=charges["base_price"],
+                late_fee=charges["late_fee"],
+                mileage_overage_fee=charges["mileage_overage_fee"],
+                fuel_refill_fee=charges["fuel_refill_fee"],
+                damage_fee=charges["damage_fee"],
             )
 
-        return RentalData(
-            id=rental_doc["_id"],
-            status=rental_doc["status"],
-            reservation_id=rental_doc["reservation_id"],
-            vehicle_id=rental_doc["vehicle_id"],
-            customer_id=rental_doc["customer_id"],
-            agent_id=rental_doc["agent_id"],
-            pickup_token=rental_doc["pickup_token"],
-            pickup_readings=pickup_readings,
+        # DB data is trusted (validated on write), so skip re-validation
+        return RentalDetailData.model_construct(
+            **self._rental_summary_fields(rental_doc),
             return_readings=return_readings,
             charges=charges,
-            created_at=rental_doc["created_at"],
-            updated_at=rental_doc["updated_at"],
         )
 
+    @staticmethod
+    def _reading_doc_to_response(reading: Dict[str, Any]) -> RentalReadingData:
+        """Convert a stored reading subdocument to its response model"""
+        return RentalReadingData.model_construct(
+            odometer=reading["odometer"],
+            fuel_level=reading["fuel_level"],
+            timestamp=to_iso_string(reading["timestamp"]),
+        )
+
+    @staticmethod
+    def _reading_model_to_response(
+        reading: RentalReadingDocument,
+    ) -> RentalReadingData:
+        """Convert a reading document model to its response model"""
+        return RentalReadingData.model_construct(
+            odometer=reading.odometer,
+            fuel_level=reading.fuel_level,
+            timestamp=to_iso_string(reading.timestamp),
+        )
+
+    def _rental_doc_model_to_response(
+        self, rental_doc: RentalDocument
+    ) -> RentalDetailData:
+        """
+        Convert an in-memory rental document model to API response model.
+
+        Used for rentals built by this service, so no dump to a dict and
+        re-read is needed. Documents read from MongoDB use
+        _convert_rental_doc_to_response instead.
+
+        Args:
+            rental_doc: Validated rental document model
+
+        Returns:
+            RentalDetailData: Response model for API
+        """
+        charges = None
+        if rental_doc.charges:
+            charges = RentalChargesData.model_construct(
+                base_price=rental_doc.charges.base_price,
+                late_fee=rental_doc.charges.late_fee,
+                mileage_overage_fee=rental_doc.charges.mileage_overage_fee,
+                fuel_refill_fee=rental_doc.charges.fuel_refill_fee,
+                damage_fee=rental_doc.charges.damage_fee,
+            )
+
+        # Values were validated when the document model was built
+        return RentalDetailData.model_construct(
+            id=rental_doc.id,
+            status=rental_doc.status,
+            reservation_id=rental_doc.reservation_id,
+            vehicle_id=rental_doc.vehicle_id,
+            customer_id=rental_doc.customer_id,
+            agent_id=rental_doc.agent_id,
+            pickup_token=rental_doc.pickup_token,
+            pickup_readings=self._reading_model_to_response(rental_doc.pickup_readings),
+            created_at=to_iso_string(rental_doc.created_at),
+            updated_at=to_iso_string(rental_doc.updated_at),
+            return_readings=(
+                self._reading_model_to_response(rental_doc.return_readings)
+                if rental_doc.return_readings
+                else None
+            ),
+            charges=charges,
+        )
+
+    @staticmethod
+    def _rental_summary_fields(rental_doc: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Map the fields shared by summary and detail responses.
+
+        Used as RentalSummaryData input for list pages (validated as a whole
+        list by _RENTAL_LIST_ADAPTER) and as RentalDetailData fields.
+
+        Args:
+            rental_doc: Rental document from database
+
+        Returns:
+            Dict[str, Any]: Summary fields with timestamps as ISO strings
+        """
+        return {
+            "id": rental_doc["_id"],
+            "status": rental_doc["status"],
+            "reservation_id": rental_doc["reservation_id"],
+            "vehicle_id": rental_doc["vehicle_id"],
+            "customer_id": rental_doc["customer_id"],
+            "agent_id": rental_doc["agent_id"],
+            "pickup_token": rental_doc["pickup_token"],
+            "pickup_readings": RentalService._reading_doc_to_response(
+                rental_doc["pickup_readings"]
+            ),
+            "created_at": to_iso_string(rental_doc["created_at"]),
+            "updated_at": to_iso_string(rental_doc["updated_at"]),
+        }
+
 
 # Singleton instance
 rental_service = RentalService()
@@ -9,15 +9,34 @@ Date: 06-01-2026
 """
 
 import uuid
+import time
+import asyncio
 import logging
 from datetime import datetime, timezone, date
-from typing import Optional, List, Dict, Any
+from typing import (
+    Optional,
+    List,
+    Dict,
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Tuple,
+)
+
+import orjson
+from pydantic_core import to_json
 
-from core import db_manager, rabbitmq_manager
-from core.pricing_calculator import calculate_total_price, determine_pricing_strategy
+from core import db_manager, rabbitmq_manager, to_iso_string, to_date
+from core.response_cache import ResponseCache
+from core.pricing_calculator import (
+    PricingStrategyType,
+    calculate_rental_days,
+    calculate_total_price,
+    determine_pricing_strategy,
+)
 from schemas.db_models import (
     InvoiceDocument,
-    ReservationDocument,
+    RESERVATION_DOC_ADAPTER,
     ReservationAddOnDocument,
 )
 from schemas.api.requests.reservations import (
@@ -31,12 +50,113 @@ from schemas.api.responses.reservations import (
     ReservationAddOnData,
     InvoiceData,
 )
-from schemas.domain import ReservationStatus, EventTypes
-from core.pricing_calculator import calculate_rental_days
+from schemas.domain import (
+    ReservationStatus,
+    RESERVATION_CONFIRMED,
+    RESERVATION_MODIFIED,
+)
 
 
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference for timestamps (skips the attribute lookup)
+_UTC = timezone.utc
+
+# Encoded list payloads keyed by (filters, reservations collection version)
+_list_cache = ResponseCache(max_size=128)
+
+# Reference documents (branches, insurance tiers, add-ons) keyed by
+# (collection, document ID, collection version)
+_reference_cache = ResponseCache(max_size=1024)
+
+# Fields read by _encode_reservation_doc (add_ons is only used by documents
+# written before add_ons_json existed)
+_RESERVATION_PROJECTION = dict.fromkeys(
+    (
+        "status",
+        "customer_id",
+        "vehicle_id",
+        "insurance_tier_id",
+        "pickup_branch_id",
+        "return_branch_id",
+        "pickup_date",
+        "return_date",
+        "add_ons",
+        "add_ons_json",
+        "total_price",
+        "invoice",
+        "created_at",
+        "updated_at",
+    ),
+    1,
+)
+
+# Empty add-ons as encoded by to_json, replaced by the cached add_ons_json
+_EMPTY_ADD_ONS = b'"add_ons":[]'
+
+# Pricing strategy per customer: customer_id -> (expires_at, strategy). Entries
+# are dropped when this process creates or deletes a reservation; the TTL
+# bounds staleness from writes made elsewhere
+_strategy_cache = ResponseCache(max_size=1024)
+_STRATEGY_TTL_SECONDS = 30.0
+
+
+async def _no_documents() -> List[Dict[str, Any]]:
+    """Stand-in lookup for an empty ID list (skips the database round-trip)"""
+    return []
+
+
+async def _find_reference(
+    collection_name: str, document_id: str
+) -> Optional[Dict[str, Any]]:
+    """
+    Look up a read-mostly reference document, memoized per collection version.
+
+    Writes through the database manager bump the version, so cached documents
+    are never served after a change. Misses are not cached.
+    """
+    key = (collection_name, document_id, db_manager.collection_version(collection_name))
+    document = _reference_cache.get(key)
+    if document is None:
+        document = await db_manager.load_by_id(collection_name, document_id)
+        if document is not None:
+            _reference_cache.set(key, document)
+    return document
+
+
+async def _find_add_ons(add_on_ids: List[str]) -> List[Dict[str, Any]]:
+    """Look up add-ons through the reference cache, querying only the misses"""
+    version = db_manager.collection_version("add_ons")
+    found: Dict[str, Dict[str, Any]] = {}
+    missing = []
+    for add_on_id in add_on_ids:
+        document = _reference_cache.get(("add_ons", add_on_id, version))
+        if document is None:
+            missing.append(add_on_id)
+        else:
+            found[add_on_id] = document
+
+    if missing:
+        for document in await db_manager.find_add_ons_by_ids(missing):
+            _reference_cache.set(("add_ons", document["_id"], version), document)
+            found[document["_id"]] = document
+
+    return list(found.values())
+
+
+async def _gather_in_order(*lookups: Awaitable[Any]) -> List[Any]:
+    """
+    Await independent lookups concurrently and return results in order.
+
+    Every lookup runs to completion; if any failed, the error from the
+    earliest argument is raised, so failures do not depend on timing.
+    """
+    results = await asyncio.gather(*lookups, return_exceptions=True)
+    for result in results:
+        if isinstance(result, BaseException):
+            raise result
+    return results
+
 
 class ReservationService:
     """
@@ -46,6 +166,31 @@ class ReservationService:
     including price calculation and vehicle availability validation.
     """
 
+    @staticmethod
+    async def _get_pricing_strategy(customer_id: str) -> PricingStrategyType:
+        """
+        Resolve a customer's pricing strategy from their reservation history.
+
+        The reservation count is read with count_documents and the resulting
+        strategy is cached for a short TTL.
+
+        Args:
+            customer_id (str): Customer ID
+
+        Returns:
+            PricingStrategyType: The pricing strategy to use
+        """
+        cached = _strategy_cache.get(customer_id)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        reservation_count = await db_manager.count_reservations_by_customer(customer_id)
+        strategy_type = determine_pricing_strategy(reservation_count)
+        _strategy_cache.set(
+            customer_id, (time.monotonic() + _STRATEGY_TTL_SECONDS, strategy_type)
+        )
+        return strategy_type
+
     @staticmethod
     async def _calculate_total_price(
         customer_id: str,
@@ -54,6 +199,7 @@ class ReservationService:
         add_on_ids: List[str],
         pickup_date: date,
         return_date: date,
+        add_on_snapshot: Optional[List[Dict[str, Any]]] = None,
     ) -> tuple[float, List[ReservationAddOnDocument], int]:
         """
         Calculate total reservation price using pricing strategy logic.
@@ -68,6 +214,9 @@ class ReservationService:
             add_on_ids (List[str]): List of add-on IDs
             pickup_date (date): Pickup date
             return_date (date): Return date
+            add_on_snapshot (Optional[List[Dict[str, Any]]]): Add-ons already
+                stored on the reservation; when given, add_on_ids is ignored and
+                the snapshot prices are reused without a lookup
 
         Returns:
             tuple[float, List[ReservationAddOnDocument], int]:
@@ -78,55 +227,67 @@ class ReservationService:
         Raises:
             ValueError: If vehicle, insurance tier, or any add-on not found
         """
-        # Fetch customer (to determine pricing strategy)
-        customer_doc = await db_manager.find_customer_by_id(customer_id)
+        # The lookups are independent, so dispatch them in one round-trip
+        (
+            customer_doc,
+            vehicle_doc,
+            insurance_doc,
+            add_on_docs,
+            strategy_type,
+        ) = await _gather_in_order(
+            db_manager.load_by_id("customers", customer_id),
+            db_manager.load_by_id("vehicles", vehicle_id),
+            _find_reference("insurance_tiers", insurance_tier_id),
+            (
+                _find_add_ons(add_on_ids)
+                if add_on_ids and add_on_snapshot is None
+                else _no_documents()
+            ),
+            ReservationService._get_pricing_strategy(customer_id),
+        )
+
         if not customer_doc:
             raise ValueError(f"Customer with ID '{customer_id}' not found")
 
-        # Fetch vehicle
-        vehicle_doc = await db_manager.find_vehicle_by_id(vehicle_id)
         if not vehicle_doc:
             raise ValueError(f"Vehicle with ID '{vehicle_id}' not found")
 
-        # Fetch insurance tier
-        insurance_doc = await db_manager.find_insurance_tier_by_id(insurance_tier_id)
         if not insurance_doc:
             raise ValueError(f"Insurance tier with ID '{insurance_tier_id}' not found")
 
-        # Fetch add-ons
-        add_on_docs = []
+        # Validate all add-ons found
         add_on_documents = []
-        if add_on_ids:
-            add_on_docs = await db_manager.find_add_ons_by_ids(add_on_ids)
-
-            # Validate all add-ons found
-            found_ids = {doc["_id"] for doc in add_on_docs}
-            missing_ids = set(add_on_ids) - found_ids
-            if missing_ids:
-                raise ValueError(f"Add-ons not found: {missing_ids}")
-
-            # Create add-on documents with snapshot pricing
+        if add_on_snapshot is not None:
+            # Stored snapshots were validated on write, so skip re-validation
             add_on_documents = [
-                ReservationAddOnDocument(
-                    id=doc["_id"],
-                    name=doc["name"],
-                    price_per_day=doc["price_per_day"],
+                ReservationAddOnDocument.model_construct(
+                    id=addon["id"],
+                    name=addon["name"],
+                    price_per_day=addon["price_per_day"],
                 )
-                for doc in add_on_docs
+                for addon in add_on_snapshot
             ]
+        elif add_on_ids:
+            # One pass over the requested IDs (deduplicated, in request order)
+            # both validates and builds the add-on documents with snapshot pricing
+            by_id = {doc["_id"]: doc for doc in add_on_docs}
+            missing_ids = set()
+            for aid in dict.fromkeys(add_on_ids):
+                doc = by_id.get(aid)
+                if doc is None:
+                    missing_ids.add(aid)
+                    continue
+                add_on_documents.append(
+                    ReservationAddOnDocument(
+                        id=aid, name=doc["name"], price_per_day=doc["price_per_day"]
+                    )
+                )
+            if missing_ids:
+                raise ValueError(f"Add-ons not found: {missing_ids}")
 
         # Calculate rental days
         rental_days = calculate_rental_days(pickup_date, return_date)
 
-        # Determine pricing strategy based on customer's reservation history
-        # Count existing reservations for this customer
-        existing_reservations = await db_manager.find_reservations_by_customer(
-            customer_id
-        )
-        reservation_count = len(existing_reservations)
-
-        strategy_type = determine_pricing_strategy(reservation_count)
-
         # Calculate total price using pricing calculator
         addon_prices = [doc.price_per_day for doc in add_on_documents]
 
@@ -139,15 +300,17 @@ class ReservationService:
             strategy_type=strategy_type,
         )
 
-        logger.info(
-            f"Price calculation: vehicle=${vehicle_doc['price_per_day']}/day, "
-            f"insurance=${insurance_doc['price_per_day']}/day, "
-            f"add-ons=${sum(addon_prices)}/day, "
-            f"days={rental_days}, "
-            f"strategy={strategy_type}, "
-            f"customer_reservations={reservation_count}, "
-            f"total=${total_price}"
-        )
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Price calculation: vehicle=$%s/day, insurance=$%s/day, "
+                "add-ons=$%s/day, days=%s, strategy=%s, total=$%s",
+                vehicle_doc["price_per_day"],
+                insurance_doc["price_per_day"],
+                sum(addon_prices),
+                rental_days,
+                strategy_type,
+                total_price,
+            )
 
         return total_price, add_on_documents, rental_days
 
@@ -172,93 +335,109 @@ class ReservationService:
         Raises:
             ValueError: If any validation fails (entity not found, vehicle unavailable)
         """
-        # Validate branches exist (customer/vehicle validated in _calculate_total_price)
-        pickup_branch_doc = await db_manager.find_branch_by_id(request.pickup_branch_id)
+        # Branch lookups, the availability check and pricing are independent,
+        # so dispatch them together. Pricing errors are held back until the
+        # branch and availability checks pass, keeping the error precedence
+        pickup_branch_doc, return_branch_doc, is_available, pricing = (
+            await asyncio.gather(
+                _find_reference("branches", request.pickup_branch_id),
+                _find_reference("branches", request.return_branch_id),
+                db_manager.check_vehicle_availability(
+                    vehicle_id=request.vehicle_id,
+                    pickup_date=request.pickup_date,
+                    return_date=request.return_date,
+                ),
+                # Validates customer, vehicle, insurance tier, and add-ons
+                ReservationService._calculate_total_price(
+                    customer_id=request.customer_id,
+                    vehicle_id=request.vehicle_id,
+                    insurance_tier_id=request.insurance_tier_id,
+                    add_on_ids=request.add_on_ids,
+                    pickup_date=request.pickup_date,
+                    return_date=request.return_date,
+                ),
+                return_exceptions=True,
+            )
+        )
+        for result in (pickup_branch_doc, return_branch_doc, is_available):
+            if isinstance(result, BaseException):
+                raise result
+
         if not pickup_branch_doc:
             raise ValueError(
                 f"Pickup branch with ID '{request.pickup_branch_id}' not found"
             )
 
-        return_branch_doc = await db_manager.find_branch_by_id(request.return_branch_id)
         if not return_branch_doc:
             raise ValueError(
                 f"Return branch with ID '{request.return_branch_id}' not found"
             )
 
-        # Check vehicle availability
-        is_available = await db_manager.check_vehicle_availability(
-            vehicle_id=request.vehicle_id,
-            pickup_date=request.pickup_date,
-            return_date=request.return_date,
-        )
         if not is_available:
             raise ValueError(
                 f"Vehicle '{request.vehicle_id}' is not available "
                 f"from {request.pickup_date} to {request.return_date}"
             )
 
-        # Calculate total price (validates customer, vehicle, insurance tier, and add-ons)
-        total_price, add_on_documents, rental_days = (
-            await ReservationService._calculate_total_price(
-                customer_id=request.customer_id,
-                vehicle_id=request.vehicle_id,
-                insurance_tier_id=request.insurance_tier_id,
-                add_on_ids=request.add_on_ids,
-                pickup_date=request.pickup_date,
-                return_date=request.return_date,
-            )
-        )
+        if isinstance(pricing, BaseException):
+            raise pricing
+        total_price, add_on_documents, rental_days = pricing
 
         # Generate reservation ID
-        reservation_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        reservation_id = uuid.uuid4().hex
+        current_time = datetime.now(_UTC)
 
         # Create invoice document
         invoice_doc = InvoiceDocument(
-            id=str(uuid.uuid4()),
+            id=uuid.uuid4().hex,
             status="pending",
             issued_date=current_time.date(),
             total_price=total_price,
         )
 
         # Create database document
-        reservation_doc = ReservationDocument(
-            _id=reservation_id,
-            status=ReservationStatus.PENDING.value,
-            customer_id=request.customer_id,
-            vehicle_id=request.vehicle_id,
-            insurance_tier_id=request.insurance_tier_id,
-            pickup_branch_id=request.pickup_branch_id,
-            return_branch_id=request.return_branch_id,
-            pickup_date=request.pickup_date,
-            return_date=request.return_date,
-            add_ons=add_on_documents,
-            total_price=total_price,
-            rental_days=rental_days,
-            invoice=invoice_doc,
-            created_at=current_time,
-            updated_at=current_time,
+        reservation_doc = RESERVATION_DOC_ADAPTER.validate_python(
+            {
+                "_id": reservation_id,
+                "status": ReservationStatus.PENDING.value,
+                "customer_id": request.customer_id,
+                "vehicle_id": request.vehicle_id,
+                "insurance_tier_id": request.insurance_tier_id,
+                "pickup_branch_id": request.pickup_branch_id,
+                "return_branch_id": request.return_branch_id,
+                "pickup_date": request.pickup_date,
+                "return_date": request.return_date,
+                "add_ons": add_on_documents,
+                "add_ons_json": ReservationService._encode_add_ons(
+                    ReservationService._add_on_rows(add_on_documents)
+                ),
+                "total_price": total_price,
+                "invoice": invoice_doc,
+                "created_at": current_time,
+                "updated_at": current_time,
+            }
         )
 
         # Update vehicle status to 'reserved'
         try:
             await db_manager.update_vehicle(request.vehicle_id, {"status": "reserved"})
-            logger.info(f"Updated vehicle {request.vehicle_id} status to 'reserved'")
+            logger.info("Updated vehicle %s status to 'reserved'", request.vehicle_id)
         except Exception as e:
-            logger.error(f"Failed to update vehicle status: {e}")
+            logger.error("Failed to update vehicle status: %s", e)
 
         # Save reservation to the database
         try:
             await db_manager.create_reservation(reservation_doc)
-            logger.info(f"Successfully created reservation: {reservation_id}")
+            _strategy_cache.discard(request.customer_id)
+            logger.info("Successfully created reservation: %s", reservation_id)
         except Exception as e:
-            logger.error(f"Failed to create reservation: {e}")
+            logger.error("Failed to create reservation: %s", e)
             raise
 
         # Publish ReservationConfirmed event
         try:
             await rabbitmq_manager.publish_event(
-                event_type=EventTypes.RESERVATION_CONFIRMED,
+                event_type=RESERVATION_CONFIRMED,
                 data={
                     "reservation_id": reservation_id,
                     "customer_id": request.customer_id,
@@ -268,9 +447,9 @@ class ReservationService:
                     "total_price": total_price,
                 },
             )
-            logger.info(f"Published ReservationConfirmed event for {reservation_id}")
+            logger.info("Published ReservationConfirmed event for %s", reservation_id)
         except Exception as e:
-            logger.error(f"Failed to publish event: {e}")
+            logger.error("Failed to publish event: %s", e)
 
         # Return response data
         return ReservationData(
@@ -281,8 +460,8 @@ class ReservationService:
             insurance_tier_id=request.insurance_tier_id,
             pickup_branch_id=request.pickup_branch_id,
             return_branch_id=request.return_branch_id,
-            pickup_date=request.pickup_date,
-            return_date=request.return_date,
+            pickup_date=to_iso_string(request.pickup_date),
+            return_date=to_iso_string(request.return_date),
             add_ons=[
                 ReservationAddOnData(
                     id=addon.id,
@@ -293,9 +472,14 @@ class ReservationService:
             ],
             total_price=total_price,
             rental_days=rental_days,
-            invoice=invoice_doc,
-            created_at=current_time,
-            updated_at=current_time,
+            invoice=InvoiceData(
+                id=invoice_doc.id,
+                status=invoice_doc.status,
+                issued_date=to_iso_string(invoice_doc.issued_date),
+                total_price=invoice_doc.total_price,
+            ),
+            created_at=to_iso_string(current_time),
+            updated_at=to_iso_string(current_time),
         )
 
     @staticmethod
@@ -312,39 +496,30 @@ class ReservationService:
         reservation_doc = await db_manager.find_reservation_by_id(reservation_id)
 
         if not reservation_doc:
-            logger.info(f"Reservation not found: {reservation_id}")
+            logger.info("Reservation not found: %s", reservation_id)
             return None
 
         # Convert MongoDB document to response model
-        return ReservationData(
-            id=reservation_doc["_id"],
-            status=reservation_doc["status"],
-            customer_id=reservation_doc["customer_id"],
-            vehicle_id=reservation_doc["vehicle_id"],
-            insurance_tier_id=reservation_doc["insurance_tier_id"],
-            pickup_branch_id=reservation_doc["pickup_branch_id"],
-            return_branch_id=reservation_doc["return_branch_id"],
-            pickup_date=reservation_doc["pickup_date"],
-            return_date=reservation_doc["return_date"],
-            add_ons=[
-                ReservationAddOnData(
-                    id=addon["id"],
-                    name=addon["name"],
-                    price_per_day=addon["price_per_day"],
-                )
-                for addon in reservation_doc.get("add_ons", [])
-            ],
-            total_price=reservation_doc["total_price"],
-            rental_days=reservation_doc["rental_days"],
-            invoice=InvoiceData(
-                id=reservation_doc["invoice"]["id"],
-                status=reservation_doc["invoice"]["status"],
-                issued_date=reservation_doc["invoice"]["issued_date"],
-                total_price=reservation_doc["invoice"]["total_price"],
-            ),
-            created_at=reservation_doc["created_at"],
-            updated_at=reservation_doc["updated_at"],
-        )
+        return ReservationService._doc_to_reservation_data(reservation_doc)
+
+    @staticmethod
+    async def get_reservation_json(reservation_id: str) -> Optional[bytes]:
+        """
+        Get a reservation by ID as JSON-encoded ReservationData.
+
+        Args:
+            reservation_id (str): Reservation's unique identifier.
+
+        Returns:
+            Optional[bytes]: Encoded reservation data or None if not found.
+        """
+        reservation_doc = await db_manager.find_reservation_by_id(reservation_id)
+
+        if not reservation_doc:
+            logger.info("Reservation not found: %s", reservation_id)
+            return None
+
+        return ReservationService._encode_reservation_doc(reservation_doc)
 
     @staticmethod
     async def update_reservation(
@@ -373,7 +548,7 @@ class ReservationService:
         # Check if reservation exists
         existing_reservation = await db_manager.find_reservation_by_id(reservation_id)
         if not existing_reservation:
-            logger.info(f"Reservation not found for update: {reservation_id}")
+            logger.info("Reservation not found for update: %s", reservation_id)
             return None
 
         # Validate reservation status
@@ -391,55 +566,70 @@ class ReservationService:
         if request.status is not None:
             update_data["status"] = request.status.value
 
-        # Vehicle update
+        # The referenced-entity lookups are independent, so collect them by
+        # name and dispatch them together; checks below run in a fixed order
+        lookups: Dict[str, Awaitable[Any]] = {}
         if request.vehicle_id is not None:
-            vehicle_doc = await db_manager.find_vehicle_by_id(request.vehicle_id)
-            if not vehicle_doc:
-                raise ValueError(f"Vehicle with ID '{request.vehicle_id}' not found")
+            lookups["vehicle"] = db_manager.load_by_id("vehicles", request.vehicle_id)
 
             # Check availability if vehicle changes
             pickup_date = request.pickup_date or existing_reservation["pickup_date"]
             return_date = request.return_date or existing_reservation["return_date"]
-
-            is_available = await db_manager.check_vehicle_availability(
+            lookups["available"] = db_manager.check_vehicle_availability(
                 vehicle_id=request.vehicle_id,
                 pickup_date=pickup_date,
                 return_date=return_date,
                 exclude_reservation_id=reservation_id,
             )
-            if not is_available:
+        if request.insurance_tier_id is not None:
+            lookups["insurance"] = _find_reference(
+                "insurance_tiers", request.insurance_tier_id
+            )
+        if request.pickup_branch_id is not None:
+            lookups["pickup_branch"] = _find_reference(
+                "branches", request.pickup_branch_id
+            )
+        if request.return_branch_id is not None:
+            lookups["return_branch"] = _find_reference(
+                "branches", request.return_branch_id
+            )
+        found = dict(zip(lookups, await _gather_in_order(*lookups.values())))
+
+        # Vehicle update
+        if request.vehicle_id is not None:
+            if not found["vehicle"]:
+                raise ValueError(f"Vehicle with ID '{request.vehicle_id}' not found")
+
+            if not found["available"]:
                 raise ValueError(
                     f"Vehicle '{request.vehicle_id}' is not available "
                     f"from {pickup_date} to {return_date}"
                 )
 
             update_data["vehicle_id"] = request.vehicle_id
-            needs_price_recalculation = True
+            if request.vehicle_id != existing_reservation["vehicle_id"]:
+                needs_price_recalculation = True
 
         # Insurance tier update
         if request.insurance_tier_id is not None:
-            insurance_doc = await db_manager.find_insurance_tier_by_id(
-                request.insurance_tier_id
-            )
-            if not insurance_doc:
+            if not found["insurance"]:
                 raise ValueError(
                     f"Insurance tier with ID '{request.insurance_tier_id}' not found"
                 )
             update_data["insurance_tier_id"] = request.insurance_tier_id
-            needs_price_recalculation = True
+            if request.insurance_tier_id != existing_reservation["insurance_tier_id"]:
+                needs_price_recalculation = True
 
         # Branch updates
         if request.pickup_branch_id is not None:
-            branch_doc = await db_manager.find_branch_by_id(request.pickup_branch_id)
-            if not branch_doc:
+            if not found["pickup_branch"]:
                 raise ValueError(
                     f"Pickup branch with ID '{request.pickup_branch_id}' not found"
                 )
             update_data["pickup_branch_id"] = request.pickup_branch_id
 
         if request.return_branch_id is not None:
-            branch_doc = await db_manager.find_branch_by_id(request.return_branch_id)
-            if not branch_doc:
+            if not found["return_branch"]:
                 raise ValueError(
                     f"Return branch with ID '{request.return_branch_id}' not found"
                 )
@@ -448,15 +638,23 @@ class ReservationService:
         # Date updates
         if request.pickup_date is not None:
             update_data["pickup_date"] = request.pickup_date
-            needs_price_recalculation = True
+            if request.pickup_date != to_date(existing_reservation["pickup_date"]):
+                needs_price_recalculation = True
 
         if request.return_date is not None:
             update_data["return_date"] = request.return_date
-            needs_price_recalculation = True
+            if request.return_date != to_date(existing_reservation["return_date"]):
+                needs_price_recalculation = True
 
-        # Add-ons update
+        # Add-ons update (only a different set of add-ons affects the price)
+        add_ons_changed = False
         if request.add_on_ids is not None:
-            needs_price_recalculation = True
+            stored_add_on_ids = [
+                addon["id"] for addon in existing_reservation.get("add_ons", ())
+            ]
+            add_ons_changed = sorted(request.add_on_ids) != sorted(stored_add_on_ids)
+            if add_ons_changed:
+                needs_price_recalculation = True
 
         # Recalculate price if needed
         if needs_price_recalculation:
@@ -468,72 +666,80 @@ class ReservationService:
             final_insurance_id = update_data.get(
                 "insurance_tier_id", existing_reservation["insurance_tier_id"]
             )
-            final_pickup_date = update_data.get(
-                "pickup_date", existing_reservation["pickup_date"]
+            # Stored dates may be ISO strings or datetimes; pricing needs dates
+            final_pickup_date = to_date(
+                update_data.get("pickup_date", existing_reservation["pickup_date"])
             )
-            final_return_date = update_data.get(
-                "return_date", existing_reservation["return_date"]
+            final_return_date = to_date(
+                update_data.get("return_date", existing_reservation["return_date"])
             )
-            final_add_on_ids = (
-                request.add_on_ids
-                if request.add_on_ids is not None
-                else [addon["id"] for addon in existing_reservation.get("add_ons", [])]
+            # Unchanged add-ons keep their stored snapshot (no lookup needed)
+            add_on_snapshot = (
+                None if add_ons_changed else existing_reservation.get("add_ons", [])
             )
 
-            # Recalculate total price (includes rental_days calculation)
-            total_price, add_on_documents, rental_days = (
+            # Recalculate total price (rental_days is derived from the dates)
+            total_price, add_on_documents, _ = (
                 await ReservationService._calculate_total_price(
                     customer_id=final_customer_id,
                     vehicle_id=final_vehicle_id,
                     insurance_tier_id=final_insurance_id,
-                    add_on_ids=final_add_on_ids,
+                    add_on_ids=request.add_on_ids or [],
                     pickup_date=final_pickup_date,
                     return_date=final_return_date,
+                    add_on_snapshot=add_on_snapshot,
                 )
             )
 
             update_data["total_price"] = total_price
-            update_data["rental_days"] = rental_days
-            update_data["add_ons"] = [addon.model_dump() for addon in add_on_documents]
+            # Plain dicts for the $set (no per-add-on model_dump), encoded once
+            add_on_rows = ReservationService._add_on_rows(add_on_documents)
+            update_data["add_ons"] = add_on_rows
+            update_data["add_ons_json"] = ReservationService._encode_add_ons(
+                add_on_rows
+            )
 
             # Auto sync invoice price
             update_data["invoice.total_price"] = total_price
 
             logger.info(
-                f"Recalculated price for reservation {reservation_id}: ${total_price} "
-                f"(invoice auto-synced)"
+                "Recalculated price for reservation %s: $%s (invoice auto-synced)",
+                reservation_id,
+                total_price,
             )
 
-        # If no fields to update, return current data
+        # If no fields to update, return the document already read above
         if not update_data:
-            logger.info(f"No fields to update for reservation: {reservation_id}")
-            return await ReservationService.get_reservation_by_id(reservation_id)
+            logger.info("No fields to update for reservation: %s", reservation_id)
+            return ReservationService._doc_to_reservation_data(existing_reservation)
 
-        # Update in database
+        # Update in database and get the post-update document in one round trip
         try:
-            success = await db_manager.update_reservation(reservation_id, update_data)
-            if not success:
+            updated_doc = await db_manager.find_and_update_reservation(
+                reservation_id, update_data
+            )
+            if updated_doc is None:
                 return None
 
-            logger.info(f"Successfully updated reservation: {reservation_id}")
+            logger.info("Successfully updated reservation: %s", reservation_id)
         except Exception as e:
-            logger.error(f"Failed to update reservation: {e}")
+            logger.error("Failed to update reservation: %s", e)
             raise
 
         # Publish ReservationModified event
         try:
             await rabbitmq_manager.publish_event(
-                event_type=EventTypes.RESERVATION_MODIFIED,
+                event_type=RESERVATION_MODIFIED,
                 data={
                     "reservation_id": reservation_id,
                 },
             )
-            logger.info(f"Published ReservationConfirmed event for {reservation_id}")
+            logger.info("Published ReservationConfirmed event for %s", reservation_id)
         except Exception as e:
-            logger.error(f"Failed to publish event: {e}")
+            logger.error("Failed to publish event: %s", e)
 
         # Return updated reservation data
-        return await ReservationService.get_reservation_by_id(reservation_id)
+        return ReservationService._doc_to_reservation_data(updated_doc)
 
     @staticmethod
     async def delete_reservation(reservation_id: str) -> bool:
@@ -546,29 +752,157 @@ class ReservationService:
         Returns:
             bool: True if deleted, False if not found.
         """
-        success = await db_manager.delete_reservation(reservation_id)
+        # Delete and learn the owner in one round trip
+        deleted_doc = await db_manager.find_and_delete_reservation(
+            reservation_id, projection={"customer_id": 1}
+        )
 
-        if success:
-            logger.info(f"Successfully deleted reservation: {reservation_id}")
-        else:
-            logger.info(f"Reservation not found for deletion: {reservation_id}")
+        if deleted_doc is None:
+            logger.info("Reservation not found for deletion: %s", reservation_id)
+            return False
 
-        return success
+        # The customer's reservation count changed, so drop their pricing strategy
+        _strategy_cache.discard(deleted_doc["customer_id"])
+        logger.info("Successfully deleted reservation: %s", reservation_id)
+        return True
 
     @staticmethod
-    async def list_reservations(
-        filters: ReservationFilterRequest,
-    ) -> ReservationListData:
+    def _doc_to_reservation_data(
+        reservation_doc: Dict[str, Any], include_add_ons: bool = True
+    ) -> ReservationData:
         """
-        List reservations with optional filters.
+        Convert a MongoDB reservation document to its response model.
+
+        Args:
+            reservation_doc (Dict[str, Any]): Reservation document from the database.
+            include_add_ons (bool): Build the add-on models; when False,
+                add_ons is left empty for the caller to fill in.
+
+        Returns:
+            ReservationData: Reservation data for response.
+        """
+        # DB data is trusted (validated on write), so skip re-validation
+        return ReservationData.model_construct(
+            id=reservation_doc["_id"],
+            status=reservation_doc["status"],
+            customer_id=reservation_doc["customer_id"],
+            vehicle_id=reservation_doc["vehicle_id"],
+            insurance_tier_id=reservation_doc["insurance_tier_id"],
+            pickup_branch_id=reservation_doc["pickup_branch_id"],
+            return_branch_id=reservation_doc["return_branch_id"],
+            pickup_date=to_iso_string(reservation_doc["pickup_date"]),
+            return_date=to_iso_string(reservation_doc["return_date"]),
+            add_ons=[
+                ReservationAddOnData.model_construct(
+                    id=addon["id"],
+                    name=addon["name"],
+                    price_per_day=addon["price_per_day"],
+                )
+                for addon in (
+                    reservation_doc.get("add_ons", ()) if include_add_ons else ()
+                )
+            ],
+            total_price=reservation_doc["total_price"],
+            rental_days=ReservationService._rental_days(reservation_doc),
+            invoice=InvoiceData.model_construct(
+                id=reservation_doc["invoice"]["id"],
+                status=reservation_doc["invoice"]["status"],
+                issued_date=to_iso_string(reservation_doc["invoice"]["issued_date"]),
+                total_price=reservation_doc["invoice"]["total_price"],
+            ),
+            created_at=to_iso_string(reservation_doc["created_at"]),
+            updated_at=to_iso_string(reservation_doc["updated_at"]),
+        )
+
+    @staticmethod
+    def _encode_reservation_doc(reservation_doc: Dict[str, Any]) -> bytes:
+        """
+        Encode a reservation document as ReservationData JSON.
+
+        The add-ons serialized at write time (add_ons_json) are spliced into
+        the payload instead of being rebuilt as models and re-encoded.
+        Documents without the cached blob are encoded in full.
+
+        Args:
+            reservation_doc (Dict[str, Any]): Reservation document from the database.
+
+        Returns:
+            bytes: JSON-encoded ReservationData.
+        """
+        add_ons_json = reservation_doc.get("add_ons_json")
+        if add_ons_json is None:
+            return to_json(ReservationService._doc_to_reservation_data(reservation_doc))
+
+        reservation_data = ReservationService._doc_to_reservation_data(
+            reservation_doc, include_add_ons=False
+        )
+        # Quotes inside JSON strings are escaped, so this only matches the key
+        return to_json(reservation_data).replace(
+            _EMPTY_ADD_ONS, b'"add_ons":' + add_ons_json.encode(), 1
+        )
+
+    @staticmethod
+    def _rental_days(reservation_doc: Dict[str, Any]) -> int:
+        """
+        Derive rental days from a stored reservation's dates.
+
+        Args:
+            reservation_doc (Dict[str, Any]): Reservation document from the database.
+
+        Returns:
+            int: Number of rental days.
+        """
+        return calculate_rental_days(
+            to_date(reservation_doc["pickup_date"]),
+            to_date(reservation_doc["return_date"]),
+        )
+
+    @staticmethod
+    def _add_on_rows(
+        add_on_documents: List[ReservationAddOnDocument],
+    ) -> List[Dict[str, Any]]:
+        """
+        Build the stored form of add-on snapshots as plain dicts.
+
+        Args:
+            add_on_documents (List[ReservationAddOnDocument]): Add-on snapshots.
+
+        Returns:
+            List[Dict[str, Any]]: {id, name, price_per_day} dicts.
+        """
+        return [
+            {
+                "id": addon.id,
+                "name": addon.name,
+                "price_per_day": addon.price_per_day,
+            }
+            for addon in add_on_documents
+        ]
+
+    @staticmethod
+    def _encode_add_ons(add_on_rows: List[Dict[str, Any]]) -> str:
+        """
+        Serialize reservation add-ons once so reads can reuse the JSON.
+
+        Args:
+            add_on_rows (List[Dict[str, Any]]): Add-on dicts from _add_on_rows.
+
+        Returns:
+            str: JSON array of {id, name, price_per_day} objects.
+        """
+        return orjson.dumps(add_on_rows).decode()
+
+    @staticmethod
+    def _build_query_filters(filters: ReservationFilterRequest) -> Dict[str, Any]:
+        """
+        Translate reservation filter criteria into a MongoDB query.
 
         Args:
             filters (ReservationFilterRequest): Filter criteria.
 
         Returns:
-            ReservationListData: List of reservations and total count.
+            Dict[str, Any]: MongoDB query filters.
         """
-        # Build MongoDB query filters
         query_filters: Dict[str, Any] = {}
 
         if filters.customer_id is not None:
@@ -589,51 +923,150 @@ class ReservationService:
                 date_filter["$lte"] = filters.pickup_date_to
             query_filters["pickup_date"] = date_filter
 
-        # Query database
-        reservation_docs = await db_manager.find_reservations(query_filters)
+        return query_filters
+
+    @staticmethod
+    async def _find_reservation_docs(
+        filters: ReservationFilterRequest,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Fetch the projected reservation documents matching the filters.
+
+        Args:
+            filters (ReservationFilterRequest): Filter criteria.
+
+        Returns:
+            Tuple[List[Dict[str, Any]], int]: Page of documents and the total
+                number of matching reservations.
+        """
+        # Build MongoDB query filters
+        query_filters = ReservationService._build_query_filters(filters)
+
+        # Query database; when paging, count all matches alongside the page
+        find_page = db_manager.find_reservations(
+            query_filters,
+            projection=_RESERVATION_PROJECTION,
+            skip=filters.skip,
+            limit=filters.limit,
+        )
+        if filters.skip or filters.limit is not None:
+            reservation_docs, total_count = await _gather_in_order(
+                find_page, db_manager.count_reservations(query_filters)
+            )
+        else:
+            reservation_docs = await find_page
+            total_count = len(reservation_docs)
+
+        logger.info(
+            "Retrieved %s reservations with filters: %s",
+            len(reservation_docs),
+            query_filters,
+        )
+
+        return reservation_docs, total_count
+
+    @staticmethod
+    async def list_reservations(
+        filters: ReservationFilterRequest,
+    ) -> ReservationListData:
+        """
+        List reservations with optional filters.
+
+        Args:
+            filters (ReservationFilterRequest): Filter criteria.
+
+        Returns:
+            ReservationListData: Page of reservations and the total number of
+                matching reservations.
+        """
+        reservation_docs, total_count = await ReservationService._find_reservation_docs(
+            filters
+        )
 
         # Convert to response models
         reservations = [
-            ReservationData(
-                id=doc["_id"],
-                status=doc["status"],
-                customer_id=doc["customer_id"],
-                vehicle_id=doc["vehicle_id"],
-                insurance_tier_id=doc["insurance_tier_id"],
-                pickup_branch_id=doc["pickup_branch_id"],
-                return_branch_id=doc["return_branch_id"],
-                pickup_date=doc["pickup_date"],
-                return_date=doc["return_date"],
-                add_ons=[
-                    ReservationAddOnData(
-                        id=addon["id"],
-                        name=addon["name"],
-                        price_per_day=addon["price_per_day"],
-                    )
-                    for addon in doc.get("add_ons", [])
-                ],
-                total_price=doc["total_price"],
-                rental_days=doc["rental_days"],
-                invoice=InvoiceData(
-                    id=doc["invoice"]["id"],
-                    status=doc["invoice"]["status"],
-                    issued_date=doc["invoice"]["issued_date"],
-                    total_price=doc["invoice"]["total_price"],
-                ),
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
-            )
-            for doc in reservation_docs
+            ReservationService._doc_to_reservation_data(doc) for doc in reservation_docs
         ]
 
-        logger.info(
-            f"Retrieved {len(reservations)} reservations with filters: {query_filters}"
+        return ReservationListData.model_construct(
+            reservations=reservations, total_count=total_count
         )
 
-        return ReservationListData(
-            reservations=reservations, total_count=len(reservations)
+    @staticmethod
+    async def list_reservations_json(
+        filters: ReservationFilterRequest,
+    ) -> Tuple[int, bytes]:
+        """
+        List reservations as a pre-encoded JSON payload, memoized per filter set.
+
+        Cached entries are keyed on the reservations collection version, so
+        any write through the database manager makes older entries
+        unreachable.
+
+        Args:
+            filters (ReservationFilterRequest): Filter criteria.
+
+        Returns:
+            Tuple[int, bytes]: Total count and JSON-encoded ReservationListData.
+        """
+        cache_key = (
+            tuple(filters.model_dump().items()),
+            db_manager.collection_version("reservations"),
         )
 
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        reservation_docs, total_count = await ReservationService._find_reservation_docs(
+            filters
+        )
+        data_json = b'{"reservations":[%s],"total_count":%d}' % (
+            b",".join(
+                map(ReservationService._encode_reservation_doc, reservation_docs)
+            ),
+            total_count,
+        )
+        cached = (total_count, data_json)
+        _list_cache.set(cache_key, cached)
+
+        return cached
+
+    @staticmethod
+    async def stream_reservations(
+        filters: ReservationFilterRequest,
+    ) -> AsyncIterator[bytes]:
+        """
+        Stream reservations as newline-delimited JSON.
+
+        Documents are serialized straight from the database cursor without
+        building ReservationData models, so memory stays constant regardless
+        of the result size.
+
+        Args:
+            filters (ReservationFilterRequest): Filter criteria.
+
+        Yields:
+            bytes: One JSON-encoded reservation per line.
+        """
+        query_filters = ReservationService._build_query_filters(filters)
+
+        async for doc in db_manager.stream_reservations(query_filters):
+            doc["id"] = doc.pop("_id")
+            doc["rental_days"] = ReservationService._rental_days(doc)
+            add_ons = doc.pop("add_ons", [])
+            add_ons_json = doc.pop("add_ons_json", None)
+
+            # Splice the add-ons cached at write time into the row instead of
+            # re-encoding them (older documents fall back to the embedded list)
+            add_ons_bytes = (
+                add_ons_json.encode()
+                if add_ons_json is not None
+                else orjson.dumps(add_ons, default=str)
+            )
+            row = orjson.dumps(doc, default=str)
+            yield row[:-1] + b',"add_ons":' + add_ons_bytes + b"}\n"
+
 
 # Singleton instance
 reservation_service = ReservationService()
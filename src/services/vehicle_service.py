@@ -7,23 +7,104 @@ Author: Peyman Khodabandehlouei
 Date: 05-01-2026
 """
 
-import uuid
+import time
 import logging
-from typing import Dict, Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, List, Mapping, Optional, AsyncIterator, Tuple
 from datetime import datetime, timezone
+
+import orjson
+from pydantic_core import to_json
 from pymongo.errors import DuplicateKeyError
 
+from core.clock_service import to_iso_string
+from core.id_generator import uuid7
 from core.database_manager import db_manager
-from schemas.db_models.vehicle_models import VehicleDocument
+from core.response_cache import ResponseCache
+from schemas.db_models.vehicle_models import VEHICLE_DOC_ADAPTER, VehicleDocument
 from schemas.api.requests import (
     CreateVehicleRequest,
     UpdateVehicleRequest,
     VehicleFilterRequest,
 )
 from schemas.api.responses import VehicleData, VehicleListData
+from schemas.domain import VehicleStatus
 
 logger = logging.getLogger(__name__)
 
+# Module-level UTC reference and clock for timestamps (skips the attribute lookups)
+_UTC = timezone.utc
+_utcnow = datetime.now
+
+# Fields read by _doc_to_vehicle_data
+_VEHICLE_PROJECTION = dict.fromkeys(
+    (
+        "plate_number",
+        "brand",
+        "model",
+        "year",
+        "vehicle_class",
+        "price_per_day",
+        "mileage",
+        "branch_id",
+        "status",
+        "created_at",
+        "updated_at",
+    ),
+    1,
+)
+
+# Encoded list payloads keyed by (filters, vehicles collection version)
+_list_cache = ResponseCache(max_size=128)
+
+# Single-vehicle responses keyed by (vehicle_id, vehicles collection version).
+# Writes through this process change the version; the TTL bounds how long a
+# write made by another process can go unseen
+_vehicle_cache = ResponseCache(max_size=10_000)
+_VEHICLE_TTL_SECONDS = 30.0
+
+
+@lru_cache(maxsize=256)
+def _query_filters_for(
+    vehicle_class: Optional[str],
+    status: Optional[VehicleStatus],
+    branch_id: Optional[str],
+    min_price: Optional[float],
+    max_price: Optional[float],
+) -> Mapping[str, Any]:
+    """
+    Build the MongoDB query for one combination of filter values.
+
+    Listing traffic repeats a small set of filter combinations, so each
+    query is built once and then reused. The result is wrapped read-only
+    because every caller with the same criteria shares it.
+
+    Returns:
+        Mapping[str, Any]: MongoDB query filters.
+    """
+    query_filters: Dict[str, Any] = {}
+
+    if vehicle_class is not None:
+        query_filters["vehicle_class"] = vehicle_class
+
+    if status is not None:
+        query_filters["status"] = status.value
+
+    if branch_id is not None:
+        query_filters["branch_id"] = branch_id
+
+    # Price range filter
+    if min_price is not None or max_price is not None:
+        price_filter = {}
+        if min_price is not None:
+            price_filter["$gte"] = min_price
+        if max_price is not None:
+            price_filter["$lte"] = max_price
+        query_filters["price_per_day"] = MappingProxyType(price_filter)
+
+    return MappingProxyType(query_filters)
+
 
 class VehicleService:
     """
@@ -46,37 +127,17 @@ class VehicleService:
         Raises:
             DuplicateKeyError: If plate_number already exists.
         """
-        # Check if plate number already exists
-        existing_vehicle = await db_manager.find_vehicle_by_plate(request.plate_number)
-        if existing_vehicle:
-            logger.warning(
-                f"Vehicle creation attempt with duplicate plate: {request.plate_number}"
-            )
-            raise DuplicateKeyError(
-                f"Plate number {request.plate_number} already exists"
-            )
-
-        # Generate vehicle ID
-        vehicle_id = str(uuid.uuid4())
-        current_time = datetime.now(timezone.utc)
+        # Time-ordered ID, so inserts land on the right edge of the _id index
+        vehicle_id = str(uuid7())
+        current_time = _utcnow(_UTC)
 
         # Create database document
-        vehicle_doc = VehicleDocument(
-            _id=vehicle_id,
-            plate_number=request.plate_number,
-            brand=request.brand,
-            model=request.model,
-            year=request.year,
-            vehicle_class=request.vehicle_class,
-            price_per_day=request.price_per_day,
-            mileage=request.mileage,
-            branch_id=request.branch_id,
-            status=request.status.value,
-            created_at=current_time,
-            updated_at=current_time,
+        vehicle_doc = VehicleService._build_vehicle_doc(
+            request, vehicle_id, current_time
         )
 
-        # Save to the database
+        # Save to the database; the unique plate_number index rejects duplicates
+        # (no lookup beforehand, and no check-then-insert race)
         try:
             await db_manager.create_vehicle(vehicle_doc)
             logger.info(f"Successfully created vehicle: {vehicle_id}")
@@ -85,7 +146,115 @@ class VehicleService:
             raise
 
         # Return response data
-        return VehicleData(
+        return VehicleService._request_to_vehicle_data(
+            request, vehicle_id, current_time
+        )
+
+    @staticmethod
+    async def create_many(
+        requests: List[CreateVehicleRequest],
+    ) -> List[Optional[VehicleData]]:
+        """
+        Create several vehicles with a single unordered bulk insert.
+
+        One duplicate plate number does not stop the other vehicles from
+        being created; its slot in the result is None instead.
+
+        Args:
+            requests (List[CreateVehicleRequest]): Validated vehicle creation data.
+
+        Returns:
+            List[Optional[VehicleData]]: Created vehicle data in request order,
+                None for each request rejected as a duplicate plate_number.
+
+        Raises:
+            WriteError: If the database rejected a row for any other reason.
+        """
+        # One timestamp for the whole batch
+        current_time = _utcnow(_UTC)
+        vehicle_ids = [str(uuid7()) for _ in requests]
+
+        vehicle_docs = [
+            VehicleService._build_vehicle_doc(request, vehicle_id, current_time)
+            for request, vehicle_id in zip(requests, vehicle_ids)
+        ]
+
+        errors = await db_manager.create_vehicles(vehicle_docs)
+
+        for index, error in errors.items():
+            if not isinstance(error, DuplicateKeyError):
+                raise error
+            logger.error(
+                "Duplicate key error for plate: %s", requests[index].plate_number
+            )
+
+        logger.info(
+            "Successfully created %s of %s vehicles",
+            len(requests) - len(errors),
+            len(requests),
+        )
+
+        return [
+            (
+                None
+                if index in errors
+                else VehicleService._request_to_vehicle_data(
+                    request, vehicle_id, current_time
+                )
+            )
+            for index, (request, vehicle_id) in enumerate(zip(requests, vehicle_ids))
+        ]
+
+    @staticmethod
+    def _build_vehicle_doc(
+        request: CreateVehicleRequest, vehicle_id: str, current_time: datetime
+    ) -> VehicleDocument:
+        """
+        Build the database document for a new vehicle.
+
+        Args:
+            request (CreateVehicleRequest): Validated vehicle creation data.
+            vehicle_id (str): ID for the new vehicle.
+            current_time (datetime): Creation timestamp.
+
+        Returns:
+            VehicleDocument: Validated vehicle document.
+        """
+        return VEHICLE_DOC_ADAPTER.validate_python(
+            {
+                "_id": vehicle_id,
+                "plate_number": request.plate_number,
+                "brand": request.brand,
+                "model": request.model,
+                "year": request.year,
+                "vehicle_class": request.vehicle_class,
+                "price_per_day": request.price_per_day,
+                "mileage": request.mileage,
+                "branch_id": request.branch_id,
+                "status": request.status.value,
+                "created_at": current_time,
+                "updated_at": current_time,
+            }
+        )
+
+    @staticmethod
+    def _request_to_vehicle_data(
+        request: CreateVehicleRequest, vehicle_id: str, current_time: datetime
+    ) -> VehicleData:
+        """
+        Build the response model for a newly created vehicle.
+
+        Args:
+            request (CreateVehicleRequest): Validated vehicle creation data.
+            vehicle_id (str): ID of the new vehicle.
+            current_time (datetime): Creation timestamp.
+
+        Returns:
+            VehicleData: Vehicle data for response.
+        """
+        timestamp = to_iso_string(current_time)
+        # Request fields were validated on the way in, so skip re-validation
+        return VehicleData.model_construct(
             id=vehicle_id,
             plate_number=request.plate_number,
             brand=request.brand,
@@ -96,8 +265,8 @@ class VehicleService:
             mileage=request.mileage,
             branch_id=request.branch_id,
             status=request.status.value,
-            created_at=current_time,
-            updated_at=current_time,
+            created_at=timestamp,
+            updated_at=timestamp,
         )
 
     @staticmethod
@@ -111,27 +280,24 @@ class VehicleService:
         Returns:
             Optional[VehicleData]: Vehicle data or None if not found.
         """
-        vehicle_doc = await db_manager.find_vehicle_by_id(vehicle_id)
+        cache_key = (vehicle_id, db_manager.collection_version("vehicles"))
+        cached = _vehicle_cache.get(cache_key)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+
+        # Concurrent lookups in the same loop tick share one $in query
+        vehicle_doc = await db_manager.load_by_id("vehicles", vehicle_id)
 
         if not vehicle_doc:
             logger.info(f"Vehicle not found: {vehicle_id}")
             return None
 
-        # Convert MongoDB document to response model
-        return VehicleData(
-            id=vehicle_doc["_id"],
-            plate_number=vehicle_doc["plate_number"],
-            brand=vehicle_doc["brand"],
-            model=vehicle_doc["model"],
-            year=vehicle_doc["year"],
-            vehicle_class=vehicle_doc["vehicle_class"],
-            price_per_day=vehicle_doc["price_per_day"],
-            mileage=vehicle_doc["mileage"],
-            branch_id=vehicle_doc["branch_id"],
-            status=vehicle_doc["status"],
-            created_at=vehicle_doc["created_at"],
-            updated_at=vehicle_doc["updated_at"],
+        # Convert MongoDB document to response model (frozen, so safe to share)
+        vehicle_data = VehicleService._doc_to_vehicle_data(vehicle_doc)
+        _vehicle_cache.set(
+            cache_key, (time.monotonic() + _VEHICLE_TTL_SECONDS, vehicle_data)
         )
+        return vehicle_data
 
     @staticmethod
     async def update_vehicle(
@@ -150,38 +316,24 @@ class VehicleService:
         Raises:
             DuplicateKeyError: If updating plate_number to existing value.
         """
-        # Check if vehicle exists
-        existing_vehicle = await db_manager.find_vehicle_by_id(vehicle_id)
-        if not existing_vehicle:
-            logger.info(f"Vehicle not found for update: {vehicle_id}")
-            return None
+        # Build update dict from the fields the caller actually set
+        update_data = request.model_dump(exclude_unset=True, exclude_none=True)
+        if "status" in update_data:
+            update_data["status"] = update_data["status"].value
 
-        # Build update dict (only include non-None fields)
-        update_data = {}
-        if request.brand is not None:
-            update_data["brand"] = request.brand
-        if request.model is not None:
-            update_data["model"] = request.model
-        if request.vehicle_class is not None:
-            update_data["vehicle_class"] = request.vehicle_class
-        if request.price_per_day is not None:
-            update_data["price_per_day"] = request.price_per_day
-        if request.mileage is not None:
-            update_data["mileage"] = request.mileage
-        if request.branch_id is not None:
-            update_data["branch_id"] = request.branch_id
-        if request.status is not None:
-            update_data["status"] = request.status.value
-
-        # If no fields to update, return current data
+        # If no fields to update, return current data; this is the only read
+        # on this path and is served from the vehicle cache when warm
         if not update_data:
             logger.info(f"No fields to update for vehicle: {vehicle_id}")
             return await VehicleService.get_vehicle_by_id(vehicle_id)
 
-        # Update in database
+        # Update and get the post-update document in one round trip
         try:
-            success = await db_manager.update_vehicle(vehicle_id, update_data)
-            if not success:
+            vehicle_doc = await db_manager.find_and_update_vehicle(
+                vehicle_id, update_data
+            )
+            if vehicle_doc is None:
+                logger.info(f"Vehicle not found for update: {vehicle_id}")
                 return None
 
             logger.info(f"Successfully updated vehicle: {vehicle_id}")
@@ -190,7 +342,7 @@ class VehicleService:
             raise
 
         # Return updated vehicle data
-        return await VehicleService.get_vehicle_by_id(vehicle_id)
+        return VehicleService._doc_to_vehicle_data(vehicle_doc)
 
     @staticmethod
     async def delete_vehicle(vehicle_id: str) -> bool:
@@ -212,63 +364,158 @@ class VehicleService:
 
         return success
 
+    @staticmethod
+    def _doc_to_vehicle_data(vehicle_doc: Dict[str, Any]) -> VehicleData:
+        """
+        Convert a MongoDB vehicle document to its response model.
+
+        Args:
+            vehicle_doc (Dict[str, Any]): Vehicle document from the database.
+
+        Returns:
+            VehicleData: Vehicle data for response.
+        """
+        # DB data is trusted (validated on write), so skip re-validation
+        return VehicleData.model_construct(
+            id=vehicle_doc["_id"],
+            plate_number=vehicle_doc["plate_number"],
+            brand=vehicle_doc["brand"],
+            model=vehicle_doc["model"],
+            year=vehicle_doc["year"],
+            vehicle_class=vehicle_doc["vehicle_class"],
+            price_per_day=vehicle_doc["price_per_day"],
+            mileage=vehicle_doc["mileage"],
+            branch_id=vehicle_doc["branch_id"],
+            status=vehicle_doc["status"],
+            created_at=to_iso_string(vehicle_doc["created_at"]),
+            updated_at=to_iso_string(vehicle_doc["updated_at"]),
+        )
+
+    @staticmethod
+    def _build_query_filters(filters: VehicleFilterRequest) -> Mapping[str, Any]:
+        """
+        Translate vehicle filter criteria into a MongoDB query.
+
+        Args:
+            filters (VehicleFilterRequest): Filter criteria.
+
+        Returns:
+            Mapping[str, Any]: Read-only MongoDB query filters (shared between
+                calls with the same criteria).
+        """
+        return _query_filters_for(
+            filters.vehicle_class,
+            filters.status,
+            filters.branch_id,
+            filters.min_price,
+            filters.max_price,
+        )
+
     @staticmethod
     async def list_vehicles(filters: VehicleFilterRequest) -> VehicleListData:
         """
         List vehicles with optional filters.
 
+        Queries are served by the vcls_status_branch_price index
+        (vehicle_class, status, branch_id, created_at, price_per_day), which
+        follows the equality/sort/range order of the filters built by
+        _build_query_filters. Keep the two in step when adding filters.
+
+        When skip or limit is set only that page is returned, while
+        total_count still covers every matching vehicle.
+
         Args:
-            filters (VehicleFilterRequest): Filter criteria.
+            filters (VehicleFilterRequest): Filter criteria and paging.
 
         Returns:
             VehicleListData: List of vehicles and total count.
         """
         # Build MongoDB query filters
-        query_filters: Dict[str, Any] = {}
-
-        if filters.vehicle_class is not None:
-            query_filters["vehicle_class"] = filters.vehicle_class
-
-        if filters.status is not None:
-            query_filters["status"] = filters.status.value
-
-        if filters.branch_id is not None:
-            query_filters["branch_id"] = filters.branch_id
-
-        # Price range filter
-        if filters.min_price is not None or filters.max_price is not None:
-            price_filter = {}
-            if filters.min_price is not None:
-                price_filter["$gte"] = filters.min_price
-            if filters.max_price is not None:
-                price_filter["$lte"] = filters.max_price
-            query_filters["price_per_day"] = price_filter
-
-        # Query database
-        vehicle_docs = await db_manager.find_vehicles(query_filters)
-
-        # Convert to response models
-        vehicles = [
-            VehicleData(
-                id=doc["_id"],
-                plate_number=doc["plate_number"],
-                brand=doc["brand"],
-                model=doc["model"],
-                year=doc["year"],
-                vehicle_class=doc["vehicle_class"],
-                price_per_day=doc["price_per_day"],
-                mileage=doc["mileage"],
-                branch_id=doc["branch_id"],
-                status=doc["status"],
-                created_at=doc["created_at"],
-                updated_at=doc["updated_at"],
+        query_filters = VehicleService._build_query_filters(filters)
+
+        if filters.skip or filters.limit is not None:
+            # Paged: the server returns the page and the total count together
+            vehicle_docs, total_count = await db_manager.find_vehicles_page(
+                query_filters,
+                projection=_VEHICLE_PROJECTION,
+                skip=filters.skip,
+                limit=filters.limit,
             )
-            for doc in vehicle_docs
-        ]
+            vehicles = [
+                VehicleService._doc_to_vehicle_data(doc) for doc in vehicle_docs
+            ]
+        else:
+            # Convert rows as the cursor delivers them instead of loading every
+            # raw document first
+            vehicles = [
+                VehicleService._doc_to_vehicle_data(doc)
+                async for doc in db_manager.stream_vehicles(
+                    query_filters, projection=_VEHICLE_PROJECTION
+                )
+            ]
+            total_count = len(vehicles)
+
+        logger.info(
+            "Retrieved %s of %s vehicles with filters: %s",
+            len(vehicles),
+            total_count,
+            query_filters,
+        )
 
-        logger.info(f"Retrieved {len(vehicles)} vehicles with filters: {query_filters}")
+        # Rows were built from trusted documents, so skip walking the list again
+        return VehicleListData.model_construct(
+            vehicles=vehicles, total_count=total_count
+        )
+
+    @staticmethod
+    async def list_vehicles_json(filters: VehicleFilterRequest) -> Tuple[int, bytes]:
+        """
+        List vehicles as a pre-encoded JSON payload, memoized per filter set.
+
+        Cached entries are keyed on the vehicles collection version, so any
+        write through the database manager makes older entries unreachable.
+
+        Args:
+            filters (VehicleFilterRequest): Filter criteria.
+
+        Returns:
+            Tuple[int, bytes]: Total count and JSON-encoded VehicleListData.
+        """
+        cache_key = (
+            tuple(filters.model_dump().items()),
+            db_manager.collection_version("vehicles"),
+        )
+
+        cached = _list_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+        vehicle_list = await VehicleService.list_vehicles(filters)
+        cached = (vehicle_list.total_count, to_json(vehicle_list))
+        _list_cache.set(cache_key, cached)
+
+        return cached
+
+    @staticmethod
+    async def stream_vehicles(filters: VehicleFilterRequest) -> AsyncIterator[bytes]:
+        """
+        Stream vehicles as newline-delimited JSON.
+
+        Documents are serialized straight from the database cursor without
+        building VehicleData models, so memory stays constant regardless of
+        the result size.
+
+        Args:
+            filters (VehicleFilterRequest): Filter criteria.
+
+        Yields:
+            bytes: One JSON-encoded vehicle per line.
+        """
+        query_filters = VehicleService._build_query_filters(filters)
 
-        return VehicleListData(vehicles=vehicles, total_count=len(vehicles))
+        async for doc in db_manager.stream_vehicles(query_filters):
+            doc["id"] = doc.pop("_id")
+            yield orjson.dumps(doc, default=str) + b"\n"
 
 
 # Singleton instance
@@ -34,6 +34,9 @@ Here is a list of the available fixtures:
     - get_standard_insurance_tier: Standard insurance coverage including collision.
     - get_premium_insurance_tier: Premium insurance coverage with extended protection.
 
+- Indirect parametrization (resolve fixtures by name from request.param):
+    - get_named_vehicle, get_named_insurance_tier, get_named_addons
+
 - Payments:
     - get_credit_card_payment_creator: Returns a preconfigured CreditCardPaymentCreator.
     - get_paypal_payment_creator: Returns a preconfigured PaypalPaymentCreator.
@@ -43,9 +46,19 @@ Here is a list of the available fixtures:
     - get_customer_notification_subscriber: Returns a CustomerSubscriber instance.
     - get_agent_notification_subscriber: Returns an AgentSubscriber instance.
 
+- Rentals:
+    - get_paid_reservation: Returns an approved, paid economy car Reservation.
+    - get_picked_up_rental: Returns (reservation, rental) right after pickup.
+
 - Clock
     - get_pickup_and_return_dates: Returns a tuple of pickup and return dates for testing.
 
+Vehicle classes, add-ons, insurance tiers, payment creators and the
+(stateless) notification subscribers are never modified by tests, so they
+are built once per session. Everything else is
+rebuilt per test: branches collect employees as agents and managers are
+created, and vehicles, users and reservations change state during tests.
+
 Author: Peyman Khodabandehlouei
 Date: 01-12-2025
 """
@@ -68,6 +81,80 @@ from domain.notification import (
 
 from schemas.domain import Gender, EmploymentType, VehicleStatus
 
+# Start time of every fake_clock (Jan 10, 2027, 9 AM)
+FAKE_NOW = datetime(2027, 1, 10, 9, 0, 0)
+
+# Vehicle class properties, keyed by class
+VEHICLE_CLASS_SPECS = {
+    "economy": dict(
+        name="Economy",
+        description="Small, fuel-efficient vehicles for city driving.",
+        base_daily_rate=30.0,
+        features=["Air conditioning", "Manual transmission"],
+    ),
+    "compact": dict(
+        name="Compact",
+        description="Compact cars with more space and comfort than economy class.",
+        base_daily_rate=45.0,
+        features=["Air conditioning", "Automatic transmission"],
+    ),
+    "suv": dict(
+        name="SUV",
+        description="Larger vehicles suitable for families and long trips.",
+        base_daily_rate=70.0,
+        features=["Automatic transmission", "All-wheel drive"],
+    ),
+}
+
+# Sample vehicle properties per class; price per day is the class base daily
+# rate plus price_markup
+VEHICLE_SPECS = {
+    "economy": dict(
+        brand="Toyota",
+        model="Yaris",
+        color="White",
+        licence_plate="ECN-001",
+        fuel_level=0.8,
+        last_service_odometer=10_000,
+        odometer=12_500,
+        price_markup=5,
+    ),
+    "compact": dict(
+        brand="Volkswagen",
+        model="Golf",
+        color="Gray",
+        licence_plate="CMP-001",
+        fuel_level=0.7,
+        last_service_odometer=20_000,
+        odometer=22_000,
+        price_markup=10,
+    ),
+    "suv": dict(
+        brand="Toyota",
+        model="RAV4",
+        color="Black",
+        licence_plate="SUV-001",
+        fuel_level=0.9,
+        last_service_odometer=30_000,
+        odometer=33_000,
+        price_markup=20,
+    ),
+}
+
+
+def make_vehicle(kind: str, vehicle_class: VehicleClass, branch: Branch) -> Vehicle:
+    """Build an available Vehicle from VEHICLE_SPECS[kind]"""
+    spec = dict(VEHICLE_SPECS[kind])
+    price_markup = spec.pop("price_markup")
+    return Vehicle(
+        vehicle_class=vehicle_class,
+        current_branch=branch,
+        status=VehicleStatus.AVAILABLE,
+        price_per_day=vehicle_class.base_daily_rate + price_markup,
+        maintenance_records=[],
+        **spec,
+    )
+
 
 @pytest.fixture
 def get_main_branch() -> Branch:
@@ -175,173 +262,68 @@ def get_active_manager(get_main_branch) -> Manager:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_economy_vehicle_class() -> VehicleClass:
-    """
-    Returns a VehicleClass instance with the following properties:
-        1. Name: Economy
-        2. Description: Small, fuel-efficient vehicles for city driving.
-        3. Base daily rate: 30.0
-        4. Features: ["Air conditioning", "Manual transmission"]
-    """
-    return VehicleClass(
-        name="Economy",
-        description="Small, fuel-efficient vehicles for city driving.",
-        base_daily_rate=30.0,
-        features=[
-            "Air conditioning",
-            "Manual transmission",
-        ],
-    )
+    """Returns the Economy VehicleClass (see VEHICLE_CLASS_SPECS)"""
+    return VehicleClass(**VEHICLE_CLASS_SPECS["economy"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_compact_vehicle_class() -> VehicleClass:
-    """
-    Returns a VehicleClass instance with the following properties:
-        1. Name: Compact
-        2. Description: Compact cars with more space and comfort than economy class.
-        3. Base daily rate: 45.0
-        4. Features: ["Air conditioning", "Automatic transmission"]
-    """
-    return VehicleClass(
-        name="Compact",
-        description="Compact cars with more space and comfort than economy class.",
-        base_daily_rate=45.0,
-        features=[
-            "Air conditioning",
-            "Automatic transmission",
-        ],
-    )
+    """Returns the Compact VehicleClass (see VEHICLE_CLASS_SPECS)"""
+    return VehicleClass(**VEHICLE_CLASS_SPECS["compact"])
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_suv_vehicle_class() -> VehicleClass:
-    """
-    Returns a VehicleClass instance with the following properties:
-        1. Name: SUV
-        2. Description: Larger vehicles suitable for families and long trips.
-        3. Base daily rate: 70.0
-        4. Features: ["Automatic transmission", "All-wheel drive"]
-    """
-    return VehicleClass(
-        name="SUV",
-        description="Larger vehicles suitable for families and long trips.",
-        base_daily_rate=70.0,
-        features=[
-            "Automatic transmission",
-            "All-wheel drive",
-        ],
-    )
+    """Returns the SUV VehicleClass (see VEHICLE_CLASS_SPECS)"""
+    return VehicleClass(**VEHICLE_CLASS_SPECS["suv"])
 
 
 @pytest.fixture
 def get_economy_vehicle(get_economy_vehicle_class, get_main_branch) -> Vehicle:
-    """
-    Returns an Economy class Vehicle instance (Toyota Yaris) with the following properties:
-        1. Vehicle class: Economy
-        2. Current branch: Main branch
-        3. Status: AVAILABLE
-        4. Brand: Toyota
-        5. Model: Yaris
-        6. Color: White
-        7. Licence plate: ECN-001
-        8. Fuel level: 0.8
-        9. Last service odometer: 10_000
-        10. Odometer: 12_500
-        11. Price per day: get_economy_vehicle_class.base_daily_rate + 5
-        12. Maintenance records: []
-    """
-    return Vehicle(
-        vehicle_class=get_economy_vehicle_class,
-        current_branch=get_main_branch,
-        status=VehicleStatus.AVAILABLE,
-        brand="Toyota",
-        model="Yaris",
-        color="White",
-        licence_plate="ECN-001",
-        fuel_level=0.8,
-        last_service_odometer=10_000,
-        odometer=12_500,
-        price_per_day=get_economy_vehicle_class.base_daily_rate + 5,
-        maintenance_records=[],
-    )
+    """Returns an available Economy Toyota Yaris (see VEHICLE_SPECS)"""
+    return make_vehicle("economy", get_economy_vehicle_class, get_main_branch)
 
 
 @pytest.fixture
 def get_compact_vehicle(get_compact_vehicle_class, get_main_branch) -> Vehicle:
-    """
-    Returns a Compact class Vehicle instance (Volkswagen Golf) with the following properties:
-        1. Vehicle class: Compact
-        2. Current branch: Main branch
-        3. Status: AVAILABLE
-        4. Brand: Volkswagen
-        5. Model: Golf
-        6. Color: Gray
-        7. Licence plate: CMP-001
-        8. Fuel level: 0.7
-        9. Last service odometer: 20_000
-        10. Odometer: 22_000
-        11. Price per day: get_compact_vehicle_class.base_daily_rate + 10
-        12. Maintenance records: []
-    """
-    return Vehicle(
-        vehicle_class=get_compact_vehicle_class,
-        current_branch=get_main_branch,
-        status=VehicleStatus.AVAILABLE,
-        brand="Volkswagen",
-        model="Golf",
-        color="Gray",
-        licence_plate="CMP-001",
-        fuel_level=0.7,
-        last_service_odometer=20_000,
-        odometer=22_000,
-        price_per_day=get_compact_vehicle_class.base_daily_rate + 10,
-        maintenance_records=[],
-    )
+    """Returns an available Compact Volkswagen Golf (see VEHICLE_SPECS)"""
+    return make_vehicle("compact", get_compact_vehicle_class, get_main_branch)
 
 
 @pytest.fixture
 def get_suv_vehicle(get_suv_vehicle_class, get_main_branch) -> Vehicle:
-    """
-    Returns an SUV class Vehicle instance (Toyota RAV4) with the following properties:
-        1. Vehicle class: SUV
-        2. Current branch: Main branch
-        3. Status: AVAILABLE
-        4. Brand: Toyota
-        5. Model: RAV4
-        6. Color: Black
-        7. Licence plate: SUV-001
-        8. Fuel level: 0.9
-        9. Last service odometer: 30_000
-        10. Odometer: 33_000
-        11. Price per day: get_suv_vehicle_class.base_daily_rate + 20
-        12. Maintenance records: []
-    """
-    return Vehicle(
-        vehicle_class=get_suv_vehicle_class,
-        current_branch=get_main_branch,
-        status=VehicleStatus.AVAILABLE,
-        brand="Toyota",
-        model="RAV4",
-        color="Black",
-        licence_plate="SUV-001",
-        fuel_level=0.9,
-        last_service_odometer=30_000,
-        odometer=33_000,
-        price_per_day=get_suv_vehicle_class.base_daily_rate + 20,
-        maintenance_records=[],
-    )
+    """Returns an available SUV Toyota RAV4 (see VEHICLE_SPECS)"""
+    return make_vehicle("suv", get_suv_vehicle_class, get_main_branch)
+
+
+@pytest.fixture
+def get_named_vehicle(request) -> Vehicle:
+    """Returns the vehicle fixture named by an indirect parametrize value"""
+    return request.getfixturevalue(request.param)
 
 
 @pytest.fixture
+def get_named_insurance_tier(request) -> InsuranceTier:
+    """Returns the insurance tier fixture named by an indirect parametrize value"""
+    return request.getfixturevalue(request.param)
+
+
+@pytest.fixture
+def get_named_addons(request) -> list[AddOn]:
+    """Returns the add-on fixtures named by an indirect parametrize list"""
+    return [request.getfixturevalue(name) for name in request.param]
+
+
+@pytest.fixture(scope="session")
 def get_credit_card_payment_creator() -> CreditCardPaymentCreator:
     return CreditCardPaymentCreator(
         card_number="1234 1234 1234 1234", cvv="123", expiry="12/30"
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_paypal_payment_creator() -> PaypalPaymentCreator:
     return PaypalPaymentCreator(
         email="itspeey@gmail.com", auth_token="ABCDEFG123456789"
@@ -353,17 +335,17 @@ def get_notification_manager() -> ConcreteNotificationManager:
     return ConcreteNotificationManager()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_customer_notification_subscriber() -> CustomerSubscriber:
     return CustomerSubscriber()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_agent_notification_subscriber() -> AgentSubscriber:
     return AgentSubscriber()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_gps_addon() -> AddOn:
     """
     Returns an AddOn instance for GPS navigation with the following properties:
@@ -378,7 +360,7 @@ def get_gps_addon() -> AddOn:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_child_seat_addon() -> AddOn:
     """
     Returns an AddOn instance for Child Seat with the following properties:
@@ -393,7 +375,7 @@ def get_child_seat_addon() -> AddOn:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_basic_insurance_tier() -> InsuranceTier:
     """
     Returns an InsuranceTier instance for Basic coverage with the following properties:
@@ -408,7 +390,7 @@ def get_basic_insurance_tier() -> InsuranceTier:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_standard_insurance_tier() -> InsuranceTier:
     """
     Returns an InsuranceTier instance for Standard coverage with the following properties:
@@ -423,7 +405,7 @@ def get_standard_insurance_tier() -> InsuranceTier:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def get_premium_insurance_tier() -> InsuranceTier:
     """
     Returns an InsuranceTier instance for Premium coverage with the following properties:
@@ -519,15 +501,78 @@ def get_rental(
     )
 
 
+@pytest.fixture
+def get_paid_reservation(
+    get_customer,
+    get_main_branch,
+    get_active_agent,
+    get_economy_vehicle,
+    get_basic_insurance_tier,
+    get_pickup_and_return_dates,
+    fake_clock,
+):
+    """
+    Returns an economy car Reservation that is approved and paid:
+        - Created by get_customer (basic insurance, main branch both ways)
+        - Approved by get_active_agent
+        - Paid by credit card
+    """
+    pickup_date, return_date = get_pickup_and_return_dates
+
+    reservation = get_customer.create_reservation(
+        vehicle=get_economy_vehicle,
+        insurance_tier=get_basic_insurance_tier,
+        pickup_branch=get_main_branch,
+        return_branch=get_main_branch,
+        pickup_date=pickup_date,
+        return_date=return_date,
+        clock=fake_clock,
+    )
+    get_active_agent.approve_reservation(reservation)
+    get_customer.make_creditcard_payment(
+        reservation, "1234123412341234", "123", "12/30"
+    )
+
+    return reservation
+
+
+@pytest.fixture
+def get_picked_up_rental(get_customer, get_paid_reservation, fake_clock):
+    """
+    Returns a tuple of (reservation, rental) after get_customer picked up the
+    get_paid_reservation vehicle:
+        - Pickup token: test-pickup-token
+        - Pickup readings: odometer=12500, fuel=0.8
+    """
+    rental = get_customer.pickup_vehicle(
+        reservation_id=get_paid_reservation.id,
+        pickup_token="test-pickup-token",
+        odometer=12500.0,
+        fuel_level=0.8,
+        clock=fake_clock,
+    )
+    return get_paid_reservation, rental
+
+
 @pytest.fixture
 def fake_clock() -> FakeClock:
     """Returns a fake clock set to a known time"""
-    return FakeClock(datetime(2027, 1, 10, 9, 0, 0))  # Jan 10, 2026, 9 AM
+    return FakeClock(FAKE_NOW)
 
 
-@pytest.fixture
-def get_pickup_and_return_dates(fake_clock) -> tuple[date, date]:
-    """Returns pickup and return dates using our fake clock"""
-    pickup_date = fake_clock.today() + timedelta(days=1)
-    return_date = pickup_date + timedelta(days=3)
+@pytest.fixture(scope="session")
+def get_pickup_and_return_dates(request) -> tuple[date, date]:
+    """
+    Returns pickup and return dates relative to the fake clock's start time.
+
+    The dates depend only on FAKE_NOW, not on a test's fake_clock (which
+    tests advance), so they are computed once per session.
+
+    The rental lasts 3 days by default; tests needing another length pass it
+    indirectly:
+        @pytest.mark.parametrize("get_pickup_and_return_dates", [7], indirect=True)
+    """
+    interval_days = getattr(request, "param", 3)
+    pickup_date = FAKE_NOW.date() + timedelta(days=1)
+    return_date = pickup_date + timedelta(days=interval_days)
     return pickup_date, return_date
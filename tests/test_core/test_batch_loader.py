@@ -0,0 +1,118 @@
+"""
+Test BatchLoader lookup coalescing.
+
+This module tests that by-ID lookups made in the same event loop tick are
+sent together:
+    1. Repeated IDs are queried once and share one result.
+    2. A full batch is dispatched without waiting for the next tick.
+    3. A failed query raises in every waiting caller.
+    4. Lookups in a later tick read fresh data.
+
+The collection is an in-memory stand-in that records each $in query.
+
+Author: Peyman Khodabandehlouei
+Date: 16-10-2026
+"""
+
+import asyncio
+
+from core.batch_loader import BatchLoader
+
+# Fail fast instead of hanging when a batch is never dispatched
+TEST_TIMEOUT_SECONDS = 1.0
+
+
+def run_with_timeout(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, TEST_TIMEOUT_SECONDS))
+
+
+class RecordingCollection:
+    """Collection stand-in that records the IDs of every $in query"""
+
+    def __init__(self, documents, error=None):
+        self.documents = documents
+        self.queries = []
+        self.error = error
+
+    def find(self, query):
+        document_ids = query["_id"]["$in"]
+        self.queries.append(document_ids)
+        return self._cursor(document_ids)
+
+    async def _cursor(self, document_ids):
+        if self.error is not None:
+            raise self.error
+        for document_id in document_ids:
+            if document_id in self.documents:
+                yield self.documents[document_id]
+
+
+def make_collection(*document_ids, error=None) -> RecordingCollection:
+    documents = {doc_id: {"_id": doc_id, "name": doc_id} for doc_id in document_ids}
+    return RecordingCollection(documents, error=error)
+
+
+def test_repeated_ids_are_queried_once():
+    collection = make_collection("a", "b")
+
+    async def run():
+        loader = BatchLoader(lambda: collection)
+        return await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("a"), loader.load("c")
+        )
+
+    first_a, b, second_a, missing = run_with_timeout(run())
+
+    assert collection.queries == [["a", "b", "c"]]
+    assert first_a is second_a
+    assert b["_id"] == "b"
+    assert missing is None
+
+
+def test_full_batch_is_dispatched_immediately():
+    collection = make_collection("a", "b", "c")
+
+    async def run():
+        loader = BatchLoader(lambda: collection, max_batch_size=2)
+        return await asyncio.gather(
+            loader.load("a"), loader.load("b"), loader.load("c")
+        )
+
+    documents = run_with_timeout(run())
+
+    assert [document["_id"] for document in documents] == ["a", "b", "c"]
+    assert collection.queries == [["a", "b"], ["c"]]
+
+
+def test_failed_query_raises_in_every_caller():
+    collection = make_collection("a", "b", error=RuntimeError("connection lost"))
+
+    async def run():
+        loader = BatchLoader(lambda: collection)
+        return await asyncio.gather(
+            loader.load("a"),
+            loader.load("b"),
+            loader.load("a"),
+            return_exceptions=True,
+        )
+
+    results = run_with_timeout(run())
+
+    assert len(collection.queries) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_later_lookups_are_not_cached():
+    collection = make_collection("a")
+
+    async def run():
+        loader = BatchLoader(lambda: collection)
+        first = await loader.load("a")
+        collection.documents["a"] = {"_id": "a", "name": "renamed"}
+        second = await loader.load("a")
+        return first, second
+
+    first, second = run_with_timeout(run())
+
+    assert collection.queries == [["a"], ["a"]]
+    assert (first["name"], second["name"]) == ("a", "renamed")
@@ -0,0 +1,131 @@
+"""
+Test InsertBatcher write coalescing.
+
+This module tests that concurrent inserts are written together:
+    1. A batch is flushed as soon as it reaches max_batch_size.
+    2. A partial batch is flushed once max_delay_ms has passed.
+    3. A failed insert_many raises in every waiting caller.
+    4. Per-document write errors reach only the caller that sent that document.
+
+The collection is an in-memory stand-in that records each insert_many call.
+
+Author: Peyman Khodabandehlouei
+Date: 16-10-2026
+"""
+
+import asyncio
+
+import pytest
+from pymongo.errors import BulkWriteError, DuplicateKeyError
+
+from core.insert_batcher import InsertBatcher
+
+# Long enough that only the size limit can trigger a flush in a test
+NEVER_MS = 60_000
+
+# Fail fast instead of hanging when a batch is never flushed
+TEST_TIMEOUT_SECONDS = 1.0
+
+
+def run_with_timeout(coroutine):
+    return asyncio.run(asyncio.wait_for(coroutine, TEST_TIMEOUT_SECONDS))
+
+
+class RecordingCollection:
+    """Collection stand-in that records insert_many batches"""
+
+    def __init__(self, error=None):
+        self.batches = []
+        self.error = error
+
+    async def insert_many(self, documents, ordered=True):
+        self.batches.append([document["_id"] for document in documents])
+        if self.error is not None:
+            raise self.error
+
+
+def make_batcher(collection, **options) -> InsertBatcher:
+    return InsertBatcher(lambda: collection, **options)
+
+
+def test_flushes_when_batch_is_full():
+    collection = RecordingCollection()
+
+    async def run():
+        batcher = make_batcher(collection, max_batch_size=3, max_delay_ms=NEVER_MS)
+        return await asyncio.gather(
+            *(batcher.insert({"_id": f"doc-{index}"}) for index in range(3))
+        )
+
+    inserted_ids = run_with_timeout(run())
+
+    assert inserted_ids == ["doc-0", "doc-1", "doc-2"]
+    assert collection.batches == [["doc-0", "doc-1", "doc-2"]]
+
+
+def test_flushes_partial_batch_after_delay():
+    collection = RecordingCollection()
+
+    async def run():
+        batcher = make_batcher(collection, max_batch_size=50, max_delay_ms=1)
+        return await asyncio.gather(
+            batcher.insert({"_id": "doc-0"}), batcher.insert({"_id": "doc-1"})
+        )
+
+    inserted_ids = run_with_timeout(run())
+
+    assert inserted_ids == ["doc-0", "doc-1"]
+    assert collection.batches == [["doc-0", "doc-1"]]
+
+
+def test_failed_batch_raises_in_every_caller():
+    collection = RecordingCollection(error=RuntimeError("connection lost"))
+
+    async def run():
+        batcher = make_batcher(collection, max_batch_size=2, max_delay_ms=NEVER_MS)
+        return await asyncio.gather(
+            batcher.insert({"_id": "doc-0"}),
+            batcher.insert({"_id": "doc-1"}),
+            return_exceptions=True,
+        )
+
+    results = run_with_timeout(run())
+
+    assert len(collection.batches) == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+def test_write_error_reaches_only_its_caller():
+    duplicate = {"index": 1, "code": 11000, "errmsg": "E11000 duplicate key"}
+    collection = RecordingCollection(error=BulkWriteError({"writeErrors": [duplicate]}))
+
+    async def run():
+        batcher = make_batcher(collection, max_batch_size=3, max_delay_ms=NEVER_MS)
+        return await asyncio.gather(
+            *(batcher.insert({"_id": f"doc-{index}"}) for index in range(3)),
+            return_exceptions=True,
+        )
+
+    first, second, third = run_with_timeout(run())
+
+    assert (first, third) == ("doc-0", "doc-2")
+    assert isinstance(second, DuplicateKeyError)
+
+
+@pytest.mark.parametrize("batch_size", [1, 4])
+def test_every_insert_is_written_once(batch_size):
+    collection = RecordingCollection()
+
+    async def run():
+        batcher = make_batcher(
+            collection, max_batch_size=batch_size, max_delay_ms=NEVER_MS
+        )
+        return await asyncio.gather(
+            *(batcher.insert({"_id": f"doc-{index}"}) for index in range(4))
+        )
+
+    run_with_timeout(run())
+
+    written = [doc_id for batch in collection.batches for doc_id in batch]
+    assert written == [f"doc-{index}" for index in range(4)]
+    assert all(len(batch) <= batch_size for batch in collection.batches)
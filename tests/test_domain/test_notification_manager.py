@@ -9,6 +9,20 @@ Author: Peyman Khodabandehlouei
 Date: 04-12-2025
 """
 
+import pytest
+
+from domain.notification import Subscriber
+
+
+class RecordingSubscriber(Subscriber):
+    """Subscriber stub that records the arguments of every update call"""
+
+    def __init__(self):
+        self.calls = []
+
+    def update(self, subject, events=None):
+        self.calls.append((subject, events))
+
 
 def test_attach_and_detach_notification_subscribers(
     get_notification_manager,
@@ -30,12 +44,10 @@ def test_attach_and_detach_notification_subscribers(
     assert get_customer_notification_subscriber in get_notification_manager.subscribers
 
 
-def test_notify_calls_update_on_all_subscribers_with_mocker(
-    get_notification_manager, mocker
-):
-    # Create mock subscribers
-    sub1 = mocker.MagicMock()
-    sub2 = mocker.MagicMock()
+def test_notify_calls_update_on_all_subscribers(get_notification_manager):
+    # Create recording subscribers
+    sub1 = RecordingSubscriber()
+    sub2 = RecordingSubscriber()
 
     # Attach notification subscriber to notification manager
     get_notification_manager.attach(sub1)
@@ -45,23 +57,65 @@ def test_notify_calls_update_on_all_subscribers_with_mocker(
     get_notification_manager.notify()
 
     # each subscriber's update should be called exactly once
-    sub1.update.assert_called_once_with(get_notification_manager)
-    sub2.update.assert_called_once_with(get_notification_manager)
-
+    assert sub1.calls == [(get_notification_manager, None)]
+    assert sub2.calls == [(get_notification_manager, None)]
 
-def test_customer_subscriber_update(
-    get_notification_manager,
-    get_customer_notification_subscriber,
-):
-
-    result = get_customer_notification_subscriber.update(get_notification_manager)
 
-    assert result == "Notification sent to the customer"
+def test_flush_sends_buffered_events_in_one_update(get_notification_manager):
+    # Create recording subscribers
+    sub1 = RecordingSubscriber()
+    sub2 = RecordingSubscriber()
 
+    # Attach notification subscriber to notification manager
+    get_notification_manager.attach(sub1)
+    get_notification_manager.attach(sub2)
 
-def test_agent_subscriber_update(
-    get_notification_manager, get_agent_notification_subscriber
+    # Buffer several events and flush them together
+    for event in ("reserved", "approved", "paid"):
+        get_notification_manager.enqueue(event)
+    get_notification_manager.flush()
+
+    # each subscriber should get a single update with the whole batch
+    events = ("reserved", "approved", "paid")
+    assert sub1.calls == [(get_notification_manager, events)]
+    assert sub2.calls == [(get_notification_manager, events)]
+
+    # The buffer is cleared, so a second flush notifies nobody
+    get_notification_manager.flush()
+    assert len(sub1.calls) == 1
+
+
+def test_buffered_block_dispatches_once(get_notification_manager):
+    # Attach a recording subscriber
+    sub = RecordingSubscriber()
+    get_notification_manager.attach(sub)
+
+    # Notify several times inside a buffered block
+    with get_notification_manager.buffered():
+        get_notification_manager.notify()
+        get_notification_manager.enqueue("reserved")
+        get_notification_manager.notify()
+        assert sub.calls == []
+
+    # One notify and one flush are dispatched when the block exits
+    assert sub.calls == [
+        (get_notification_manager, None),
+        (get_notification_manager, ("reserved",)),
+    ]
+
+
+@pytest.mark.parametrize(
+    "subscriber_fixture, expected_message",
+    [
+        ("get_customer_notification_subscriber", "Notification sent to the customer"),
+        ("get_agent_notification_subscriber", "Notification sent to the agent"),
+    ],
+)
+def test_subscriber_update(
+    request, get_notification_manager, subscriber_fixture, expected_message
 ):
-    result = get_agent_notification_subscriber.update(get_notification_manager)
+    subscriber = request.getfixturevalue(subscriber_fixture)
+
+    result = subscriber.update(get_notification_manager)
 
-    assert result == "Notification sent to the agent"
+    assert result == expected_message
@@ -171,46 +171,49 @@ def test_normal_pricing_strategy_calculations(
 
 
 @pytest.mark.parametrize(
-    "vehicle_fixture, insurance_fixture, addon_fixtures, rental_days, "
-    "reservations_before, discount_rate",
+    "get_named_vehicle, get_named_insurance_tier, get_named_addons, rental_days, "
+    "reservations_before, expected_total",
     [
-        ("get_economy_vehicle", "get_basic_insurance_tier", [], 1, 0, 0.15),
+        # First order: (35 vehicle + 5 insurance) * 1 day, 15% off
+        ("get_economy_vehicle", "get_basic_insurance_tier", [], 1, 0, 34.0),
+        # Normal: (55 vehicle + 18 insurance + 5 GPS) * 3 days, no discount
         (
             "get_compact_vehicle",
             "get_premium_insurance_tier",
             ["get_gps_addon"],
             3,
             1,
-            0.0,
+            234.0,
         ),
+        # Loyalty (5th order): (90 vehicle + 10 insurance + 2 * 5 GPS) * 7 days, 10% off
         (
             "get_suv_vehicle",
             "get_standard_insurance_tier",
             ["get_gps_addon", "get_gps_addon"],
             7,
             4,
-            0.10,
+            693.0,
         ),
     ],
+    indirect=["get_named_vehicle", "get_named_insurance_tier", "get_named_addons"],
 )
 def test_parametrized_pricing_strategies(
-    request,
     get_customer,
     get_main_branch,
-    vehicle_fixture,
-    insurance_fixture,
-    addon_fixtures,
+    get_named_vehicle,
+    get_named_insurance_tier,
+    get_named_addons,
     rental_days,
     reservations_before,
-    discount_rate,
+    expected_total,
 ):
     """
     Parametrized test that verifies first-order, normal, and loyalty
     pricing by varying how many reservations the customer already has.
     """
-    vehicle = request.getfixturevalue(vehicle_fixture)
-    insurance = request.getfixturevalue(insurance_fixture)
-    addons = [request.getfixturevalue(name) for name in addon_fixtures]
+    vehicle = get_named_vehicle
+    insurance = get_named_insurance_tier
+    addons = get_named_addons
 
     # Common pickup/return logic
     pickup_date = date.today() + timedelta(days=1)
@@ -241,12 +244,4 @@ def test_parametrized_pricing_strategies(
         return_date=return_date,
     )
 
-    # Manual expected price
-    vehicle_daily = vehicle.price_per_day
-    insurance_daily = insurance.price_per_day
-    addons_daily = sum(add_on.price_per_day for add_on in addons)
-
-    subtotal = (vehicle_daily + insurance_daily + addons_daily) * rental_days
-    expected_total = subtotal * (1 - discount_rate)
-
     assert reservation.total_price == pytest.approx(expected_total)
@@ -17,40 +17,11 @@ import pytest
 
 def test_return_within_grace_period_no_late_fee(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test that returning within grace period (1 hour) incurs no late fee"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    # Create and approve reservation
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    # Pickup
-    get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="token-1",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, _ = get_picked_up_rental
 
     # Advance to 50 minutes after due time (within grace period)
     fake_clock.advance(days=3, minutes=50)
@@ -68,40 +39,11 @@ def test_return_within_grace_period_no_late_fee(
 
 def test_return_2_hours_late_incurs_late_fee(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test that returning 1 hour after grace period incurs $10 late fee"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    # Create and approve reservation
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    # Pickup
-    get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="token-2",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, _ = get_picked_up_rental
 
     # Advance 3 days + 2 hours (1 hour past grace = 1 hour late)
     fake_clock.advance(days=3, hours=2)
@@ -119,38 +61,11 @@ def test_return_2_hours_late_incurs_late_fee(
 
 def test_mileage_overage_calculation(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test mileage overage: 3 days = 600km allowance, drive 700km = 100km over = $50"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="token-3",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, _ = get_picked_up_rental
 
     fake_clock.advance(days=3)
 
@@ -167,38 +82,11 @@ def test_mileage_overage_calculation(
 
 def test_fuel_refill_charge(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test fuel charge: pickup at 0.8, return at 0.5 = 0.3 difference = $15"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="token-4",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, _ = get_picked_up_rental
 
     fake_clock.advance(days=3)
 
@@ -211,43 +99,16 @@ def test_fuel_refill_charge(
 
     assert charges.fuel_refill_fee == pytest.approx(
         15.0
-    ), "0.3 fuel difference * $50 = $15"  # 👈 FIX
+    ), "0.3 fuel difference * $50 = $15"
 
 
 def test_manual_damage_charge(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test manual damage charge added by agent"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="token-5",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, _ = get_picked_up_rental
 
     fake_clock.advance(days=3)
 
@@ -264,44 +125,16 @@ def test_manual_damage_charge(
 
 def test_idempotent_pickup(
     get_customer,
-    get_main_branch,
-    get_active_agent,
-    get_economy_vehicle,
-    get_basic_insurance_tier,
-    get_pickup_and_return_dates,
+    get_picked_up_rental,
     fake_clock,
 ):
     """Test that duplicate pickup with same token returns existing rental"""
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    reservation = get_customer.create_reservation(
-        vehicle=get_economy_vehicle,
-        insurance_tier=get_basic_insurance_tier,
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-        clock=fake_clock,
-    )
-
-    get_active_agent.approve_reservation(reservation)
-    get_customer.make_creditcard_payment(
-        reservation, "1234123412341234", "123", "12/30"
-    )
-
-    # First pickup
-    rental1 = get_customer.pickup_vehicle(
-        reservation_id=reservation.id,
-        pickup_token="same-token",
-        odometer=12500.0,
-        fuel_level=0.8,
-        clock=fake_clock,
-    )
+    reservation, rental1 = get_picked_up_rental
 
     # Duplicate pickup with same token
     rental2 = get_customer.pickup_vehicle(
         reservation_id=reservation.id,
-        pickup_token="same-token",  # Same token
+        pickup_token=rental1.pickup_token,  # Same token
         odometer=12500.0,
         fuel_level=0.8,
         clock=fake_clock,
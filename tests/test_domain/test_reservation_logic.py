@@ -7,10 +7,8 @@ Here is a list of the available tests:
     2. Reserve a RESERVED vehicle.
     3. Reserve a PICKED_UP vehicle.
     4. Reserve a car with return date before pickup date.
-    5. Cancel a pending reservation.
-    6. Cancel an approved reservation.
-    7. Cancel a completed reservation.
-    9. Cancel a picked-up reservation.
+    5. Cancel a pending, approved, completed or picked-up reservation
+       (one parametrized test).
 
 Author: Peyman Khodabandehlouei
 Date: 02-12-2025
@@ -25,6 +23,11 @@ from core import (
     InvalidReservationStatusForCancellationError,
 )
 
+# Stored status values the assertions compare against
+_PENDING = ReservationStatus.PENDING.value
+_CANCELLED = ReservationStatus.CANCELLED.value
+_VEHICLE_RESERVED = VehicleStatus.RESERVED.value
+
 
 def test_create_reservation_when_vehicle_available_success(
     get_customer,
@@ -50,8 +53,8 @@ def test_create_reservation_when_vehicle_available_success(
     )
 
     assert len(get_customer.reservations) == 1
-    assert get_customer.reservations[0].status == ReservationStatus.PENDING.value
-    assert get_customer.reservations[0].vehicle.status == VehicleStatus.RESERVED.value
+    assert get_customer.reservations[0].status == _PENDING
+    assert get_customer.reservations[0].vehicle.status == _VEHICLE_RESERVED
 
 
 def test_create_reservation_when_vehicle_reserved_error(
@@ -136,113 +139,34 @@ def test_create_reservation_when_return_date_before_pickup_date_error(
         )
 
 
-def test_canceling_pending_reservation_success(
-    get_customer,
-    get_main_branch,
-    get_compact_vehicle,
-    get_gps_addon,
-    get_premium_insurance_tier,
-    get_pickup_and_return_dates,
-):
-    # Create date objects for pickup and return dates (Total 3 days)
-    # Get pickup and return dates
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    # Create reservation
-    get_customer.create_reservation(
-        vehicle=get_compact_vehicle,
-        insurance_tier=get_premium_insurance_tier,
-        add_ons=[get_gps_addon],
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-    )
-
-    # Cancel the reservation
-    reservation = get_customer.reservations[0]
-    get_customer.cancel_reservation(reservation.id)
-
-    assert reservation.status == ReservationStatus.CANCELLED.value
-
-
-def test_canceling_approved_reservation_success(
-    get_customer,
-    get_main_branch,
-    get_compact_vehicle,
-    get_gps_addon,
-    get_premium_insurance_tier,
-    get_pickup_and_return_dates,
-):
-    # Get pickup and return dates
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    # Create reservation
-    get_customer.create_reservation(
-        vehicle=get_compact_vehicle,
-        insurance_tier=get_premium_insurance_tier,
-        add_ons=[get_gps_addon],
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-    )
-
-    # Approve the reservation
-    reservation = get_customer.reservations[0]
-    reservation.status = ReservationStatus.APPROVED
-
-    # Cancel the reservation
-    get_customer.cancel_reservation(reservation.id)
-
-    assert reservation.status == ReservationStatus.CANCELLED.value
-
-
-def test_canceling_completed_reservation_error(
-    get_customer,
-    get_main_branch,
-    get_compact_vehicle,
-    get_gps_addon,
-    get_premium_insurance_tier,
-    get_pickup_and_return_dates,
-):
-    # Get pickup and return dates
-    pickup_date, return_date = get_pickup_and_return_dates
-
-    # Create reservation
-    get_customer.create_reservation(
-        vehicle=get_compact_vehicle,
-        insurance_tier=get_premium_insurance_tier,
-        add_ons=[get_gps_addon],
-        pickup_branch=get_main_branch,
-        return_branch=get_main_branch,
-        pickup_date=pickup_date,
-        return_date=return_date,
-    )
-
-    # Approve the reservation
-    reservation = get_customer.reservations[0]
-    reservation.status = ReservationStatus.COMPLETED
-
-    assert reservation.status == ReservationStatus.COMPLETED.value
-
-    # Cancel the reservation
-    with pytest.raises(InvalidReservationStatusForCancellationError):
-        get_customer.cancel_reservation(reservation.id)
-
-
-def test_canceling_pickedup_reservation_error(
+@pytest.mark.parametrize(
+    "start_status, expected_error",
+    [
+        (None, None),
+        (ReservationStatus.APPROVED, None),
+        (ReservationStatus.COMPLETED, InvalidReservationStatusForCancellationError),
+        (ReservationStatus.PICKED_UP, InvalidReservationStatusForCancellationError),
+    ],
+    ids=["pending", "approved", "completed", "picked_up"],
+)
+def test_canceling_reservation(
     get_customer,
     get_main_branch,
     get_compact_vehicle,
     get_gps_addon,
     get_premium_insurance_tier,
     get_pickup_and_return_dates,
+    start_status,
+    expected_error,
 ):
+    """
+    Pending and approved reservations can be cancelled; completed and
+    picked-up reservations cannot.
+    """
     # Get pickup and return dates
     pickup_date, return_date = get_pickup_and_return_dates
 
-    # Create reservation
+    # Create reservation (starts pending)
     get_customer.create_reservation(
         vehicle=get_compact_vehicle,
         insurance_tier=get_premium_insurance_tier,
@@ -253,12 +177,16 @@ def test_canceling_pickedup_reservation_error(
         return_date=return_date,
     )
 
-    # Approve the reservation
+    # Move the reservation to the status under test
     reservation = get_customer.reservations[0]
-    reservation.status = ReservationStatus.PICKED_UP
-
-    assert reservation.status == ReservationStatus.PICKED_UP.value
+    if start_status is not None:
+        reservation.status = start_status
+        assert reservation.status == start_status.value
 
     # Cancel the reservation
-    with pytest.raises(InvalidReservationStatusForCancellationError):
+    if expected_error is None:
         get_customer.cancel_reservation(reservation.id)
+        assert reservation.status == _CANCELLED
+    else:
+        with pytest.raises(expected_error):
+            get_customer.cancel_reservation(reservation.id)
@@ -0,0 +1,54 @@
+"""
+Test hand-assembled API response bodies.
+
+This module checks that encode_success_payload produces exactly the bytes
+SuccessResponseWithPayload serializes to, and that to_iso_string formats
+timestamps like pydantic, so pre-serialized responses keep the same shape
+as every other endpoint.
+
+Author: Peyman Khodabandehlouei
+Date: 16-10-2026
+"""
+
+import orjson
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from pydantic import TypeAdapter
+
+from core.clock_service import to_iso_string
+from schemas.api.common import SuccessResponseWithPayload, encode_success_payload
+
+
+def test_encode_success_payload_matches_model_json():
+    data = {"id": "reservation-1", "total_price": 252.0, "add_ons": []}
+
+    body = encode_success_payload(
+        orjson.dumps("Reservation retrieved successfully"), orjson.dumps(data)
+    )
+
+    # Rebuild the model with the same timestamp the payload carries
+    timestamp = datetime.fromisoformat(orjson.loads(body)["timestamp"])
+    expected = SuccessResponseWithPayload(
+        message="Reservation retrieved successfully",
+        data=data,
+        timestamp=timestamp,
+    ).model_dump_json()
+
+    assert body == expected.encode()
+    assert orjson.loads(body)["timestamp"].endswith("Z")
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        datetime(2026, 1, 5, 10, 30, tzinfo=timezone.utc),
+        datetime(2026, 1, 5, 10, 30, 0, 123456, tzinfo=timezone.utc),
+        datetime(2026, 1, 5, 10, 30, tzinfo=timezone(timedelta(hours=3))),
+        datetime(2026, 1, 5, 10, 30),
+        date(2026, 1, 5),
+    ],
+)
+def test_to_iso_string_matches_pydantic_json(value):
+    expected = TypeAdapter(type(value)).dump_python(value, mode="json")
+
+    assert to_iso_string(value) == expected
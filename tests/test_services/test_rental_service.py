@@ -0,0 +1,62 @@
+"""
+Test rental listing in the rental service.
+
+This module checks that a paged rental list reports the total number of
+matching rentals, not just the size of the returned page. The database
+manager is replaced with in-memory stand-ins, so no MongoDB is needed.
+
+Author: Peyman Khodabandehlouei
+Date: 16-10-2026
+"""
+
+import asyncio
+from datetime import datetime
+
+from core import db_manager
+from schemas.api.requests import RentalFilterRequest
+from services.rental_service import rental_service
+
+RENTAL_COUNT = 5
+
+
+def make_rental_doc(index: int) -> dict:
+    """Build a stored rental document with summary fields only"""
+    created_at = datetime(2026, 1, 1, 10, index)
+    return {
+        "_id": f"rental-{index}",
+        "status": "active",
+        "reservation_id": f"reservation-{index}",
+        "vehicle_id": "vehicle-1",
+        "customer_id": "customer-1",
+        "agent_id": "agent-1",
+        "pickup_token": f"token-{index}",
+        "pickup_readings": {
+            "odometer": 12500.0,
+            "fuel_level": 0.8,
+            "timestamp": created_at,
+        },
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+
+
+def test_list_rentals_page_reports_total_count(monkeypatch):
+    rental_docs = [make_rental_doc(index) for index in range(RENTAL_COUNT)]
+
+    async def stream_rentals(filters, projection=None, skip=0, limit=None):
+        for doc in rental_docs[skip : skip + limit if limit else None]:
+            yield doc
+
+    async def count_rentals(filters):
+        return len(rental_docs)
+
+    monkeypatch.setattr(db_manager, "_is_connected", True)
+    monkeypatch.setattr(db_manager, "stream_rentals", stream_rentals)
+    monkeypatch.setattr(db_manager, "count_rentals", count_rentals)
+
+    rental_list = asyncio.run(
+        rental_service.list_rentals(RentalFilterRequest(skip=1, limit=2))
+    )
+
+    assert [rental.id for rental in rental_list.rentals] == ["rental-1", "rental-2"]
+    assert rental_list.total_count == RENTAL_COUNT